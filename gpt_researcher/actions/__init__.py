@@ -1,4 +1,4 @@
-from .retriever import get_retriever, get_retrievers
+from .retriever import get_retriever, get_retriever_name, get_retrievers
 from .query_processing import plan_research_outline, get_search_results
 from .agent_creator import extract_json_with_regex, choose_agent
 from .web_scraping import scrape_urls
@@ -8,6 +8,7 @@ from .utils import stream_output
 
 __all__ = [
     "get_retriever",
+    "get_retriever_name",
     "get_retrievers",
     "get_search_results",
     "plan_research_outline",
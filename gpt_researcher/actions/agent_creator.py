@@ -39,6 +39,7 @@ async def choose_agent(
             ],
             temperature=0.15,
             llm_provider=cfg.smart_llm_provider,
+            cfg=cfg,
             llm_kwargs=cfg.llm_kwargs,
             cost_callback=cost_callback,
             **kwargs
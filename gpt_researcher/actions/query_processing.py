@@ -2,10 +2,15 @@ import json_repair
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
+from .retriever import get_retriever_name
+from ..retrievers.cache import retriever_settings
+from ..retrievers.utils import run_search, search_options
+from ..utils.rate_limiter import get_config_rate_limiter
 from ..prompts import PromptFamily
 from typing import Any, List, Dict
 from ..config import Config
 import logging
+from functools import partial
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,9 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
     Returns:
         A list of search results
     """
+    # Searches run over the research session's pooled HTTP client without blocking the loop
+    http_client = getattr(researcher, "http_client", None)
+
     # Check if this is an MCP retriever and pass the researcher instance
     if "mcpretriever" in retriever.__name__.lower():
         search_retriever = retriever(
@@ -31,8 +39,37 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
         )
     else:
         search_retriever = retriever(query, query_domains=query_domains)
-    
-    return search_retriever.search()
+        retriever_name = get_retriever_name(retriever)
+        cfg = getattr(researcher, "cfg", None)
+        search = partial(
+            run_search,
+            search_retriever,
+            http_client=http_client,
+            rate_limiter=get_config_rate_limiter(retriever_name, cfg),
+        )
+        # Planning reads the retriever's default number of results. The original query is
+        # searched again as a sub-query with the same options, so that search is served
+        # from the first results of this one in the search cache.
+        options = search_options(retriever) if cfg else {}
+        search_cache = getattr(researcher, "search_cache", None)
+        if search_cache is not None:
+            results = await search_cache.asearch(
+                retriever_name,
+                search,
+                query,
+                query_domains,
+                settings=retriever_settings(search_retriever),
+                **options,
+            )
+        else:
+            results = await search(**options)
+        # Planning only reads the snippets, so the page text and images stay out of the prompt
+        return [
+            {key: value for key, value in result.items() if key not in ("raw_content", "images")}
+            for result in results or []
+        ]
+
+    return await run_search(search_retriever, http_client=http_client)
 
 async def generate_sub_queries(
     query: str,
@@ -73,6 +110,7 @@ async def generate_sub_queries(
             model=cfg.strategic_llm_model,
             messages=[{"role": "user", "content": gen_queries_prompt}],
             llm_provider=cfg.strategic_llm_provider,
+            cfg=cfg,
             max_tokens=None,
             llm_kwargs=cfg.llm_kwargs,
             reasoning_effort=ReasoningEfforts.Medium.value,
@@ -88,6 +126,7 @@ async def generate_sub_queries(
                 messages=[{"role": "user", "content": gen_queries_prompt}],
                 max_tokens=cfg.strategic_token_limit,
                 llm_provider=cfg.strategic_llm_provider,
+                cfg=cfg,
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
                 **kwargs
@@ -96,12 +135,15 @@ async def generate_sub_queries(
         except Exception as e:
             logger.warning(f"Retrying with max_tokens={cfg.strategic_token_limit} failed.")
             logger.warning(f"Error with strategic LLM: {e}. Falling back to smart LLM.")
+            # Transient errors of the smart LLM fall back along the rest of the chain
             response = await create_chat_completion(
                 model=cfg.smart_llm_model,
                 messages=[{"role": "user", "content": gen_queries_prompt}],
                 temperature=cfg.temperature,
                 max_tokens=cfg.smart_token_limit,
                 llm_provider=cfg.smart_llm_provider,
+                cfg=cfg,
+                fallback=True,
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
                 **kwargs
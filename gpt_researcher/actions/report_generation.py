@@ -47,6 +47,7 @@ async def write_report_introduction(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            cfg=config,
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
@@ -99,6 +100,7 @@ async def write_conclusion(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            cfg=config,
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
@@ -144,6 +146,7 @@ async def summarize_url(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            cfg=config,
             stream=True,
             websocket=websocket,
             max_tokens=config.smart_token_limit,
@@ -193,6 +196,7 @@ async def generate_draft_section_titles(
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
+            cfg=config,
             stream=True,
             websocket=None,
             max_tokens=config.smart_token_limit,
@@ -262,6 +266,7 @@ async def generate_report(
             ],
             temperature=0.35,
             llm_provider=cfg.smart_llm_provider,
+            cfg=cfg,
             stream=True,
             websocket=websocket,
             max_tokens=cfg.smart_token_limit,
@@ -278,6 +283,7 @@ async def generate_report(
                 ],
                 temperature=0.35,
                 llm_provider=cfg.smart_llm_provider,
+                cfg=cfg,
                 stream=True,
                 websocket=websocket,
                 max_tokens=cfg.smart_token_limit,
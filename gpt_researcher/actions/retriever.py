@@ -70,6 +70,24 @@ def get_retriever(retriever: str):
             return None
 
 
+def get_retriever_name(retriever_class) -> str:
+    """
+    Gets the configuration name of a retriever class
+    Args:
+        retriever_class: Retriever class
+
+    Returns:
+        str: The name the retriever is configured by, e.g. "tavily"
+
+    """
+    from gpt_researcher.retrievers.utils import VALID_RETRIEVERS
+
+    for name in VALID_RETRIEVERS:
+        if get_retriever(name) is retriever_class:
+            return name
+    return retriever_class.__name__.lower()
+
+
 def get_retrievers(headers: dict[str, str], cfg):
     """
     Determine which retriever(s) to use based on headers, config, or default.
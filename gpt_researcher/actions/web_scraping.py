@@ -1,4 +1,5 @@
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 from colorama import Fore, Style
 
 from gpt_researcher.utils.workers import WorkerPool
@@ -10,13 +11,14 @@ logger = get_formatted_logger()
 
 
 async def scrape_urls(
-    urls, cfg: Config, worker_pool: WorkerPool
+    urls, cfg: Config, worker_pool: WorkerPool, resources: dict | None = None
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Scrapes the urls
     Args:
         urls: List of urls
         cfg: Config (optional)
+        resources: Session-wide resources shared by the scrapers (optional)
 
     Returns:
         tuple[list[dict[str, Any]], list[dict[str, Any]]]: tuple containing scraped content and images
@@ -31,7 +33,7 @@ async def scrape_urls(
     )
 
     try:
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool)
+        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool, resources=resources)
         scraped_data = await scraper.run()
         for item in scraped_data:
             if 'image_urls' in item:
@@ -42,6 +44,28 @@ async def scrape_urls(
     return scraped_data, images
 
 
+async def iter_scrape_urls(
+    urls, cfg: Config, worker_pool: WorkerPool, resources: dict | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Scrapes the urls, yielding each page as soon as it is scraped
+    Args:
+        urls: List of urls
+        cfg: Config
+        resources: Session-wide resources shared by the scrapers (optional)
+
+    Yields:
+        dict[str, Any]: scraped content of one page, in completion order
+    """
+    try:
+        scraper = Scraper(urls, cfg.user_agent, cfg.scraper, worker_pool=worker_pool, resources=resources)
+        async with aclosing(scraper.iter_run()) as pages:
+            async for item in pages:
+                yield item
+    except Exception as e:
+        print(f"{Fore.RED}Error in iter_scrape_urls: {e}{Style.RESET_ALL}")
+
+
 async def filter_urls(urls: list[str], config: Config) -> list[str]:
     """
     Filter URLs based on configuration settings.
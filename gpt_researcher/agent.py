@@ -8,6 +8,8 @@ from .utils.enum import ReportSource, ReportType, Tone
 from .llm_provider import GenericLLMProvider
 from .prompts import get_prompt_family
 from .vector_store import VectorStoreWrapper
+from .utils.http_client import AsyncHTTPClient
+from .retrievers.cache import get_search_cache
 
 # Research skills
 from .skills.researcher import ResearchConductor
@@ -151,10 +153,25 @@ class GPTResearcher:
             self._process_mcp_configs(mcp_configs)
         
         self.retrievers = get_retrievers(self.headers, self.cfg)
+        self.search_cache = get_search_cache(
+            self.cfg.search_cache_dir, self.cfg.search_cache_ttl, self.cfg.search_cache_ttls
+        )
         self.memory = Memory(
-            self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
+            self.cfg.embedding_provider,
+            self.cfg.embedding_model,
+            cache_dir=self.cfg.embedding_cache_dir,
+            cache_size=self.cfg.embedding_cache_size,
+            **self.cfg.embedding_kwargs
         )
         
+        # One connection pool for every HTTP fetch of this research session
+        self.http_client = AsyncHTTPClient(
+            user_agent=self.cfg.user_agent,
+            max_connections=self.cfg.scraper_max_connections,
+            max_connections_per_host=self.cfg.scraper_max_connections_per_host,
+            page_timeout=self.cfg.scraper_timeout,
+        )
+
         # Set default encoding to utf-8
         self.encoding = kwargs.get('encoding', 'utf-8')
 
@@ -287,6 +304,14 @@ class GPTResearcher:
                 logging.getLogger('research').error(f"Error in _log_event: {e}", exc_info=True)
 
     async def conduct_research(self, on_progress=None):
+        self.scraper_manager.open()
+        try:
+            return await self._conduct_research(on_progress)
+        finally:
+            # Release pooled browsers and connections once no other research uses them
+            await self.scraper_manager.close()
+
+    async def _conduct_research(self, on_progress=None):
         await self._log_event("research", step="start", details={
             "query": self.query,
             "report_type": self.report_type,
@@ -397,7 +422,7 @@ class GPTResearcher:
         return intro
 
     async def quick_search(self, query: str, query_domains: list[str] = None) -> list[Any]:
-        return await get_search_results(query, self.retrievers[0], query_domains=query_domains)
+        return await get_search_results(query, self.retrievers[0], query_domains=query_domains, researcher=self)
 
     async def get_subtopics(self):
         return await self.report_generator.get_subtopics()
@@ -6,6 +6,7 @@ class BaseConfig(TypedDict):
     RETRIEVER: str
     EMBEDDING: str
     SIMILARITY_THRESHOLD: float
+    DEDUPE_SIMILARITY_THRESHOLD: Union[float, None]
     FAST_LLM: str
     SMART_LLM: str
     STRATEGIC_LLM: str
@@ -17,6 +18,14 @@ class BaseConfig(TypedDict):
     TEMPERATURE: float
     USER_AGENT: str
     MAX_SEARCH_RESULTS_PER_QUERY: int
+    RETRIEVER_TIMEOUT: float
+    MAX_FUSED_RESULTS_PER_QUERY: Union[int, None]
+    SEARCH_CACHE_DIR: Union[str, None]
+    SEARCH_CACHE_TTL: float
+    SEARCH_CACHE_TTLS: dict
+    RATE_LIMITS: dict
+    CIRCUIT_BREAKER_THRESHOLD: int
+    CIRCUIT_BREAKER_COOLDOWN: float
     MEMORY_BACKEND: str
     TOTAL_WORDS: int
     REPORT_FORMAT: str
@@ -26,12 +35,36 @@ class BaseConfig(TypedDict):
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
     MAX_SCRAPER_WORKERS: int
+    SCRAPE_DEADLINE: Union[float, None]
+    SCRAPER_MAX_CONNECTIONS: int
+    SCRAPER_MAX_CONNECTIONS_PER_HOST: int
+    SCRAPER_TIMEOUT: float
+    SCRAPER_EXTRACTION_MODE: str
+    SCRAPER_EXTRACTION_WORKERS: Union[int, None]
+    SCRAPER_MAX_HTML_BYTES: int
+    SCRAPER_CACHE_DIR: Union[str, None]
+    SCRAPER_CACHE_TTL: int
+    SCRAPER_CACHE_MAX_BYTES: int
+    BROWSER_PERFORMANCE_MODE: bool
+    BROWSER_MAX_DRIVERS: int
+    PDF_MAX_PAGES: int
+    PDF_MAX_CHARS: Union[int, None]
+    PDF_MAX_BYTES: int
     MAX_SUBTOPICS: int
     REPORT_SOURCE: Union[str, None]
     DOC_PATH: str
     PROMPT_FAMILY: str
     LLM_KWARGS: dict
+    LLM_CACHE_DIR: Union[str, None]
+    LLM_CACHE_TTL: Union[float, None]
+    LLM_CACHE_MAX_BYTES: int
+    LLM_MAX_RETRIES: int
+    LLM_DEADLINE: Union[float, None]
+    LLM_FALLBACK_CHAIN: List[str]
+    LLM_HEDGE_PERCENTILE: Union[float, None]
     EMBEDDING_KWARGS: dict
+    EMBEDDING_CACHE_DIR: Union[str, None]
+    EMBEDDING_CACHE_SIZE: int
     DEEP_RESEARCH_CONCURRENCY: int
     DEEP_RESEARCH_DEPTH: int
     DEEP_RESEARCH_BREADTH: int
@@ -4,6 +4,7 @@ DEFAULT_CONFIG: BaseConfig = {
     "RETRIEVER": "tavily",
     "EMBEDDING": "openai:text-embedding-3-small",
     "SIMILARITY_THRESHOLD": 0.42,
+    "DEDUPE_SIMILARITY_THRESHOLD": 0.8,  # Set to None to keep near-duplicate pages
     "FAST_LLM": "openai:gpt-4o-mini",
     "SMART_LLM": "openai:gpt-4.1",  # Has support for long responses (2k+ words).
     "STRATEGIC_LLM": "openai:o4-mini",  # Can be used with o1 or o3, please note it will make tasks slower.
@@ -16,6 +17,14 @@ DEFAULT_CONFIG: BaseConfig = {
     "TEMPERATURE": 0.4,
     "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0",
     "MAX_SEARCH_RESULTS_PER_QUERY": 5,
+    "RETRIEVER_TIMEOUT": 20.0,  # Seconds each retriever gets per query before it is skipped
+    "MAX_FUSED_RESULTS_PER_QUERY": None,  # URLs kept after fusing retrievers; None uses MAX_SEARCH_RESULTS_PER_QUERY
+    "SEARCH_CACHE_DIR": None,  # Set to a directory to persist search results across runs
+    "SEARCH_CACHE_TTL": 3600,  # Seconds search results are reused; 0 disables the cache
+    "SEARCH_CACHE_TTLS": {},  # Per-retriever TTL overrides, e.g. {"arxiv": 86400}
+    "RATE_LIMITS": {},  # Per-provider budgets, e.g. {"openai": {"rpm": 500, "tpm": 200000}, "tavily": {"rpm": 100}}
+    "CIRCUIT_BREAKER_THRESHOLD": 5,  # Consecutive failures before a provider is skipped; 0 disables
+    "CIRCUIT_BREAKER_COOLDOWN": 30.0,  # Seconds a failing provider is skipped
     "MEMORY_BACKEND": "local",
     "TOTAL_WORDS": 1200,
     "REPORT_FORMAT": "APA",
@@ -23,13 +32,37 @@ DEFAULT_CONFIG: BaseConfig = {
     "AGENT_ROLE": None,
     "SCRAPER": "bs",
     "MAX_SCRAPER_WORKERS": 15,
+    "SCRAPE_DEADLINE": None,  # Seconds a sub-query waits for scraped pages; None waits for all
+    "SCRAPER_MAX_CONNECTIONS": 100,  # Open connections in the shared HTTP pool
+    "SCRAPER_MAX_CONNECTIONS_PER_HOST": 8,
+    "SCRAPER_TIMEOUT": 4.0,  # Seconds a page fetch waits to connect or for the next bytes
+    "SCRAPER_EXTRACTION_MODE": "process",  # "process" or "thread" pool for HTML and PDF parsing
+    "SCRAPER_EXTRACTION_WORKERS": None,  # Defaults to the number of CPUs
+    "SCRAPER_MAX_HTML_BYTES": 5_000_000,
+    "SCRAPER_CACHE_DIR": None,  # Set to a directory to cache scraped pages across runs
+    "SCRAPER_CACHE_TTL": 86400,  # Seconds a cached page is served before it is revalidated
+    "SCRAPER_CACHE_MAX_BYTES": 500_000_000,
+    "BROWSER_PERFORMANCE_MODE": False,
+    "BROWSER_MAX_DRIVERS": 3,  # Warm Selenium drivers shared by the browser scraper
+    "PDF_MAX_PAGES": 1,  # Pages of text extracted per PDF
+    "PDF_MAX_CHARS": None,  # Optional character budget per PDF
+    "PDF_MAX_BYTES": 50_000_000,  # Larger PDFs are not downloaded
     "MAX_SUBTOPICS": 3,
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
     "DOC_PATH": "./my-docs",
     "PROMPT_FAMILY": "default",
     "LLM_KWARGS": {},
+    "LLM_CACHE_DIR": None,  # Set to a directory to replay identical LLM requests from a cache
+    "LLM_CACHE_TTL": None,  # Seconds a cached response is reused; None keeps it until evicted
+    "LLM_CACHE_MAX_BYTES": 100_000_000,
+    "LLM_MAX_RETRIES": 3,  # Retries of rate limits, server errors and timeouts per model
+    "LLM_DEADLINE": None,  # Seconds an LLM call may take including retries and fallbacks
+    "LLM_FALLBACK_CHAIN": ["strategic", "smart", "fast"],  # Tiers opted-in calls fall back to on transient errors
+    "LLM_HEDGE_PERCENTILE": None,  # e.g. 95 sends a second request when one is slower than p95
     "EMBEDDING_KWARGS": {},
+    "EMBEDDING_CACHE_DIR": None,  # Set to a directory to persist embeddings across runs
+    "EMBEDDING_CACHE_SIZE": 5000,  # Number of embeddings kept in the in-process LRU
     "VERBOSE": False,
     # Deep research specific settings
     "DEEP_RESEARCH_BREADTH": 3,
@@ -1,4 +1,6 @@
 from .compression import ContextCompressor
 from .retriever import SearchAPIRetriever
+from .chunk_index import ChunkIndex
+from .dedupe import PageDeduplicator
 
-__all__ = ['ContextCompressor', 'SearchAPIRetriever']
+__all__ = ['ContextCompressor', 'SearchAPIRetriever', 'ChunkIndex', 'PageDeduplicator']
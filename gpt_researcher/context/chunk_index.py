@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain.schema import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from .compression import SimilarityEngine
+
+
+class ChunkIndex:
+    """
+    Session-scoped index of page chunks and their embeddings.
+
+    Each page is split and embedded exactly once per research session. Every
+    sub-query is then answered from the cached vectors instead of re-splitting and
+    re-embedding the same pages.
+    """
+
+    def __init__(self, embeddings, chunk_size: int = 1000, chunk_overlap: int = 100):
+        self.embeddings = embeddings
+        self.splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        )
+        self.engine = SimilarityEngine()
+        self._chunks: Dict[str, List[Document]] = {}
+        self._rows: Dict[str, np.ndarray] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def page_key(page: dict) -> str:
+        """Identify a page by its url and content, so updated content is re-indexed"""
+        raw = f"{page.get('url', '')}\n{page.get('raw_content') or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return sum(len(chunks) for chunks in self._chunks.values())
+
+    def _split_page(self, page: dict) -> List[Document]:
+        content = page.get("raw_content") or ""
+        if not content:
+            return []
+        metadata = {"title": page.get("title", ""), "source": page.get("url", "")}
+        if page.get("duplicate_urls"):
+            metadata["duplicate_urls"] = list(page["duplicate_urls"])
+        return self.splitter.create_documents([content], metadatas=[metadata])
+
+    async def add_pages(self, pages: List[dict]) -> List[Document]:
+        """
+        Split and embed the pages that are not indexed yet.
+
+        Pages already being indexed by a concurrent call are awaited instead of
+        being embedded a second time.
+
+        Returns:
+            List[Document]: The chunks embedded by this call.
+        """
+        owned: Dict[str, dict] = {}
+        waiting: List[asyncio.Future] = []
+        loop = asyncio.get_running_loop()
+        for page in pages:
+            key = self.page_key(page)
+            if key in self._chunks or key in owned:
+                continue
+            if key in self._pending:
+                waiting.append(self._pending[key])
+                continue
+            owned[key] = page
+            self._pending[key] = loop.create_future()
+
+        new_chunks: List[Document] = []
+        if owned:
+            try:
+                split_pages = await asyncio.to_thread(
+                    lambda: {key: self._split_page(page) for key, page in owned.items()}
+                )
+                texts = [chunk.page_content for chunks in split_pages.values() for chunk in chunks]
+                vectors = await self.embeddings.aembed_documents(texts) if texts else []
+                rows = self.engine.add(vectors)
+
+                offset = 0
+                for key, chunks in split_pages.items():
+                    self._chunks[key] = chunks
+                    self._rows[key] = rows[offset:offset + len(chunks)]
+                    offset += len(chunks)
+                    new_chunks.extend(chunks)
+            finally:
+                # Waiters re-check the index, so a failed batch simply stays unindexed
+                for key in owned:
+                    self._pending.pop(key).set_result(None)
+
+        if waiting:
+            await asyncio.gather(*waiting)
+        return new_chunks
+
+    async def similarity_search(
+        self,
+        query: str,
+        pages: List[dict],
+        k: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+    ) -> List[Document]:
+        """
+        Return the chunks of `pages` most similar to the query, best match first.
+
+        Args:
+            query: The query to score the chunks against.
+            pages: The scraped pages the search is restricted to.
+            k: Maximum number of chunks to return. Defaults to all matching chunks.
+            similarity_threshold: Minimum cosine similarity a chunk must exceed.
+        """
+        await self.add_pages(pages)
+        for page in pages:
+            # Pages merged into this one after it was indexed are cited along with it
+            if page.get("duplicate_urls"):
+                for chunk in self._chunks.get(self.page_key(page), []):
+                    chunk.metadata["duplicate_urls"] = list(page["duplicate_urls"])
+
+        keys = list(dict.fromkeys(self.page_key(page) for page in pages))
+        keys = [key for key in keys if self._chunks.get(key)]
+        if not keys:
+            return []
+        chunk_by_row = {
+            int(row): chunk
+            for key in keys
+            for row, chunk in zip(self._rows[key], self._chunks[key])
+        }
+
+        query_vector = await self.embeddings.aembed_query(query)
+        matches = self.engine.search(
+            query_vector,
+            k=k,
+            similarity_threshold=similarity_threshold,
+            rows=np.fromiter(chunk_by_row, dtype=np.int64),
+        )[0]
+        return [chunk_by_row[row] for row, _ in matches]
@@ -1,6 +1,8 @@
 import os
 import asyncio
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
 from .retriever import SearchAPIRetriever, SectionRetriever
 from langchain.retrievers import (
     ContextualCompressionRetriever,
@@ -15,6 +17,105 @@ from ..utils.costs import estimate_embedding_cost
 from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
 from ..prompts import PromptFamily
 
+if TYPE_CHECKING:
+    from .chunk_index import ChunkIndex
+
+
+class SimilarityEngine:
+    """
+    Vectorized cosine similarity over chunk embeddings.
+
+    Embeddings are L2-normalized on insert and kept in one contiguous float32 matrix,
+    so a batch of queries is scored against every chunk with a single matrix multiply.
+    """
+
+    def __init__(self, dimensions: Optional[int] = None, capacity: int = 1024):
+        self._capacity = capacity
+        self._size = 0
+        self._matrix = (
+            np.empty((capacity, dimensions), dtype=np.float32) if dimensions else None
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The normalized embeddings added so far, one row per chunk"""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._matrix[:self._size]
+
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    def add(self, vectors) -> np.ndarray:
+        """
+        Append embeddings to the matrix.
+
+        Returns:
+            np.ndarray: The row ids assigned to the new embeddings.
+        """
+        vectors = self._normalize(vectors)
+        count = len(vectors)
+        if count == 0:
+            return np.empty(0, dtype=np.int64)
+        if self._matrix is None:
+            self._capacity = max(self._capacity, count)
+            self._matrix = np.empty((self._capacity, vectors.shape[1]), dtype=np.float32)
+        elif self._size + count > self._capacity:
+            # Grow geometrically so repeated small inserts stay amortized O(1)
+            self._capacity = max(self._capacity * 2, self._size + count)
+            grown = np.empty((self._capacity, self._matrix.shape[1]), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+        self._matrix[self._size:self._size + count] = vectors
+        rows = np.arange(self._size, self._size + count)
+        self._size += count
+        return rows
+
+    def search(
+        self,
+        query_vectors,
+        k: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> List[List[tuple[int, float]]]:
+        """
+        Score every chunk against every query and keep the best matches.
+
+        Args:
+            query_vectors: One query embedding or a batch of them.
+            k: Maximum number of matches per query. Defaults to all matches.
+            similarity_threshold: Minimum cosine similarity a chunk must exceed.
+            rows: Restrict the search to these row ids.
+
+        Returns:
+            List[List[tuple[int, float]]]: Per query, (row id, score) pairs, best match first.
+        """
+        queries = self._normalize(query_vectors)
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        if rows is None:
+            rows = np.arange(len(matrix))
+        if len(matrix) == 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = queries @ matrix.T
+        results = []
+        for query_scores in scores:
+            candidates = np.arange(len(query_scores))
+            if similarity_threshold is not None:
+                candidates = np.flatnonzero(query_scores > similarity_threshold)
+            if k is not None and len(candidates) > k:
+                top = np.argpartition(-query_scores[candidates], k - 1)[:k]
+                candidates = candidates[top]
+            candidates = candidates[np.argsort(-query_scores[candidates], kind="stable")]
+            results.append([(int(rows[i]), float(query_scores[i])) for i in candidates])
+        return results
+
 
 class VectorstoreCompressor:
     def __init__(
@@ -45,6 +146,7 @@ class ContextCompressor:
         embeddings,
         max_results=5,
         prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+        chunk_index: Optional["ChunkIndex"] = None,
         **kwargs,
     ):
         self.max_results = max_results
@@ -53,27 +155,47 @@ class ContextCompressor:
         self.embeddings = embeddings
         self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.35)
         self.prompt_family = prompt_family
+        self.chunk_index = chunk_index
 
-    def __get_contextual_retriever(self):
+    def __split_documents(self):
         splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
         base_retriever = SearchAPIRetriever(
             pages=self.documents
         )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
+        return splitter.split_documents(base_retriever.invoke(""))
 
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
+        if self.chunk_index is not None:
+            return await self.__get_context_from_index(query, max_results, cost_callback)
         if cost_callback:
             cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
+        chunks = await asyncio.to_thread(self.__split_documents)
+        if not chunks:
+            return self.prompt_family.pretty_print_docs([], max_results)
+
+        chunk_vectors, query_vector = await asyncio.gather(
+            self.embeddings.aembed_documents([chunk.page_content for chunk in chunks]),
+            self.embeddings.aembed_query(query),
+        )
+        engine = SimilarityEngine()
+        engine.add(chunk_vectors)
+        matches = engine.search(
+            query_vector, k=max_results, similarity_threshold=float(self.similarity_threshold)
+        )[0]
+        relevant_docs = [chunks[row] for row, _ in matches]
+        return self.prompt_family.pretty_print_docs(relevant_docs, max_results)
+
+    async def __get_context_from_index(self, query, max_results, cost_callback=None):
+        # Only chunks that were not indexed by a previous sub-query cost anything
+        new_chunks = await self.chunk_index.add_pages(self.documents)
+        if cost_callback and new_chunks:
+            cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=new_chunks))
+        relevant_docs = await self.chunk_index.similarity_search(
+            query,
+            self.documents,
+            k=max_results,
+            similarity_threshold=float(self.similarity_threshold),
+        )
         return self.prompt_family.pretty_print_docs(relevant_docs, max_results)
 
 
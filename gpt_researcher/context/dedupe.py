@@ -0,0 +1,135 @@
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ..utils.urls import canonicalize_url
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class MinHasher:
+    """
+    MinHash signatures of word shingles.
+
+    The fraction of positions where two signatures agree estimates the Jaccard
+    similarity of the shingle sets of the two texts.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        generator = np.random.RandomState(seed)
+        # Coefficients below 2**32 keep a * hash + b inside uint64
+        self._a = generator.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        words = _WORD_PATTERN.findall(text.lower())
+        size = min(self.shingle_size, len(words))
+        if size == 0:
+            return np.empty(0, dtype=np.uint64)
+        return np.fromiter(
+            {zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) for i in range(len(words) - size + 1)},
+            dtype=np.uint64,
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = self.shingles(text)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0)
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        return float(np.mean(first == second))
+
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Pick the (bands, rows) split of a signature whose LSH collision curve
+    (1 / bands) ** (1 / rows) is closest to the similarity threshold.
+    """
+    splits = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    return min(splits, key=lambda split: abs((1 / split[0]) ** (1 / split[1]) - threshold))
+
+
+class PageDeduplicator:
+    """
+    Session-scoped detector of near-duplicate scraped pages.
+
+    Mirrors, syndicated articles and press-release copies share most of their text.
+    Every page gets a MinHash signature of its `raw_content`, and locality-sensitive
+    hashing finds the pages kept so far that may be similar. A page whose estimated
+    Jaccard similarity to one of them reaches `threshold` is merged into that
+    representative, whose `duplicate_urls` lists the merged URLs so they can still be
+    cited.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+        self._buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._signatures: List[np.ndarray] = []
+        self._pages: List[dict] = []
+        self._by_url: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.merged = 0
+
+    def add(self, page: dict) -> dict:
+        """
+        Register a scraped page.
+
+        Returns:
+            dict: The page itself when it is new, or the representative page it was
+            merged into.
+        """
+        url = canonicalize_url(page.get("url", ""))
+        with self._lock:
+            if url in self._by_url:
+                return self._by_url[url]
+
+        content = page.get("raw_content") or ""
+        signature = self.hasher.signature(content)
+        band_keys = [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)
+        ]
+
+        with self._lock:
+            if url in self._by_url:
+                return self._by_url[url]
+            if content:
+                candidates = {
+                    index for band, key in enumerate(band_keys) for index in self._buckets[band].get(key, ())
+                }
+                for index in sorted(candidates):
+                    if self.hasher.similarity(signature, self._signatures[index]) >= self.threshold:
+                        representative = self._pages[index]
+                        representative.setdefault("duplicate_urls", []).append(page.get("url"))
+                        self._by_url[url] = representative
+                        self.merged += 1
+                        return representative
+
+                index = len(self._pages)
+                for band, key in enumerate(band_keys):
+                    self._buckets[band][key].append(index)
+                self._signatures.append(signature)
+                self._pages.append(page)
+            self._by_url[url] = page
+            return page
+
+    def deduplicate(self, pages: List[dict]) -> List[dict]:
+        """Replace near-duplicates with their representatives, keeping the first occurrence order"""
+        kept: Dict[int, dict] = {}
+        for page in pages:
+            representative = self.add(page)
+            kept.setdefault(id(representative), representative)
+        return list(kept.values())
+
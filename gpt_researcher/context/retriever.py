@@ -21,6 +21,7 @@ class SearchAPIRetriever(BaseRetriever):
                 metadata={
                     "title": page.get("title", ""),
                     "source": page.get("url", ""),
+                    **({"duplicate_urls": page["duplicate_urls"]} if page.get("duplicate_urls") else {}),
                 },
             )
             for page in self.pages
@@ -271,6 +271,12 @@ class GenericLLMProvider:
 
         return response
 
+    async def replay_response(self, response, websocket=None):
+        """Send a cached response the way `stream_response` streams it, one paragraph at a time"""
+        for paragraph in response.splitlines(keepends=True):
+            await self._send_output(paragraph, websocket)
+        return response
+
     async def _send_output(self, content, websocket=None):
         if websocket is not None:
             await websocket.send_json({"type": "report", "output": content})
@@ -49,7 +49,7 @@ class MCPResearchSkill:
         logger.info(f"Conducting research using {len(selected_tools)} selected tools")
         
         try:
-            from ..llm_provider.generic.base import GenericLLMProvider
+            from ..utils.llm import get_llm
             
             # Create LLM provider using the config
             provider_kwargs = {
@@ -57,7 +57,7 @@ class MCPResearchSkill:
                 **self.cfg.llm_kwargs
             }
             
-            llm_provider = GenericLLMProvider.from_provider(
+            llm_provider = get_llm(
                 self.cfg.strategic_llm_provider, 
                 **provider_kwargs
             )
@@ -152,6 +152,7 @@ class MCPToolSelector:
                 messages=messages,
                 temperature=0.0,  # Low temperature for consistent tool selection
                 llm_provider=self.cfg.strategic_llm_provider,
+                cfg=self.cfg,
                 llm_kwargs=self.cfg.llm_kwargs,
                 cost_callback=self.researcher.add_costs if self.researcher and hasattr(self.researcher, 'add_costs') else None,
             )
@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from ..utils.single_flight import SingleFlight
+
+
+class EmbeddingStore:
+    """
+    Content-addressed store of embedding vectors.
+
+    Vectors live in an in-process LRU and, when a cache directory is configured, in a
+    SQLite database so they survive across research runs.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._db = sqlite3.connect(
+                os.path.join(cache_dir, "embeddings.sqlite3"), check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return the stored vectors for the keys that are present"""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    found[key] = self._lru[key]
+
+            missing = [key for key in dict.fromkeys(keys) if key not in found]
+            if self._db is not None and missing:
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(missing), 500):
+                    batch = missing[start:start + 500]
+                    rows = self._db.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        found[key] = vector
+                        self._remember(key, vector)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Store vectors under their keys"""
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector)
+            if self._db is not None and items:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in items.items()],
+                )
+                self._db.commit()
+
+
+_stores: Dict[tuple, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+_embedding_requests = SingleFlight()
+
+
+def get_embedding_store(cache_dir: Optional[str] = None, max_entries: int = 5000) -> EmbeddingStore:
+    """Get the process-wide store for a cache location, so every researcher shares it"""
+    key = (os.path.abspath(cache_dir) if cache_dir else None, max_entries)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = EmbeddingStore(cache_dir, max_entries)
+        return _stores[key]
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings adapter that serves repeated texts from an EmbeddingStore.
+
+    Vectors are keyed by (provider, model, settings, kind, sha256(text)), where settings
+    is a hash of the embedding kwargs (e.g. `dimensions`) and kind separates query and
+    document embeddings for providers that embed them differently.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        provider: str,
+        model: str,
+        store: EmbeddingStore,
+        embedding_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        self.embeddings = embeddings
+        self.provider = provider
+        self.model = model
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        # Vectors of the same model differ with settings such as `dimensions`
+        self._prefix = f"{provider}:{model}"
+        if embedding_kwargs:
+            settings = json.dumps(embedding_kwargs, sort_keys=True, default=repr)
+            self._prefix += f":{hashlib.sha256(settings.encode('utf-8')).hexdigest()[:16]}"
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+    def _key(self, kind: str, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self._prefix}:{kind}:{digest}"
+
+    def _lookup(self, kind: str, texts: List[str]) -> tuple[List[str], Dict[str, np.ndarray], List[str]]:
+        keys = [self._key(kind, text) for text in texts]
+        found = self.store.get_many(keys)
+        # Embed each distinct missing text once, even if it repeats within the batch
+        missing = list(dict.fromkeys(text for key, text in zip(keys, texts) if key not in found))
+        miss_count = sum(1 for key in keys if key not in found)
+        with self._stats_lock:
+            self.hits += len(keys) - miss_count
+            self.misses += miss_count
+        return keys, found, missing
+
+    def _store(self, kind: str, texts: List[str], vectors, found: Dict[str, np.ndarray]) -> None:
+        new = {
+            self._key(kind, text): np.asarray(vector, dtype=np.float32)
+            for text, vector in zip(texts, vectors)
+        }
+        self.store.put_many(new)
+        found.update(new)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = self._lookup("document", texts)
+        if missing:
+            self._store("document", missing, self.embeddings.embed_documents(missing), found)
+        return [found[key].tolist() for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        keys, found, missing = self._lookup("query", [text])
+        if missing:
+            self._store("query", missing, [self.embeddings.embed_query(text)], found)
+        return found[keys[0]].tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        # The store reads and writes SQLite, which must not block the event loop
+        keys, found, missing = await asyncio.to_thread(self._lookup, "document", texts)
+        if missing:
+            # Researchers indexing the same pages at once share one embedding request
+            batch_key = hashlib.sha256(
+                "\n".join(self._key("document", text) for text in missing).encode("utf-8")
+            ).hexdigest()
+            vectors, _ = await _embedding_requests.do(
+                batch_key, lambda: self.embeddings.aembed_documents(missing)
+            )
+            await asyncio.to_thread(self._store, "document", missing, vectors, found)
+        return [found[key].tolist() for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        keys, found, missing = await asyncio.to_thread(self._lookup, "query", [text])
+        if missing:
+            vector, _ = await _embedding_requests.do(keys[0], lambda: self.embeddings.aembed_query(text))
+            await asyncio.to_thread(self._store, "query", missing, [vector], found)
+        return found[keys[0]].tolist()
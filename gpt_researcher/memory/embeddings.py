@@ -1,6 +1,8 @@
 import os
 from typing import Any
 
+from .cache import CachedEmbeddings, get_embedding_store
+
 OPENAI_EMBEDDING_MODEL = os.environ.get(
     "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
 )
@@ -27,7 +29,14 @@ _SUPPORTED_PROVIDERS = {
 
 
 class Memory:
-    def __init__(self, embedding_provider: str, model: str, **embdding_kwargs: Any):
+    def __init__(
+        self,
+        embedding_provider: str,
+        model: str,
+        cache_dir: str | None = None,
+        cache_size: int = 5000,
+        **embdding_kwargs: Any,
+    ):
         _embeddings = None
         match embedding_provider:
             case "custom":
@@ -130,7 +139,17 @@ class Memory:
             case _:
                 raise Exception("Embedding not found.")
 
-        self._embeddings = _embeddings
+        # Repeated chunks are served from the cache instead of being re-embedded
+        self._embeddings = CachedEmbeddings(
+            _embeddings,
+            provider=embedding_provider,
+            model=model,
+            store=get_embedding_store(cache_dir, cache_size),
+            embedding_kwargs=embdding_kwargs,
+        )
 
     def get_embeddings(self):
         return self._embeddings
+
+    def get_cache_stats(self) -> dict:
+        return self._embeddings.stats()
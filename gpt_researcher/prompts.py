@@ -436,11 +436,18 @@ response:
     def pretty_print_docs(docs: list[Document], top_n: int | None = None) -> str:
         """Compress the list of documents into a context string"""
         return f"\n".join(f"Source: {d.metadata.get('source')}\n"
-                          f"Title: {d.metadata.get('title')}\n"
+                          + PromptFamily._format_duplicate_urls(d)
+                          + f"Title: {d.metadata.get('title')}\n"
                           f"Content: {d.page_content}\n"
                           for i, d in enumerate(docs)
                           if top_n is None or i < top_n)
 
+    @staticmethod
+    def _format_duplicate_urls(doc: Document) -> str:
+        """Near-duplicate pages merged into the document, which can be cited as well"""
+        duplicate_urls = doc.metadata.get("duplicate_urls")
+        return f"Also published at: {', '.join(duplicate_urls)}\n" if duplicate_urls else ""
+
     @staticmethod
     def join_local_web_documents(docs_context: str, web_context: str) -> str:
         """Joins local web documents with context scraped from the internet"""
@@ -666,6 +673,7 @@ class Granite3PromptFamily(PromptFamily):
             return ""
         all_documents = "\n\n".join([
             f"Document {doc.metadata.get('source', i)}\n" + \
+            cls._format_duplicate_urls(doc) + \
             f"Title: {doc.metadata.get('title')}\n" + \
             doc.page_content
             for i, doc in enumerate(docs)
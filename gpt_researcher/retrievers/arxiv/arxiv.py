@@ -1,3 +1,5 @@
+import asyncio
+
 import arxiv
 
 
@@ -37,4 +39,13 @@ class ArxivSearch:
                 "body": result.summary,
             })
         
-        return search_result
\ No newline at end of file
+        return search_result
+
+    async def asearch(self, max_results=5, http_client=None):
+        """
+        Performs the search in a worker thread, since the arxiv client is blocking
+        :param max_results:
+        :param http_client: unused, the client manages its own connections
+        :return:
+        """
+        return await asyncio.to_thread(self.search, max_results)
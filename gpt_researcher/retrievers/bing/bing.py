@@ -6,12 +6,16 @@ import requests
 import json
 import logging
 
+from ..utils import http_session
+
 
 class BingSearch():
     """
     Bing Search Retriever
     """
 
+    base_url = "https://api.bing.microsoft.com/v7.0/search"
+
     def __init__(self, query, query_domains=None):
         """
         Initializes the BingSearch object
@@ -46,30 +50,48 @@ class BingSearch():
         """Useful for general internet search queries using the Bing API."""
 
         # Search the query
-        url = "https://api.bing.microsoft.com/v7.0/search"
+        resp = requests.get(self.base_url, headers=self._headers(), params=self._params(max_results))
+
+        # Preprocess the results
+        if resp is None:
+            return []
+        return self._parse_results(resp.text)
+
+    async def asearch(self, max_results=7, http_client=None) -> list[dict[str]]:
+        """
+        Searches the query without blocking the event loop, over the research's pooled
+        HTTP client when one is given
+        Returns:
+
+        """
+        self.logger.info(f"Searching with query {self.query}...")
+        async with http_session(http_client) as session:
+            async with session.get(self.base_url, headers=self._headers(), params=self._params(max_results)) as resp:
+                resp.raise_for_status()
+                text = await resp.text()
+        return self._parse_results(text)
 
-        headers = {
+    def _headers(self) -> dict:
+        return {
             'Ocp-Apim-Subscription-Key': self.api_key,
             'Content-Type': 'application/json'
         }
+
+    def _params(self, max_results: int) -> dict:
         # TODO: Add support for query domains
-        params = {
+        return {
             "responseFilter": "Webpages",
             "q": self.query,
             "count": max_results,
             "setLang": "en-GB",
-            "textDecorations": False,
+            "textDecorations": "False",
             "textFormat": "HTML",
             "safeSearch": "Strict"
         }
 
-        resp = requests.get(url, headers=headers, params=params)
-
-        # Preprocess the results
-        if resp is None:
-            return []
+    def _parse_results(self, text: str) -> list[dict[str]]:
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
             results = search_results["webPages"]["value"]
         except Exception as e:
             self.logger.error(
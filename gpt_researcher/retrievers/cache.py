@@ -0,0 +1,236 @@
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Retriever attributes that change what a search returns, such as the account or topic
+SETTINGS_ATTRIBUTES = ("headers", "api_key", "cx_key", "topic", "sort", "base_url", "endpoint", "params")
+
+
+def retriever_settings(retriever: Any) -> Dict[str, Any]:
+    """The settings of a retriever instance that its cached results are keyed by"""
+    return {
+        name: getattr(retriever, name)
+        for name in SETTINGS_ATTRIBUTES
+        if getattr(retriever, name, None) is not None
+    }
+
+
+class SearchCache:
+    """
+    Cache of search-engine results, shared by every researcher in the process.
+
+    Results are kept in an in-process LRU and, when a cache directory is configured,
+    in a SQLite database so they survive across research runs. Entries expire after
+    the TTL of the retriever that produced them. Empty results are not cached, so a
+    failed search is retried on the next call. A search for fewer results is served
+    from a cached search for more, e.g. the first 5 results of a search for 10.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl: float = 3600,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1000,
+    ):
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.max_entries = max_entries
+        self._lru: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.store = DiskCache(os.path.join(cache_dir, "search.sqlite3")) if cache_dir else None
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+
+    def ttl_for(self, retriever_name: str) -> float:
+        return self.ttls.get(retriever_name, self.ttl)
+
+    @staticmethod
+    def key(
+        retriever_name: str,
+        query: str,
+        query_domains: Optional[List[str]] = None,
+        settings: Optional[Dict[str, Any]] = None,
+        **options: Any,
+    ) -> str:
+        """
+        Key a search by retriever, case- and whitespace-normalized query, domains, options
+        and the retriever's settings (see `retriever_settings`), so searches made with other
+        credentials, headers or topics are not served each other's results. The number of
+        results is checked when the entry is read instead, see `get`.
+        """
+        raw = json.dumps(
+            [
+                retriever_name,
+                " ".join(query.lower().split()),
+                sorted(query_domains or []),
+                sorted(options.items()),
+                sorted((settings or {}).items()),
+            ],
+            default=str,
+        )
+        return f"{retriever_name}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+    def get(self, retriever_name: str, key: str, max_results: Optional[int] = None) -> Optional[List[dict]]:
+        """
+        Return a copy of the cached results if they are younger than the retriever's TTL and
+        answer a search for `max_results`, None meaning the retriever's default number.
+        """
+        ttl = self.ttl_for(retriever_name)
+        with self._lock:
+            cached = self._lru.get(key)
+            if cached is not None:
+                self._lru.move_to_end(key)
+        if cached is None and self.store is not None:
+            cached = self.store.get(key)
+            if cached is not None:
+                self._remember(key, *cached)
+        if cached is None:
+            return None
+        entry, stored_at = cached
+        if time.time() - stored_at >= ttl or not self._covers(entry, max_results):
+            return None
+        results = entry["results"] if max_results is None else entry["results"][:max_results]
+        return copy.deepcopy(results)
+
+    @staticmethod
+    def _covers(entry: dict, max_results: Optional[int]) -> bool:
+        fetched = entry["max_results"]
+        if max_results is None:
+            return fetched is None
+        # A search that returned fewer results than it asked for has no more to give
+        return len(entry["results"]) >= max_results or (fetched is not None and fetched >= max_results)
+
+    def put(self, key: str, results: List[dict], max_results: Optional[int] = None) -> None:
+        stored_at = time.time()
+        entry = {"results": results, "max_results": max_results}
+        self._remember(key, copy.deepcopy(entry), stored_at)
+        if self.store is not None:
+            try:
+                self.store.set(key, entry)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Search results are not JSON serializable, caching in memory only: {e}")
+
+    def _remember(self, key: str, entry: dict, stored_at: float) -> None:
+        with self._lock:
+            self._lru[key] = (entry, stored_at)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    def search(
+        self,
+        retriever_name: str,
+        search: Callable[..., Optional[List[dict]]],
+        query: str,
+        query_domains: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        settings: Optional[Dict[str, Any]] = None,
+        **options: Any,
+    ) -> Optional[List[dict]]:
+        """
+        Return cached results for the search, or run `search` and cache what it returns.
+
+        `search` is the retriever's blocking search method. It is called with
+        `max_results` (when given) and the extra options.
+        """
+        key = self.key(retriever_name, query, query_domains, settings, **options)
+        results = self.get(retriever_name, key, max_results)
+        self._count(retriever_name, results is not None)
+        if results is not None:
+            return results
+
+        kwargs = dict(options)
+        if max_results is not None:
+            kwargs["max_results"] = max_results
+        results = search(**kwargs)
+        if results:
+            self.put(key, results, max_results)
+        return results
+
+    async def asearch(
+        self,
+        retriever_name: str,
+        search: Callable[..., Awaitable[Optional[List[dict]]]],
+        query: str,
+        query_domains: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        settings: Optional[Dict[str, Any]] = None,
+        **options: Any,
+    ) -> Optional[List[dict]]:
+        """Like `search` for a coroutine function; only the disk tier is read in a thread"""
+        key = self.key(retriever_name, query, query_domains, settings, **options)
+        if self.store is not None:
+            results = await asyncio.to_thread(self.get, retriever_name, key, max_results)
+        else:
+            results = self.get(retriever_name, key, max_results)
+        self._count(retriever_name, results is not None)
+        if results is not None:
+            return results
+
+        kwargs = dict(options)
+        if max_results is not None:
+            kwargs["max_results"] = max_results
+        results = await search(**kwargs)
+        if results:
+            if self.store is not None:
+                await asyncio.to_thread(self.put, key, results, max_results)
+            else:
+                self.put(key, results, max_results)
+        return results
+
+    def _count(self, retriever_name: str, hit: bool) -> None:
+        # Blocking searches of several researchers update the counters from their threads
+        with self._lock:
+            if hit:
+                self.hits[retriever_name] += 1
+            else:
+                self.misses[retriever_name] += 1
+
+    def stats(self) -> dict:
+        """Hits, misses and hit rate in total and per retriever"""
+        with self._lock:
+            per_retriever = {
+                name: {"hits": self.hits[name], "misses": self.misses[name]}
+                for name in sorted(set(self.hits) | set(self.misses))
+            }
+        hits = sum(counts["hits"] for counts in per_retriever.values())
+        misses = sum(counts["misses"] for counts in per_retriever.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "retrievers": per_retriever,
+        }
+
+
+_caches: Dict[tuple, SearchCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_search_cache(
+    cache_dir: Optional[str] = None, ttl: float = 3600, ttls: Optional[Dict[str, float]] = None
+) -> Optional[SearchCache]:
+    """Get the process-wide search cache for a location, or None when the TTL disables caching"""
+    if not ttl and not ttls:
+        return None
+    key = (
+        os.path.abspath(cache_dir) if cache_dir else None,
+        ttl,
+        tuple(sorted((ttls or {}).items())),
+    )
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = SearchCache(cache_dir, ttl, ttls)
+        return _caches[key]
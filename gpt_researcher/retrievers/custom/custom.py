@@ -1,13 +1,22 @@
+import logging
 from typing import Any, Dict, List, Optional
+import aiohttp
 import requests
 import os
 
+from ..utils import http_session
+
+logger = logging.getLogger(__name__)
+
 
 class CustomRetriever:
     """
     Custom API Retriever
     """
 
+    # The endpoint returns the full page text, so its URLs need not be scraped
+    returns_full_content = True
+
     def __init__(self, query: str, query_domains=None):
         self.endpoint = os.getenv('RETRIEVER_ENDPOINT')
         if not self.endpoint:
@@ -26,11 +35,12 @@ class CustomRetriever:
             if key.startswith('RETRIEVER_ARG_')
         }
 
-    def search(self, max_results: int = 5) -> Optional[List[Dict[str, Any]]]:
+    def search(self, max_results: int = 5, include_raw_content: bool = True) -> Optional[List[Dict[str, Any]]]:
         """
         Performs the search using the custom retriever endpoint.
 
         :param max_results: Maximum number of results to return (not currently used)
+        :param include_raw_content: Accepted for compatibility; the endpoint always returns `raw_content`
         :return: JSON response in the format:
             [
               {
@@ -49,4 +59,22 @@ class CustomRetriever:
             return response.json()
         except requests.RequestException as e:
             print(f"Failed to retrieve search results: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def asearch(
+        self, max_results: int = 5, include_raw_content: bool = True, http_client=None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Performs the search without blocking the event loop, over the research's pooled
+        HTTP client when one is given. Returns the same format as `search`.
+        """
+        try:
+            async with http_session(http_client) as session:
+                async with session.get(self.endpoint, params={**self.params, 'query': self.query}) as response:
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+        except aiohttp.ClientResponseError:
+            raise
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to retrieve search results: {e}")
+            return None
@@ -1,5 +1,10 @@
+import asyncio
+import logging
 from itertools import islice
 from ..utils import check_pkg
+from ...utils.rate_limiter import is_rate_limit_error
+
+logger = logging.getLogger(__name__)
 
 
 class Duckduckgo:
@@ -26,4 +31,20 @@ class Duckduckgo:
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
-        return search_response
\ No newline at end of file
+        return search_response
+
+    async def asearch(self, max_results=5, http_client=None):
+        """
+        Performs the search in a worker thread, since the duckduckgo_search client is blocking
+        :param max_results:
+        :param http_client: unused, the client manages its own connections
+        :return:
+        """
+        try:
+            return await asyncio.to_thread(self.ddg.text, self.query, region='wt-wt', max_results=max_results)
+        except Exception as e:
+            # Rate limits reach the caller's rate limiter, which backs off before the next search
+            if is_rate_limit_error(e):
+                raise
+            logger.error(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            return []
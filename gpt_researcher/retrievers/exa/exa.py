@@ -1,3 +1,4 @@
+import asyncio
 import os
 from ..utils import check_pkg
 
@@ -63,6 +64,17 @@ class ExaSearch:
         ]
         return search_response
 
+    async def asearch(
+        self, max_results=10, use_autoprompt=False, search_type="neural", http_client=None, **filters
+    ):
+        """
+        Searches the query in a worker thread, since the Exa client is blocking.
+        Takes the same arguments as `search`; `http_client` is unused.
+        """
+        return await asyncio.to_thread(
+            self.search, max_results, use_autoprompt, search_type, **filters
+        )
+
     def find_similar(self, url, exclude_source_domain=False, **filters):
         """
         Finds similar documents to the provided URL using the Exa API.
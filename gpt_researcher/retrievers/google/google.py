@@ -1,10 +1,15 @@
 # Tavily API Retriever
 
 # libraries
+import logging
 import os
 import requests
 import json
 
+from ..utils import http_session
+
+logger = logging.getLogger(__name__)
+
 
 class GoogleSearch:
     """
@@ -56,24 +61,44 @@ class GoogleSearch:
         Returns:
             list: List of search results with title, href and body
         """
+        resp = requests.get(self._url())
+
+        if resp.status_code < 200 or resp.status_code >= 300:
+            print("Google search: unexpected response status: ", resp.status_code)
+
+        if resp is None:
+            return
+        return self._parse_results(resp.text, max_results)
+
+    async def asearch(self, max_results=7, http_client=None):
+        """
+        Searches the query without blocking the event loop, over the research's pooled
+        HTTP client when one is given
+        Returns:
+            list: List of search results with title, href and body
+        """
+        async with http_session(http_client) as session:
+            async with session.get(self._url()) as resp:
+                if resp.status < 200 or resp.status >= 300:
+                    logger.warning(f"Google search: unexpected response status: {resp.status}")
+                resp.raise_for_status()
+                text = await resp.text()
+        return self._parse_results(text, max_results)
+
+    def _url(self) -> str:
         # Build query with domain restrictions if specified
         search_query = self.query
         if self.query_domains and len(self.query_domains) > 0:
             domain_query = " OR ".join([f"site:{domain}" for domain in self.query_domains])
             search_query = f"({domain_query}) {self.query}"
 
-        print("Searching with query {0}...".format(search_query))
+        logger.info(f"Searching with query {search_query}...")
 
-        url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
-        resp = requests.get(url)
+        return f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
 
-        if resp.status_code < 200 or resp.status_code >= 300:
-            print("Google search: unexpected response status: ", resp.status_code)
-
-        if resp is None:
-            return
+    def _parse_results(self, text: str, max_results: int):
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return
         if search_results is None:
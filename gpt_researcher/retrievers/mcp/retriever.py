@@ -198,6 +198,23 @@ class MCPRetriever:
             except Exception as e:
                 logger.error(f"Error during client cleanup: {e}")
 
+    async def asearch(self, max_results: int = 10, http_client=None) -> List[Dict[str, str]]:
+        """
+        Perform a search using MCP tools from within a running event loop.
+
+        Args:
+            max_results: Maximum number of results to return.
+            http_client: Unused; MCP servers manage their own connections.
+
+        Returns:
+            List[Dict[str, str]]: The search results.
+        """
+        if not self.mcp_configs:
+            logger.error("No MCP server configurations available. Please provide mcp_configs parameter to GPTResearcher.")
+            await self.streamer.stream_log("❌ MCP retriever cannot proceed without server configurations.")
+            return []
+        return await self.search_async(max_results)
+
     def search(self, max_results: int = 10) -> List[Dict[str, str]]:
         """
         Perform a search using MCP tools with intelligent two-stage approach.
@@ -1,14 +1,25 @@
+import asyncio
+import io
 import os
 import xml.etree.ElementTree as ET
 
 import requests
 
+from ..utils import http_session
+
 
 class PubMedCentralSearch:
     """
     PubMed Central API Retriever
     """
 
+    ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+    EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+    NAMESPACES = {
+        "mml": "http://www.w3.org/1998/Math/MathML",
+        "xlink": "http://www.w3.org/1999/xlink",
+    }
+
     def __init__(self, query, query_domains=None):
         """
         Initializes the PubMedCentralSearch object.
@@ -35,6 +46,26 @@ class PubMedCentralSearch:
             )
         return api_key
 
+    async def asearch(self, max_results=10, http_client=None):
+        """
+        Searches the query without blocking the event loop, over the research's pooled
+        HTTP client when one is given. Returns the same results as `search`.
+        """
+        async with http_session(http_client) as session:
+            async with session.get(self.ESEARCH_URL, params=self._esearch_params(max_results)) as response:
+                response.raise_for_status()
+                results = await response.json(content_type=None)
+
+            ids = results["esearchresult"]["idlist"]
+            if not ids:
+                return []
+            async with session.get(self.EFETCH_URL, params=self._efetch_params(ids)) as response:
+                response.raise_for_status()
+                xml_content = await response.read()
+
+        # Parsing the combined articles is CPU-bound, so it runs in a worker thread
+        return await asyncio.to_thread(self._search_results, ids, xml_content, max_results)
+
     def search(self, max_results=10):
         """
         Searches the query using the PubMed Central API.
@@ -43,8 +74,23 @@ class PubMedCentralSearch:
         Returns:
             A list of search results.
         """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-        params = {
+        response = requests.get(self.ESEARCH_URL, params=self._esearch_params(max_results))
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to retrieve data: {response.status_code} - {response.text}"
+            )
+
+        results = response.json()
+        ids = results["esearchresult"]["idlist"]
+        if not ids:
+            return []
+
+        # One EFetch for the whole id list instead of a round trip per article
+        return self._search_results(ids, self.fetch(ids), max_results)
+
+    def _esearch_params(self, max_results):
+        return {
             "db": "pmc",
             "term": f"{self.query} AND free fulltext[filter]",
             "retmax": max_results,
@@ -53,28 +99,35 @@ class PubMedCentralSearch:
             "retmode": "json",
             "sort": "relevance"
         }
-        response = requests.get(base_url, params=params)
 
-        if response.status_code != 200:
-            raise Exception(
-                f"Failed to retrieve data: {response.status_code} - {response.text}"
-            )
+    def _efetch_params(self, ids):
+        return {
+            "db": "pmc",
+            "id": ",".join(ids),
+            "retmode": "xml",
+            "api_key": self.api_key,
+        }
 
-        results = response.json()
-        ids = results["esearchresult"]["idlist"]
+    def _search_results(self, ids, xml_content, max_results):
+        """
+        Builds the search results from a batched EFetch response, in ESearch relevance order.
+        """
+        # EFetch returns the articles in request order, which identifies articles without a PMC id
+        articles = {
+            article_id or (ids[position] if position < len(ids) else None): article_data
+            for position, (article_id, article_data) in enumerate(self.iter_articles(xml_content))
+        }
 
         search_response = []
         for article_id in ids:
-            xml_content = self.fetch([article_id])
-            if self.has_body_content(xml_content):
-                article_data = self.parse_xml(xml_content)
-                if article_data:
-                    search_response.append(
-                        {
-                            "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
-                            "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
-                        }
-                    )
+            article_data = articles.get(article_id)
+            if article_data:
+                search_response.append(
+                    {
+                        "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
+                        "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
+                    }
+                )
 
             if len(search_response) >= max_results:
                 break
@@ -89,21 +142,40 @@ class PubMedCentralSearch:
         Returns:
             XML content of the articles.
         """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-        params = {
-            "db": "pmc",
-            "id": ",".join(ids),
-            "retmode": "xml",
-            "api_key": self.api_key,
-        }
-        response = requests.get(base_url, params=params)
+        response = requests.get(self.EFETCH_URL, params=self._efetch_params(ids))
 
         if response.status_code != 200:
             raise Exception(
                 f"Failed to retrieve data: {response.status_code} - {response.text}"
             )
 
-        return response.text
+        return response.content
+
+    def iter_articles(self, xml_content):
+        """
+        Streams the articles of an EFetch response, parsing each one once.
+        Args:
+            xml_content: XML content of one or more articles.
+        Yields:
+            Tuples of (article ID, article data), where article data is None when the
+            article has no body content.
+        """
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode("utf-8")
+
+        for _, elem in ET.iterparse(io.BytesIO(xml_content), events=("end",)):
+            if elem.tag != "article":
+                continue
+            yield self._article_id(elem), self._parse_article(elem)
+            # Drop the parsed article so memory stays flat across large responses
+            elem.clear()
+
+    @staticmethod
+    def _article_id(article):
+        for node in article.iterfind("front/article-meta/article-id"):
+            if node.get("pub-id-type") in ("pmc", "pmcid") and node.text:
+                return node.text.strip().removeprefix("PMC")
+        return None
 
     def has_body_content(self, xml_content):
         """
@@ -113,21 +185,16 @@ class PubMedCentralSearch:
         Returns:
             Boolean indicating presence of body content.
         """
-        root = ET.fromstring(xml_content)
-        ns = {
-            "mml": "http://www.w3.org/1998/Math/MathML",
-            "xlink": "http://www.w3.org/1999/xlink",
-        }
-        article = root.find("article", ns)
-        if article is None:
-            return False
+        article = ET.fromstring(xml_content).find("article", self.NAMESPACES)
+        return article is not None and self._has_body(article)
 
-        body_elem = article.find(".//body", namespaces=ns)
+    def _has_body(self, article):
+        body_elem = article.find(".//body", namespaces=self.NAMESPACES)
         if body_elem is not None:
             return True
         else:
-            for sec in article.findall(".//sec", namespaces=ns):
-                for p in sec.findall(".//p", namespaces=ns):
+            for sec in article.findall(".//sec", namespaces=self.NAMESPACES):
+                for p in sec.findall(".//p", namespaces=self.NAMESPACES):
                     if p.text:
                         return True
         return False
@@ -140,15 +207,21 @@ class PubMedCentralSearch:
         Returns:
             Dictionary containing title, abstract, and body text.
         """
-        root = ET.fromstring(xml_content)
-        ns = {
-            "mml": "http://www.w3.org/1998/Math/MathML",
-            "xlink": "http://www.w3.org/1999/xlink",
-        }
-
-        article = root.find("article", ns)
+        article = ET.fromstring(xml_content).find("article", self.NAMESPACES)
         if article is None:
             return None
+        return self._article_data(article)
+
+    def _parse_article(self, article):
+        """
+        Extracts title, abstract, and body from an article element that has body content.
+        """
+        if not self._has_body(article):
+            return None
+        return self._article_data(article)
+
+    def _article_data(self, article):
+        ns = self.NAMESPACES
 
         title = article.findtext(
             ".//title-group/article-title", default="", namespaces=ns
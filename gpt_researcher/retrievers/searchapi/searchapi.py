@@ -1,10 +1,16 @@
 # SearchApi Retriever
 
 # libraries
+import logging
 import os
+import aiohttp
 import requests
 import urllib.parse
 
+from ..utils import http_session
+
+logger = logging.getLogger(__name__)
+
 
 class SearchApiSearch():
     """
@@ -41,44 +47,71 @@ class SearchApiSearch():
         print("SearchApiSearch: Searching with query {0}...".format(self.query))
         """Useful for general internet search queries using SearchApi."""
 
+        search_response = []
+        try:
+            response = requests.get(self._url(), headers=self._headers(), timeout=20)
+            if response.status_code == 200:
+                search_response = self._parse_results(response.json(), max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
+
+    async def asearch(self, max_results=7, http_client=None):
+        """
+        Searches the query without blocking the event loop, over the research's pooled
+        HTTP client when one is given
+        Returns:
+
+        """
+        logger.info(f"SearchApiSearch: Searching with query {self.query}...")
+        search_response = []
+        try:
+            async with http_session(http_client) as session:
+                async with session.get(self._url(), headers=self._headers()) as response:
+                    response.raise_for_status()
+                    search_response = self._parse_results(await response.json(), max_results)
+        except aiohttp.ClientResponseError:
+            raise
+        except Exception as e:
+            logger.error(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
 
+    def _url(self) -> str:
         url = "https://www.searchapi.io/api/v1/search"
         params = {
             "q": self.query,
             "engine": "google",
         }
+        return url + "?" + urllib.parse.urlencode(params)
 
-        headers = {
+    def _headers(self) -> dict:
+        return {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}',
             'X-SearchApi-Source': 'gpt-researcher'
         }
 
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
+    @staticmethod
+    def _parse_results(search_results: dict, max_results: int) -> list:
         search_response = []
-
-        try:
-            response = requests.get(encoded_url, headers=headers, timeout=20)
-            if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
-        except Exception as e:
-            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
-            search_response = []
-
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
         return search_response
@@ -1,9 +1,12 @@
 import os
 import json
+import aiohttp
 import requests
 from typing import List, Dict
 from urllib.parse import urljoin
 
+from ..utils import http_session
+
 
 class SearxSearch():
     """
@@ -44,35 +47,64 @@ class SearxSearch():
         Returns:
             List of dictionaries containing search results
         """
-        search_url = urljoin(self.base_url, "search")
-        # TODO: Add support for query domains
-        params = {
-            # The search query. 
-            'q': self.query, 
-            # Output format of results. Format needs to be activated in searxng config.
-            'format': 'json'
-        }
-
         try:
             response = requests.get(
-                search_url,
-                params=params,
+                urljoin(self.base_url, "search"),
+                params=self._params(),
                 headers={'Accept': 'application/json'}
             )
             response.raise_for_status()
-            results = response.json()
+            return self._parse_results(response.json(), max_results)
 
-            # Normalize results to match the expected format
-            search_response = []
-            for result in results.get('results', [])[:max_results]:
-                search_response.append({
-                    "href": result.get('url', ''),
-                    "body": result.get('content', '')
-                })
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Error querying SearxNG: {str(e)}")
+        except json.JSONDecodeError:
+            raise Exception("Error parsing SearxNG response")
 
-            return search_response
+    async def asearch(self, max_results: int = 10, http_client=None) -> List[Dict[str, str]]:
+        """
+        Searches the query using SearxNG API without blocking the event loop
+        Args:
+            max_results: Maximum number of results to return
+            http_client: Pooled AsyncHTTPClient of the research session, if any
+        Returns:
+            List of dictionaries containing search results
+        """
+        try:
+            async with http_session(http_client) as session:
+                async with session.get(
+                    urljoin(self.base_url, "search"),
+                    params=self._params(),
+                    headers={'Accept': 'application/json'}
+                ) as response:
+                    response.raise_for_status()
+                    results = await response.json(content_type=None)
+            return self._parse_results(results, max_results)
 
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientResponseError:
+            raise
+        except aiohttp.ClientError as e:
             raise Exception(f"Error querying SearxNG: {str(e)}")
         except json.JSONDecodeError:
             raise Exception("Error parsing SearxNG response")
+
+    def _params(self) -> Dict[str, str]:
+        # TODO: Add support for query domains
+        return {
+            # The search query. 
+            'q': self.query, 
+            # Output format of results. Format needs to be activated in searxng config.
+            'format': 'json'
+        }
+
+    @staticmethod
+    def _parse_results(results: dict, max_results: int) -> List[Dict[str, str]]:
+        # Normalize results to match the expected format
+        search_response = []
+        for result in results.get('results', [])[:max_results]:
+            search_response.append({
+                "href": result.get('url', ''),
+                "body": result.get('content', '')
+            })
+
+        return search_response
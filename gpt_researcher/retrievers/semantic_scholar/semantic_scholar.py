@@ -1,7 +1,13 @@
+import logging
 from typing import Dict, List
 
+import aiohttp
 import requests
 
+from ..utils import http_session
+
+logger = logging.getLogger(__name__)
+
 
 class SemanticScholarSearch:
     """
@@ -29,21 +35,47 @@ class SemanticScholarSearch:
         :param max_results: Maximum number of results to retrieve
         :return: List of dictionaries containing title, href, and body of each paper
         """
-        params = {
-            "query": self.query,
-            "limit": max_results,
-            "fields": "title,abstract,url,venue,year,authors,isOpenAccess,openAccessPdf",
-            "sort": self.sort,
-        }
-
         try:
-            response = requests.get(self.BASE_URL, params=params)
+            response = requests.get(self.BASE_URL, params=self._params(max_results))
             response.raise_for_status()
         except requests.RequestException as e:
             print(f"An error occurred while accessing Semantic Scholar API: {e}")
             return []
 
-        results = response.json().get("data", [])
+        return self._parse_results(response.json())
+
+    async def asearch(self, max_results: int = 20, http_client=None) -> List[Dict[str, str]]:
+        """
+        Perform the search on Semantic Scholar without blocking the event loop.
+
+        :param max_results: Maximum number of results to retrieve
+        :param http_client: Pooled AsyncHTTPClient of the research session, if any
+        :return: List of dictionaries containing title, href, and body of each paper
+        """
+        try:
+            async with http_session(http_client) as session:
+                async with session.get(self.BASE_URL, params=self._params(max_results)) as response:
+                    response.raise_for_status()
+                    data = await response.json()
+        except aiohttp.ClientResponseError:
+            raise
+        except aiohttp.ClientError as e:
+            logger.error(f"An error occurred while accessing Semantic Scholar API: {e}")
+            return []
+
+        return self._parse_results(data)
+
+    def _params(self, max_results: int) -> Dict[str, str]:
+        return {
+            "query": self.query,
+            "limit": max_results,
+            "fields": "title,abstract,url,venue,year,authors,isOpenAccess,openAccessPdf",
+            "sort": self.sort,
+        }
+
+    @staticmethod
+    def _parse_results(data: dict) -> List[Dict[str, str]]:
+        results = data.get("data", [])
         search_result = []
 
         for result in results:
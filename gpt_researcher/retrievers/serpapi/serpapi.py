@@ -1,10 +1,16 @@
 # SerpApi Retriever
 
 # libraries
+import logging
 import os
+import aiohttp
 import requests
 import urllib.parse
 
+from ..utils import http_session
+
+logger = logging.getLogger(__name__)
+
 
 class SerpApiSearch():
     """
@@ -42,6 +48,40 @@ class SerpApiSearch():
         print("SerpApiSearch: Searching with query {0}...".format(self.query))
         """Useful for general internet search queries using SerpApi."""
 
+        search_response = []
+        try:
+            response = requests.get(self._url(), timeout=10)
+            if response.status_code == 200:
+                search_response = self._parse_results(response.json(), max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
+
+    async def asearch(self, max_results=7, http_client=None):
+        """
+        Searches the query without blocking the event loop, over the research's pooled
+        HTTP client when one is given
+        Returns:
+
+        """
+        logger.info(f"SerpApiSearch: Searching with query {self.query}...")
+        search_response = []
+        try:
+            async with http_session(http_client) as session:
+                async with session.get(self._url()) as response:
+                    response.raise_for_status()
+                    search_response = self._parse_results(await response.json(), max_results)
+        except aiohttp.ClientResponseError:
+            raise
+        except Exception as e:
+            logger.error(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
+
+    def _url(self) -> str:
         url = "https://serpapi.com/search.json"
 
         search_query = self.query
@@ -53,30 +93,25 @@ class SerpApiSearch():
             "q": search_query,
             "api_key": self.api_key
         }
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
-        search_response = []
-        try:
-            response = requests.get(encoded_url, timeout=10)
-            if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
-        except Exception as e:
-            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
-            search_response = []
+        return url + "?" + urllib.parse.urlencode(params)
 
+    @staticmethod
+    def _parse_results(search_results: dict, max_results: int) -> list:
+        search_response = []
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
         return search_response
@@ -1,15 +1,23 @@
 # Google Serper Retriever
 
 # libraries
+import logging
 import os
 import requests
 import json
 
+from ..utils import http_session
+
+logger = logging.getLogger(__name__)
+
 
 class SerperSearch():
     """
     Google Serper Retriever
     """
+
+    base_url = "https://google.serper.dev/search"
+
     def __init__(self, query, query_domains=None):
         """
         Initializes the SerperSearch object
@@ -44,23 +52,42 @@ class SerperSearch():
         """Useful for general internet search queries using the Serp API."""
 
         # Search the query (see https://serper.dev/playground for the format)
-        url = "https://google.serper.dev/search"
+        resp = requests.request(
+            "POST", self.base_url, timeout=10, headers=self._headers(), data=self._data(max_results)
+        )
 
-        headers = {
+        # Preprocess the results
+        if resp is None:
+            return
+        return self._parse_results(resp.text)
+
+    async def asearch(self, max_results=7, http_client=None):
+        """
+        Searches the query without blocking the event loop, over the research's pooled
+        HTTP client when one is given
+        Returns:
+
+        """
+        logger.info(f"Searching with query {self.query}...")
+        async with http_session(http_client) as session:
+            async with session.post(self.base_url, headers=self._headers(), data=self._data(max_results)) as resp:
+                resp.raise_for_status()
+                text = await resp.text()
+        return self._parse_results(text)
+
+    def _headers(self) -> dict:
+        return {
             'X-API-KEY': self.api_key,
             'Content-Type': 'application/json'
         }
 
+    def _data(self, max_results: int) -> str:
         # TODO: Add support for query domains
-        data = json.dumps({"q": self.query, "num": max_results})
+        return json.dumps({"q": self.query, "num": max_results})
 
-        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
-
-        # Preprocess the results
-        if resp is None:
-            return
+    def _parse_results(self, text: str):
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return
         if search_results is None:
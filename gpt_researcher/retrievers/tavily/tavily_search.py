@@ -1,17 +1,28 @@
 # Tavily API Retriever
 
 # libraries
+import logging
 import os
 from typing import Literal, Sequence, Optional
+import aiohttp
 import requests
 import json
 
+from ..utils import http_session
+
+logger = logging.getLogger(__name__)
+
 
 class TavilySearch:
     """
     Tavily API Retriever
     """
 
+    # Search results can carry the full page text, so their URLs need not be scraped
+    returns_full_content = True
+    # Search results can carry image URLs, standing in for the images a scrape would find
+    returns_images = True
+
     def __init__(self, query, headers=None, topic="general", query_domains=None):
         """
         Initializes the TavilySearch object.
@@ -68,7 +79,48 @@ class TavilySearch:
         Internal search method to send the request to the API.
         """
 
-        data = {
+        data = self._request_data(
+            query, search_depth, topic, days, max_results, include_domains, exclude_domains,
+            include_answer, include_raw_content, include_images, use_cache,
+        )
+
+        response = requests.post(
+            self.base_url, data=json.dumps(data), headers=self.headers, timeout=100
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            # Raises a HTTPError if the HTTP request returned an unsuccessful status code
+            response.raise_for_status()
+
+    async def _asearch(self, query: str, http_client=None, **options) -> dict:
+        """
+        Internal search method to send the request to the API without blocking the event loop.
+        """
+        async with http_session(http_client) as session:
+            async with session.post(
+                self.base_url, json=self._request_data(query, **options), headers=self.headers
+            ) as response:
+                # Raises a ClientResponseError if the HTTP request returned an unsuccessful status code
+                response.raise_for_status()
+                return await response.json()
+
+    def _request_data(
+        self,
+        query: str,
+        search_depth: Literal["basic", "advanced"] = "basic",
+        topic: str = "general",
+        days: int = 2,
+        max_results: int = 10,
+        include_domains: Sequence[str] = None,
+        exclude_domains: Sequence[str] = None,
+        include_answer: bool = False,
+        include_raw_content: bool = False,
+        include_images: bool = False,
+        use_cache: bool = True,
+    ) -> dict:
+        return {
             "query": query,
             "search_depth": search_depth,
             "topic": topic,
@@ -83,39 +135,88 @@ class TavilySearch:
             "use_cache": use_cache,
         }
 
-        response = requests.post(
-            self.base_url, data=json.dumps(data), headers=self.headers, timeout=100
-        )
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            # Raises a HTTPError if the HTTP request returned an unsuccessful status code
-            response.raise_for_status()
-
-    def search(self, max_results=10):
+    def search(self, max_results=10, include_raw_content=False, include_images=False):
         """
         Searches the query
+        Args:
+            max_results (int): Maximum number of results.
+            include_raw_content (bool): Also return the full text of each page in `raw_content`.
+            include_images (bool): Also return image URLs in `images`.
         Returns:
 
         """
         try:
             # Search the query
             results = self._search(
-                self.query,
-                search_depth="basic",
-                max_results=max_results,
-                topic=self.topic,
-                include_domains=self.query_domains,
+                self.query, **self._search_options(max_results, include_raw_content, include_images)
             )
-            sources = results.get("results", [])
-            if not sources:
-                raise Exception("No results found with Tavily API search.")
-            # Return the results
-            search_response = [
-                {"href": obj["url"], "body": obj["content"]} for obj in sources
-            ]
+            search_response = self._parse_results(results, include_raw_content, include_images)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
         return search_response
+
+    async def asearch(self, max_results=10, include_raw_content=False, include_images=False, http_client=None):
+        """
+        Searches the query without blocking the event loop
+        Args:
+            max_results (int): Maximum number of results.
+            include_raw_content (bool): Also return the full text of each page in `raw_content`.
+            include_images (bool): Also return image URLs in `images`.
+            http_client (AsyncHTTPClient, optional): Pooled client of the research session.
+        Returns:
+
+        """
+        try:
+            results = await self._asearch(
+                self.query,
+                http_client,
+                **self._search_options(max_results, include_raw_content, include_images),
+            )
+            search_response = self._parse_results(results, include_raw_content, include_images)
+        except aiohttp.ClientResponseError:
+            raise
+        except Exception as e:
+            logger.error(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+        return search_response
+
+    def _search_options(self, max_results: int, include_raw_content: bool, include_images: bool) -> dict:
+        return {
+            "search_depth": "basic",
+            "max_results": max_results,
+            "topic": self.topic,
+            "include_domains": self.query_domains,
+            "include_raw_content": include_raw_content,
+            "include_images": include_images,
+        }
+
+    @staticmethod
+    def _parse_results(results: dict, include_raw_content: bool, include_images: bool = False) -> list:
+        sources = results.get("results", [])
+        if not sources:
+            raise Exception("No results found with Tavily API search.")
+        # Return the results
+        search_response = [
+            {"href": obj["url"], "body": obj["content"]} for obj in sources
+        ]
+        if include_raw_content:
+            for result, obj in zip(search_response, sources):
+                result["title"] = obj.get("title", "")
+                result["raw_content"] = obj.get("raw_content")
+        if include_images:
+            for result, obj in zip(search_response, sources):
+                result["images"] = TavilySearch._image_urls(obj.get("images"))
+            # Images of the query as a whole go with the best matching result
+            search_response[0]["images"].extend(TavilySearch._image_urls(results.get("images")))
+        return search_response
+
+    @staticmethod
+    def _image_urls(images) -> list:
+        """Image URLs of a Tavily response, which lists them as URLs or as {url, description}"""
+        urls = []
+        for image in images or []:
+            url = image.get("url") if isinstance(image, dict) else image
+            if isinstance(url, str) and url.startswith(("http://", "https://")):
+                urls.append(url)
+        return urls
@@ -1,7 +1,14 @@
+import asyncio
 import importlib.util
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import aiohttp
+
+from ..utils.urls import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -93,3 +100,141 @@ def get_all_retriever_names():
     except Exception as e:
         logger.error(f"Error getting retrievers: {e}")
         return VALID_RETRIEVERS
+
+# Retriever content shorter than this is treated like a failed scrape and the URL is scraped
+MIN_FULL_CONTENT_LENGTH = 100
+
+
+def normalize_search_result(result: dict, full_content: bool = False) -> dict | None:
+    """
+    Normalize a retriever result to the `href` shape used by the research pipeline.
+
+    Args:
+        result (dict): A single search result. Either `href` or `url` holds the link.
+        full_content (bool): Whether the retriever returns full page text in `raw_content`.
+            Otherwise any `raw_content` is dropped.
+
+    Returns:
+        dict | None: The result with `href` set, or None when it has no link.
+    """
+    href = result.get("href") or result.get("url")
+    if not href:
+        return None
+    normalized = {**result, "href": href}
+    normalized.pop("url", None)
+    raw_content = normalized.get("raw_content")
+    if not full_content or not isinstance(raw_content, str) or len(raw_content) < MIN_FULL_CONTENT_LENGTH:
+        normalized.pop("raw_content", None)
+    return normalized
+
+
+def search_options(retriever_class) -> dict:
+    """
+    The options every research search passes to a retriever, besides `max_results`.
+
+    Planning and sub-query searches use the same options so a repeated query is served
+    from the same search cache entry.
+    """
+    options = {}
+    if getattr(retriever_class, "returns_full_content", False):
+        options["include_raw_content"] = True
+        # Pages that are not scraped only have the images the retriever returns
+        if getattr(retriever_class, "returns_images", False):
+            options["include_images"] = True
+    return options
+
+
+# Score of retriever images among scraped ones, which score 0 to 4 by their page markup
+RETRIEVER_IMAGE_SCORE = 2
+
+
+def search_result_to_page(result: dict) -> dict:
+    """
+    Convert a normalized full-content search result to the scraped page shape.
+
+    Image URLs the retriever returned in `images` become the page's `image_urls`.
+    """
+    return {
+        "url": result["href"],
+        "raw_content": result["raw_content"],
+        "image_urls": [
+            {"url": url, "score": RETRIEVER_IMAGE_SCORE} for url in result.get("images") or []
+        ],
+        "title": result.get("title") or "",
+    }
+
+
+def reciprocal_rank_fusion(ranked_lists: list[list[dict]], k: int = 60) -> list[dict]:
+    """
+    Merge the ranked results of several retrievers with reciprocal-rank fusion.
+
+    A result scores 1 / (k + rank) in every list it appears in, and results are matched
+    across lists by canonical URL. Pages ranked well by several retrievers rise to the
+    top, while no retriever's scores need to be comparable with another's.
+
+    Args:
+        ranked_lists (list[list[dict]]): Normalized results of each retriever, best first.
+        k (int): Damping constant; larger values flatten the advantage of top ranks.
+
+    Returns:
+        list[dict]: One result per page, best fused score first. When retrievers return
+        the same page, the result carrying `raw_content` is kept.
+    """
+    scores: dict[str, float] = {}
+    best: dict[str, dict] = {}
+    for results in ranked_lists:
+        seen = set()
+        for rank, result in enumerate(results, start=1):
+            key = canonicalize_url(result["href"])
+            if key in seen:
+                continue
+            seen.add(key)
+            scores[key] = scores.get(key, 0.0) + 1 / (k + rank)
+            if key not in best or ("raw_content" in result and "raw_content" not in best[key]):
+                best[key] = result
+    # sorted is stable, so ties keep the configured retriever order
+    return [best[key] for key in sorted(scores, key=scores.get, reverse=True)]
+
+
+@asynccontextmanager
+async def http_session(http_client=None) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Yield the pooled session of the research's AsyncHTTPClient, or a short-lived session
+    when the retriever is used on its own.
+
+    Retrievers let HTTP errors of the session propagate instead of returning no results,
+    so the caller's rate limiter sees the status and backs off on 429s and 5xx.
+    """
+    if http_client is not None:
+        yield http_client.get_session()
+        return
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+async def run_search(
+    retriever,
+    max_results: int | None = None,
+    http_client=None,
+    rate_limiter=None,
+    timeout: float | None = None,
+    **options,
+) -> Any:
+    """
+    Run a retriever's search without blocking the event loop.
+
+    Retrievers implementing `asearch` are awaited over the shared HTTP client. Others
+    fall back to their synchronous `search` in a worker thread. With a `rate_limiter`,
+    the search first waits for the retriever's rate limit, and the `timeout` only
+    starts once it may run.
+    """
+    if max_results is not None:
+        options["max_results"] = max_results
+    if rate_limiter is not None:
+        async with rate_limiter.limit():
+            return await run_search(retriever, http_client=http_client, timeout=timeout, **options)
+    if hasattr(retriever, "asearch"):
+        search = retriever.asearch(http_client=http_client, **options)
+    else:
+        search = asyncio.to_thread(retriever.search, **options)
+    return await asyncio.wait_for(search, timeout=timeout)
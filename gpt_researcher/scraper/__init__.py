@@ -6,6 +6,7 @@ from .browser.browser import BrowserScraper
 from .browser.nodriver_scraper import NoDriverScraper
 from .tavily_extract.tavily_extract import TavilyExtract
 from .firecrawl.firecrawl import FireCrawl
+from .tiered.tiered import TieredScraper
 from .scraper import Scraper
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "TavilyExtract",
     "Scraper",
     "FireCrawl",
+    "TieredScraper",
 ]
@@ -1,19 +1,27 @@
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import asyncio
 
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..cache import get_validators, read_body
+from ..extraction import get_html_extractor
+from ..utils import extract_html
 
 class BeautifulSoupScraper:
 
-    def __init__(self, link, session=None):
+    # Session-wide resources the Scraper passes in as keyword arguments
+    shared_resources = ("http_client", "extractor")
+
+    def __init__(self, link, session=None, http_client=None, extractor=None):
         self.link = link
         self.session = session
+        self.http_client = http_client
+        self.extractor = extractor or get_html_extractor()
+        # ETag / Last-Modified of the response, used by the page cache
+        self.validators = {}
 
     def scrape(self):
         """
         This function scrapes content from a webpage by making a GET request, parsing the HTML using
         BeautifulSoup, and extracting script and style elements before returning the cleaned content.
-        
+
         Returns:
           The `scrape` method is returning the cleaned and extracted content from the webpage specified
         by the `self.link` attribute. The method fetches the webpage content, removes script and style
@@ -22,21 +30,33 @@ class BeautifulSoupScraper:
         """
         try:
             response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
+            self.validators = get_validators(response.headers)
+            html = self.extractor.truncate(response.content, self.link)
+            return extract_html(html, self.link, response.encoding)
 
-            soup = clean_soup(soup)
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
 
-            content = get_text_from_soup(soup)
+    async def scrape_async(self):
+        """
+        Fetches the page on the shared connection pool of the research session, then hands
+        the bytes to the HTML extractor once they have arrived.
 
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
+        Falls back to the blocking `scrape` when no http client was provided.
+        """
+        if self.http_client is None:
+            return await asyncio.to_thread(self.scrape)
 
-            return content, image_urls, title
+        try:
+            async with self.http_client.get_session().get(
+                self.link, timeout=self.http_client.page_timeout
+            ) as response:
+                body = await read_body(response, self.extractor.max_bytes)
+                encoding = response.charset
+                self.validators = get_validators(response.headers)
+            return await self.extractor.extract(body, self.link, encoding)
 
         except Exception as e:
             print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+            return "", [], ""
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
+import atexit
+import threading
 import traceback
-import pickle
+from functools import partial
 from pathlib import Path
 from sys import platform
 import time
-import random
-import string
-import os
 
 from bs4 import BeautifulSoup
 from typing import Iterable, cast
@@ -18,10 +17,22 @@ from .processing.scrape_skills import (scrape_pdf_with_pymupdf,
 from urllib.parse import urljoin
 
 from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from .driver_pool import WebDriverPool
 
 FILE_DIR = Path(__file__).parent.parent
 
 class BrowserScraper:
+    # Warm drivers are shared by every BrowserScraper in the process that uses the same
+    # browser, headless mode and user agent. Research sessions set the size of the pools
+    # from BROWSER_MAX_DRIVERS when they open.
+    max_drivers = 3
+    max_pages_per_driver = 20
+    driver_acquire_timeout = 120
+    _pools: dict[tuple, WebDriverPool] = {}
+    _pool_lock = threading.Lock()
+    # Research sessions using the pool; the drivers are quit once the last one ends
+    _sessions = 0
+
     def __init__(self, url: str, session=None):
         self.url = url
         self.session = session
@@ -33,7 +44,6 @@ class BrowserScraper:
         self.driver = None
         self.use_browser_cookies = False
         self._import_selenium()  # Import only if used to avoid unnecessary dependencies
-        self.cookie_filename = f"{self._generate_random_string(8)}.pkl"
 
     def scrape(self) -> tuple:
         if not self.url:
@@ -41,22 +51,68 @@ class BrowserScraper:
             return "A URL was not specified, cancelling request to browse website.", [], ""
 
         try:
-            self.setup_driver()
-            self._visit_google_and_save_cookies()
-            self._load_saved_cookies()
-            self._add_header()
-
-            text, image_urls, title = self.scrape_text_with_selenium()
-            return text, image_urls, title
+            pool = self._get_pool()
+            with pool.driver(timeout=self.driver_acquire_timeout) as driver:
+                self.driver = driver
+                # The pool wipes cookies between pages, so they are loaded for every page
+                if self.use_browser_cookies:
+                    self._load_browser_cookies(driver)
+                self._add_header()
+
+                text, image_urls, title = self.scrape_text_with_selenium()
+                return text, image_urls, title
         except Exception as e:
             print(f"An error occurred during scraping: {str(e)}")
             print("Full stack trace:")
             print(traceback.format_exc())
             return f"An error occurred: {str(e)}\n\nStack trace:\n{traceback.format_exc()}", [], ""
         finally:
-            if self.driver:
-                self.driver.quit()
-            self._cleanup_cookie_file()
+            # The pool owns the driver and resets it for the next page
+            self.driver = None
+
+    def _get_pool(self) -> WebDriverPool:
+        # Drivers are built from these options, not from the scraper that created the pool
+        options = (self.selenium_web_browser, self.headless, self.user_agent)
+        with BrowserScraper._pool_lock:
+            if options not in BrowserScraper._pools:
+                BrowserScraper._pools[options] = WebDriverPool(
+                    partial(self._create_driver, *options),
+                    max_drivers=self.max_drivers,
+                    max_pages_per_driver=self.max_pages_per_driver,
+                )
+            return BrowserScraper._pools[options]
+
+    @classmethod
+    def open_session(cls, max_drivers: int | None = None) -> None:
+        """
+        Register a research session, so the pool outlives other sessions ending.
+
+        Args:
+            max_drivers: Number of warm drivers each pool may hold, applied to the running pools too
+        """
+        with cls._pool_lock:
+            cls._sessions += 1
+            if max_drivers:
+                cls.max_drivers = max_drivers
+                for pool in cls._pools.values():
+                    pool.resize(max_drivers)
+
+    @classmethod
+    def close_session(cls) -> None:
+        """End a research session; the pooled drivers are quit when no other session uses them"""
+        with cls._pool_lock:
+            cls._sessions = max(0, cls._sessions - 1)
+            if cls._sessions:
+                return
+        cls.shutdown_pool()
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """Quit the pooled drivers"""
+        with cls._pool_lock:
+            pools, cls._pools = list(cls._pools.values()), {}
+        for pool in pools:
+            pool.shutdown()
 
     def _import_selenium(self):
         try:
@@ -80,8 +136,9 @@ class BrowserScraper:
             raise ImportError(
                 "Selenium is required but not installed. See error message above for installation instructions.") from e
 
-    def setup_driver(self) -> None:
-        # print(f"Setting up {self.selenium_web_browser} driver...")
+    @staticmethod
+    def _create_driver(selenium_web_browser: str, headless: bool, user_agent: str):
+        # print(f"Setting up {selenium_web_browser} driver...")
 
         options_available = {
             "chrome": ChromeOptions,
@@ -89,47 +146,37 @@ class BrowserScraper:
             "safari": SafariOptions,
         }
 
-        options = options_available[self.selenium_web_browser]()
-        options.add_argument(f"user-agent={self.user_agent}")
-        if self.headless:
+        options = options_available[selenium_web_browser]()
+        options.add_argument(f"user-agent={user_agent}")
+        if headless:
             options.add_argument("--headless")
         options.add_argument("--enable-javascript")
 
         try:
-            if self.selenium_web_browser == "firefox":
-                self.driver = webdriver.Firefox(options=options)
-            elif self.selenium_web_browser == "safari":
-                self.driver = webdriver.Safari(options=options)
+            if selenium_web_browser == "firefox":
+                driver = webdriver.Firefox(options=options)
+            elif selenium_web_browser == "safari":
+                driver = webdriver.Safari(options=options)
             else:  # chrome
                 if platform == "linux" or platform == "linux2":
                     options.add_argument("--disable-dev-shm-usage")
-                    options.add_argument("--remote-debugging-port=9222")
+                    # Let each pooled Chrome pick a free debugging port
+                    options.add_argument("--remote-debugging-port=0")
                 options.add_argument("--no-sandbox")
                 options.add_experimental_option("prefs", {"download_restrictions": 3})
-                self.driver = webdriver.Chrome(options=options)
+                driver = webdriver.Chrome(options=options)
 
-            if self.use_browser_cookies:
-                self._load_browser_cookies()
-
-            # print(f"{self.selenium_web_browser.capitalize()} driver set up successfully.")
+            # print(f"{selenium_web_browser.capitalize()} driver set up successfully.")
+            return driver
         except Exception as e:
-            print(f"Failed to set up {self.selenium_web_browser} driver: {str(e)}")
+            print(f"Failed to set up {selenium_web_browser} driver: {str(e)}")
             print("Full stack trace:")
             print(traceback.format_exc())
             raise
 
-    def _load_saved_cookies(self):
-        """Load saved cookies before visiting the target URL"""
-        cookie_file = Path(self.cookie_filename)
-        if cookie_file.exists():
-            cookies = pickle.load(open(self.cookie_filename, "rb"))
-            for cookie in cookies:
-                self.driver.add_cookie(cookie)
-        else:
-            print("No saved cookies found.")
-
-    def _load_browser_cookies(self):
+    def _load_browser_cookies(self, driver=None):
         """Load cookies directly from the browser"""
+        driver = driver or self.driver
         try:
             import browser_cookie3
         except ImportError:
@@ -147,22 +194,7 @@ class BrowserScraper:
             return
 
         for cookie in cookies:
-            self.driver.add_cookie({'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain})
-
-    def _cleanup_cookie_file(self):
-        """Remove the cookie file"""
-        cookie_file = Path(self.cookie_filename)
-        if cookie_file.exists():
-            try:
-                os.remove(self.cookie_filename)
-            except Exception as e:
-                print(f"Failed to remove cookie file: {str(e)}")
-        else:
-            print("No cookie file found to remove.")
-
-    def _generate_random_string(self, length):
-        """Generate a random string of specified length"""
-        return "".join(random.choices(string.ascii_letters + string.digits, k=length))
+            driver.add_cookie({'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain})
 
     def _get_domain(self):
         """Extract domain from URL"""
@@ -172,22 +204,6 @@ class BrowserScraper:
         domain = urlparse(self.url).netloc
         return domain[4:] if domain.startswith("www.") else domain
 
-    def _visit_google_and_save_cookies(self):
-        """Visit Google and save cookies before navigating to the target URL"""
-        try:
-            self.driver.get("https://www.google.com")
-            time.sleep(2)  # Wait for cookies to be set
-
-            # Save cookies to a file
-            cookies = self.driver.get_cookies()
-            pickle.dump(cookies, open(self.cookie_filename, "wb"))
-
-            # print("Google cookies saved successfully.")
-        except Exception as e:
-            print(f"Failed to visit Google and save cookies: {str(e)}")
-            print("Full stack trace:")
-            print(traceback.format_exc())
-
     def scrape_text_with_selenium(self) -> tuple:
         self.driver.get(self.url)
 
@@ -243,3 +259,7 @@ class BrowserScraper:
     def _add_header(self) -> None:
         """Add a header to the website"""
         self.driver.execute_script(open(f"{FILE_DIR}/browser/js/overlay.js", "r").read())
+
+
+# Drivers used outside of a research session are quit at exit
+atexit.register(BrowserScraper.shutdown_pool)
@@ -0,0 +1,147 @@
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PooledDriver:
+    """A WebDriver checked out of a WebDriverPool, with the number of pages it has served"""
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.pages = 0
+
+
+class WebDriverPool:
+    """
+    Bounded, thread-safe pool of warm Selenium WebDriver instances.
+
+    Drivers are started lazily up to `max_drivers`; further callers wait for one to be
+    released. Between pages a driver's cookies, storage and extra windows are reset.
+    Drivers that fail a health check or have served `max_pages_per_driver` pages are
+    quit and replaced.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_drivers: int = 3, max_pages_per_driver: int = 20):
+        self.factory = factory
+        self.max_drivers = max_drivers
+        self.max_pages_per_driver = max_pages_per_driver
+        self._idle: List[PooledDriver] = []
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """Check out a healthy driver, starting one if the pool is not full"""
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("WebDriver pool is shut down")
+                if not self._condition.wait_for(
+                    lambda: self._idle or self._size < self.max_drivers or self._closed, timeout
+                ):
+                    raise TimeoutError("Timed out waiting for a WebDriver")
+                if self._closed:
+                    raise RuntimeError("WebDriver pool is shut down")
+                pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    # Reserve the slot, then start the driver outside the lock
+                    self._size += 1
+
+            if pooled is None:
+                try:
+                    return PooledDriver(self.factory())
+                except Exception:
+                    self._discard_slot()
+                    raise
+            if self._is_healthy(pooled):
+                return pooled
+            self._quit(pooled)
+
+    def release(self, pooled: PooledDriver, healthy: bool = True) -> None:
+        """Return a driver to the pool, recycling it if it is worn out or broken"""
+        pooled.pages += 1
+        recycle = (
+            not healthy
+            or self._closed
+            or self._size > self.max_drivers
+            or pooled.pages >= self.max_pages_per_driver
+            or not self._reset(pooled)
+        )
+        if recycle:
+            self._quit(pooled)
+            return
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """Context manager yielding a pooled driver; marks it unhealthy if the block raises"""
+        pooled = self.acquire(timeout)
+        healthy = True
+        try:
+            yield pooled.driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.release(pooled, healthy)
+
+    def resize(self, max_drivers: int) -> None:
+        """Change the number of drivers; drivers over the new limit are quit once idle"""
+        with self._condition:
+            self.max_drivers = max_drivers
+            excess = self._idle[:max(0, self._size - max_drivers)]
+            del self._idle[:len(excess)]
+            self._condition.notify_all()
+        for pooled in excess:
+            self._quit(pooled)
+
+    def shutdown(self) -> None:
+        """Quit idle drivers; drivers still in use are quit when they are released"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
+
+    @staticmethod
+    def _is_healthy(pooled: PooledDriver) -> bool:
+        try:
+            pooled.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(pooled: PooledDriver) -> bool:
+        """Clear per-page state so the next page starts clean"""
+        driver = pooled.driver
+        try:
+            for handle in driver.window_handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            return True
+        except Exception as e:
+            logger.debug(f"Failed to reset WebDriver, recycling it: {e}")
+            return False
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Failed to quit WebDriver: {e}")
+        self._discard_slot()
+
+    def _discard_slot(self) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
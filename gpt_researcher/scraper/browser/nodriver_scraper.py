@@ -1,16 +1,16 @@
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 import math
 from pathlib import Path
 import random
+import time
 import traceback
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
 from typing import Dict, Literal, cast, Tuple, List
 import requests
 import asyncio
 import logging
 
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..extraction import HTMLExtractor, get_html_extractor
 
 
 class NoDriverScraper:
@@ -19,6 +19,19 @@ class NoDriverScraper:
     browser_load_threshold = 5
     browsers: set["NoDriverScraper.Browser"] = set()
     browsers_lock = asyncio.Lock()
+    # Performance mode: tabs kept open and reused per browser
+    max_tabs_per_browser = 5
+    # Performance mode: pages whose DOM already holds this much text are not scrolled
+    skip_scroll_text_threshold = 2000
+    # Performance mode: requests blocked at the CDP level (images, fonts, media, trackers)
+    blocked_url_patterns = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        "*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m3u8",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*facebook.net*", "*hotjar.com*", "*segment.io*",
+        "*scorecardresearch.com*", "*adservice.google.*",
+    ]
 
     @staticmethod
     def get_domain(url: str) -> str:
@@ -41,10 +54,22 @@ class NoDriverScraper:
             self.tab_mode = True
             self.max_scroll_percent = 500
             self.stopping = False
+            self.pooled_tabs: set["zendriver.Tab"] = set()
+            # Pooled tabs still being opened, counted so concurrent callers don't overshoot
+            self.reserved_tabs = 0
+            self.idle_tabs: asyncio.Queue["zendriver.Tab"] = asyncio.Queue()
 
-        async def get(self, url: str) -> "zendriver.Tab":
+        async def get(self, url: str, reuse_tab: bool = False) -> "zendriver.Tab":
             self.processing_count += 1
             try:
+                if reuse_tab:
+                    tab = await self.acquire_tab()
+                    try:
+                        async with self.rate_limit_for_domain(url):
+                            return await tab.get(url)
+                    except Exception:
+                        self.idle_tabs.put_nowait(tab)
+                        raise
                 async with self.rate_limit_for_domain(url):
                     new_window = not self.has_blank_page
                     self.has_blank_page = False
@@ -56,6 +81,34 @@ class NoDriverScraper:
                 self.processing_count -= 1
                 raise
 
+        async def acquire_tab(self) -> "zendriver.Tab":
+            """Take an idle pooled tab, opening a new one while the browser has fewer than the maximum"""
+            open_tabs = len(self.pooled_tabs) + self.reserved_tabs
+            if self.idle_tabs.empty() and open_tabs < NoDriverScraper.max_tabs_per_browser:
+                self.reserved_tabs += 1
+                try:
+                    new_tab = not self.has_blank_page
+                    self.has_blank_page = False
+                    tab = await self.driver.get("about:blank", new_tab=new_tab)
+                    await self.block_resources(tab)
+                finally:
+                    self.reserved_tabs -= 1
+                self.pooled_tabs.add(tab)
+                return tab
+            return await self.idle_tabs.get()
+
+        async def block_resources(self, tab: "zendriver.Tab"):
+            """Stop the tab from loading images, fonts, media and trackers"""
+            try:
+                import zendriver
+
+                await tab.send(zendriver.cdp.network.enable())
+                await tab.send(
+                    zendriver.cdp.network.set_blocked_ur_ls(urls=NoDriverScraper.blocked_url_patterns)
+                )
+            except Exception as e:
+                NoDriverScraper.logger.warning(f"Failed to enable resource blocking: {e}")
+
         async def scroll_page_to_bottom(self, page: "zendriver.Tab"):
             total_scroll_percent = 0
             while True:
@@ -98,9 +151,15 @@ class NoDriverScraper:
 
         async def close_page(self, page: "zendriver.Tab"):
             try:
-                await page.close()
+                if page in self.pooled_tabs:
+                    # Keep the tab for the next page instead of closing it
+                    await page.get("about:blank")
+                    self.idle_tabs.put_nowait(page)
+                else:
+                    await page.close()
             except Exception as e:
                 NoDriverScraper.logger.error(f"Failed to close page: {e}")
+                self.pooled_tabs.discard(page)
             finally:
                 self.processing_count -= 1
 
@@ -174,7 +233,8 @@ class NoDriverScraper:
     @classmethod
     async def release_browser(cls, browser: Browser):
         async with cls.browsers_lock:
-            if browser and browser.processing_count <= 0:
+            # Browsers with pooled tabs stay warm until stop_idle_browsers
+            if browser and browser.processing_count <= 0 and not browser.pooled_tabs:
                 try:
                     await browser.stop()
                 except Exception as e:
@@ -182,10 +242,42 @@ class NoDriverScraper:
                 finally:
                     cls.browsers.discard(browser)
 
-    def __init__(self, url: str, session: requests.Session | None = None):
+    @classmethod
+    async def stop_idle_browsers(cls):
+        """Stop the browsers kept warm for tab reuse that no scrape is using"""
+        async with cls.browsers_lock:
+            # Browsers other researchers are scraping with are left running
+            browsers = {
+                browser for browser in cls.browsers
+                if browser.processing_count <= 0 and browser.pooled_tabs
+            }
+            cls.browsers -= browsers
+        for browser in browsers:
+            try:
+                await browser.stop()
+            except Exception as e:
+                NoDriverScraper.logger.error(f"Failed to stop browser: {e}")
+
+    # Session-wide resources the Scraper passes in as keyword arguments
+    shared_resources = ("extractor", "browser_performance_mode", "browser_timings")
+
+    def __init__(
+        self,
+        url: str,
+        session: requests.Session | None = None,
+        extractor: HTMLExtractor | None = None,
+        browser_performance_mode: bool = False,
+        browser_timings: Dict[str, List[float]] | None = None,
+    ):
         self.url = url
         self.session = session
+        self.extractor = extractor or get_html_extractor()
+        self.performance_mode = browser_performance_mode
         self.debug = False
+        # Seconds spent in each phase of the last scrape
+        self.timings: Dict[str, float] = {}
+        # Session-wide seconds per phase of every scrape, appended to after each scrape
+        self.browser_timings = browser_timings
 
     async def scrape_async(self) -> Tuple[str, list[dict], str]:
         """Returns tuple of (text, image_urls, title)"""
@@ -205,19 +297,26 @@ class NoDriverScraper:
                 self.logger.error(f"Failed to initialize browser: {str(e)}")
                 return str(e), [], ""
 
-            page = await browser.get(self.url)
-            await browser.wait_or_timeout(page, "complete", 2)
-            # wait for potential redirection
-            await page.sleep(random.uniform(0.3, 0.7))
-            await browser.wait_or_timeout(page, "idle", 2)
+            with self._timed("navigate"):
+                page = await browser.get(self.url, reuse_tab=self.performance_mode)
+            with self._timed("load"):
+                await browser.wait_or_timeout(page, "complete", 2)
+                # wait for potential redirection
+                await page.sleep(random.uniform(0.3, 0.7))
+                await browser.wait_or_timeout(page, "idle", 2)
 
-            await browser.scroll_page_to_bottom(page)
-            html = await page.get_content()
-            soup = BeautifulSoup(html, "lxml")
-            clean_soup(soup)
-            text = get_text_from_soup(soup)
-            image_urls = get_relevant_images(soup, self.url)
-            title = extract_title(soup)
+            with self._timed("scroll"):
+                if not self.performance_mode or await self._needs_scroll(page):
+                    await browser.scroll_page_to_bottom(page)
+            with self._timed("content"):
+                html = await page.get_content()
+            with self._timed("extract"):
+                # Parse off the event loop so other tabs keep loading meanwhile
+                text, image_urls, title = await self.extractor.extract(html, self.url)
+            self.logger.debug(f"Scraped {self.url} in {self.format_timings(self.timings)}")
+            if self.browser_timings is not None:
+                for phase, seconds in self.timings.items():
+                    self.browser_timings.setdefault(phase, []).append(seconds)
 
             if len(text) < 200:
                 self.logger.warning(
@@ -252,3 +351,34 @@ class NoDriverScraper:
                     await self.release_browser(browser)
             except Exception as e:
                 self.logger.error(e)
+
+    async def _needs_scroll(self, page: "zendriver.Tab") -> bool:
+        """Lazy content only matters when the rendered DOM holds little text so far"""
+        try:
+            text_length = await page.evaluate(
+                "document.body ? document.body.innerText.length : 0"
+            )
+            return int(text_length or 0) < self.skip_scroll_text_threshold
+        except Exception:
+            return True
+
+    @staticmethod
+    def format_timings(timings: Dict[str, float]) -> str:
+        return ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items())
+
+    @staticmethod
+    def average_timings(browser_timings: Dict[str, List[float]]) -> Dict[str, float]:
+        """Mean seconds per phase across the scrapes recorded in `browser_timings`"""
+        return {
+            phase: sum(seconds) / len(seconds)
+            for phase, seconds in browser_timings.items()
+            if seconds
+        }
+
+    @contextmanager
+    def _timed(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = time.perf_counter() - start
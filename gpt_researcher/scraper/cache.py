@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from ..utils.disk_cache import DiskCache
+from ..utils.urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+
+def page_cache_key(url: str) -> str:
+    """Key pages by their canonical URL so variants of the same page share an entry"""
+    return canonicalize_url(url)
+
+
+class PageCache:
+    """
+    Persistent cache of extracted pages, shared by every scraper.
+
+    Each entry holds the extracted (content, image_urls, title) of a URL along with the
+    ETag / Last-Modified validators of the response. Entries younger than `ttl` seconds
+    are served directly; older entries are revalidated with a conditional GET and only
+    re-scraped when the page has changed.
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = 86400, max_bytes: Optional[int] = None):
+        self.ttl = ttl
+        self.store = DiskCache(os.path.join(cache_dir, "pages.sqlite3"), max_bytes=max_bytes)
+
+    async def get(self, url: str) -> Optional[dict]:
+        """Return the cached entry for the url with its age in seconds, or None"""
+        cached = await asyncio.to_thread(self.store.get, page_cache_key(url))
+        if cached is None:
+            return None
+        entry, stored_at = cached
+        entry["age"] = time.time() - stored_at
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return entry["age"] < self.ttl
+
+    async def put(
+        self, url: str, content: str, image_urls: list, title: str, validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        entry = {
+            "content": content,
+            "image_urls": image_urls,
+            "title": title,
+            "etag": (validators or {}).get("etag"),
+            "last_modified": (validators or {}).get("last_modified"),
+        }
+        await asyncio.to_thread(self.store.set, page_cache_key(url), entry)
+
+    async def revalidate(
+        self, url: str, entry: dict, http_client, max_bytes: Optional[int] = None
+    ) -> Optional[dict]:
+        """
+        Ask the origin whether the cached page is still current.
+
+        Returns:
+            dict: `{"unchanged": True}` when the server answered 304 Not Modified; the
+            entry is then refreshed for another ttl. When the page changed, the 200
+            response is returned as `{"unchanged": False, "body", "encoding",
+            "validators"}` so it can be extracted without downloading it again.
+            None when the page could not be revalidated.
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        if not headers or http_client is None:
+            return None
+
+        try:
+            async with http_client.get_session().get(
+                url, headers=headers, timeout=http_client.page_timeout
+            ) as response:
+                if response.status == 200:
+                    return {
+                        "unchanged": False,
+                        "body": await read_body(response, max_bytes),
+                        "encoding": response.charset,
+                        "validators": get_validators(response.headers),
+                    }
+                if response.status != 304:
+                    return None
+        except Exception as e:
+            logger.debug(f"Revalidation of {url} failed: {e}")
+            return None
+
+        await asyncio.to_thread(self.store.touch, page_cache_key(url))
+        return {"unchanged": True}
+
+
+async def read_body(response, max_bytes: Optional[int] = None) -> bytes:
+    """Read an aiohttp response, stopping at `max_bytes`"""
+    if not max_bytes:
+        return await response.read()
+    try:
+        return await response.content.readexactly(max_bytes)
+    except asyncio.IncompleteReadError as e:
+        # The whole body was shorter than the limit
+        return e.partial
+
+
+def get_validators(headers) -> Dict[str, str]:
+    """Pick the cache validators out of response headers"""
+    validators = {}
+    if headers.get("ETag"):
+        validators["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["last_modified"] = headers["Last-Modified"]
+    return validators
+
+
+_caches: Dict[tuple, PageCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_page_cache(
+    cache_dir: Optional[str], ttl: float = 86400, max_bytes: Optional[int] = None
+) -> Optional[PageCache]:
+    """Get the process-wide page cache for a directory, or None when caching is disabled"""
+    if not cache_dir:
+        return None
+    key = (os.path.abspath(cache_dir), ttl, max_bytes)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = PageCache(cache_dir, ttl, max_bytes)
+        return _caches[key]
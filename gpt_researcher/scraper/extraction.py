@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, TypeVar
+
+from .utils import extract_html
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HTMLExtractor:
+    """
+    Runs the CPU-bound HTML extraction of scraped pages off the event loop.
+
+    In "thread" mode pages are parsed in a thread pool, which is cheap but serializes on
+    the GIL. In "process" mode they are parsed in a pool of worker processes, so pages
+    that land at the same time are parsed on separate cores. The text of PDFs is
+    extracted in the same pool. Where worker processes cannot be started, or the pool
+    breaks, extraction falls back to "thread" mode.
+    """
+
+    MODES = ("thread", "process")
+
+    def __init__(self, mode: str = "thread", max_workers: Optional[int] = None, max_bytes: int = 5_000_000):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown extraction mode '{mode}'. Options: {', '.join(self.MODES)}")
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_bytes = max_bytes
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # Research sessions using the pool; the workers are stopped once the last one ends
+        self._sessions = 0
+
+    @property
+    def executor(self) -> Executor:
+        # Created on first use and reused, so worker processes are only spawned once
+        with self._lock:
+            if self._executor is None:
+                if self.mode == "process":
+                    try:
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    except (OSError, NotImplementedError) as e:
+                        logger.warning(f"Cannot start extraction processes, extracting in threads: {e}")
+                        self.mode = "thread"
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="html-extraction"
+                    )
+            return self._executor
+
+    def truncate(self, html: bytes | str, url: str) -> bytes | str:
+        """Cut documents larger than max_bytes, which lxml still parses leniently"""
+        if self.max_bytes and len(html) > self.max_bytes:
+            logger.warning(f"HTML of {url} is {len(html)} bytes, extracting the first {self.max_bytes}")
+            return html[:self.max_bytes]
+        return html
+
+    async def extract(self, html: bytes | str, url: str, encoding: Optional[str] = None) -> tuple[str, list, str]:
+        """
+        Extract (content, image_urls, title) from raw HTML in the worker pool.
+        """
+        html = self.truncate(html, url)
+        return await self.run(extract_html, html, url, encoding)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Run another CPU-bound extraction, such as a PDF's, in the worker pool"""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, fn, *args)
+        except BrokenProcessPool as e:
+            self._fall_back_to_threads(e)
+            return await loop.run_in_executor(self.executor, fn, *args)
+
+    def _fall_back_to_threads(self, error: BaseException) -> None:
+        with self._lock:
+            if self.mode != "process":
+                return
+            logger.warning(f"Extraction processes stopped, extracting in threads: {error}")
+            self.mode = "thread"
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def open_session(self) -> None:
+        with self._lock:
+            self._sessions += 1
+
+    def close_session(self) -> None:
+        """End a research session; the workers are stopped when no other session uses them"""
+        with self._lock:
+            self._sessions = max(0, self._sessions - 1)
+            if self._sessions:
+                return
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_extractors: Dict[tuple, HTMLExtractor] = {}
+_extractors_lock = threading.Lock()
+
+
+def get_html_extractor(
+    mode: str = "thread", max_workers: Optional[int] = None, max_bytes: int = 5_000_000
+) -> HTMLExtractor:
+    """Get the process-wide extractor for a configuration, so its worker pool is reused across researches"""
+    key = (mode, max_workers, max_bytes)
+    with _extractors_lock:
+        if key not in _extractors:
+            _extractors[key] = HTMLExtractor(mode, max_workers, max_bytes)
+        return _extractors[key]
@@ -1,22 +1,75 @@
-import os
+import asyncio
+from typing import Optional
+
+import pymupdf
 import requests
-import tempfile
 from urllib.parse import urlparse
-from langchain_community.document_loaders import PyMuPDFLoader
+
+from ..extraction import HTMLExtractor, get_html_extractor
+
+
+def extract_pdf_text(source: bytes | str, max_pages: Optional[int] = 1, max_chars: Optional[int] = None) -> tuple[str, str]:
+    """
+    Extract (text, title) from a PDF held in memory or on disk.
+
+    Pages are read one at a time and extraction stops as soon as the page or character
+    budget is spent, so large documents are never parsed in full.
+    """
+    if isinstance(source, bytes):
+        doc = pymupdf.open(stream=source, filetype="pdf")
+    else:
+        doc = pymupdf.open(source)
+
+    with doc:
+        parts = []
+        length = 0
+        for page_number, page in enumerate(doc):
+            if max_pages and page_number >= max_pages:
+                break
+            text = page.get_text()
+            parts.append(text)
+            length += len(text)
+            if max_chars and length >= max_chars:
+                break
+        content = "".join(parts)
+        if max_chars:
+            content = content[:max_chars]
+        title = (doc.metadata or {}).get("title") or ""
+    return content, title
 
 
 class PyMuPDFScraper:
 
-    def __init__(self, link, session=None):
+    # Session-wide resources the Scraper passes in as keyword arguments
+    shared_resources = ("http_client", "extractor", "pdf_limits")
+
+    def __init__(
+        self,
+        link,
+        session=None,
+        http_client=None,
+        extractor: HTMLExtractor | None = None,
+        pdf_limits: dict | None = None,
+    ):
         """
         Initialize the scraper with a link and an optional session.
 
         Args:
           link (str): The URL or local file path of the PDF document.
           session (requests.Session, optional): An optional session for making HTTP requests.
+          http_client (AsyncHTTPClient, optional): Shared connection pool used by `scrape_async`.
+          extractor (HTMLExtractor, optional): Worker pool the text is extracted in by `scrape_async`.
+          pdf_limits (dict, optional): `max_pages`, `max_chars` and `max_bytes` budgets.
+            Defaults to the first page of documents up to 50 MB.
         """
         self.link = link
         self.session = session
+        self.http_client = http_client
+        self.extractor = extractor or get_html_extractor()
+        limits = pdf_limits or {}
+        self.max_pages = limits.get("max_pages", 1)
+        self.max_chars = limits.get("max_chars")
+        self.max_bytes = limits.get("max_bytes", 50_000_000)
 
     def is_url(self) -> bool:
         """
@@ -33,34 +86,31 @@ class PyMuPDFScraper:
 
     def scrape(self) -> tuple[str, list[str], str]:
         """
-        The `scrape` function uses PyMuPDFLoader to load a document from the provided link (either URL or local file)
-        and returns the document as a string.
+        The `scrape` function loads a document from the provided link (either URL or local file)
+        into memory and returns the text of its first pages, within the page and character budget.
 
         Returns:
           str: A string representation of the loaded document.
         """
         try:
             if self.is_url():
-                response = requests.get(self.link, timeout=5, stream=True)
+                session = self.session or requests
+                response = session.get(self.link, timeout=5, stream=True)
                 response.raise_for_status()
 
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_filename = temp_file.name  # Get the temporary file name
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)  # Write the downloaded content to the temporary file
-
-                loader = PyMuPDFLoader(temp_filename)
-                doc = loader.load()
-
-                os.remove(temp_filename)
+                data = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    data.extend(chunk)
+                    if self.max_bytes and len(data) > self.max_bytes:
+                        raise ValueError(f"PDF is larger than {self.max_bytes} bytes")
+                source = bytes(data)
             else:
-                loader = PyMuPDFLoader(self.link)
-                doc = loader.load()
+                source = self.link
 
             # Extract the content, image (if any), and title from the document.
             image = []
-            # Retrieve the content of the first page to minimize embedding costs.
-            return doc[0].page_content, image, doc[0].metadata["title"]
+            content, title = extract_pdf_text(source, self.max_pages, self.max_chars)
+            return content, image, title
 
         except requests.exceptions.Timeout:
             print(f"Download timed out. Please check the link : {self.link}")
@@ -68,3 +118,37 @@ class PyMuPDFScraper:
         except Exception as e:
             print(f"Error loading PDF : {self.link} {e}")
             return "", [], ""
+
+    async def scrape_async(self) -> tuple[str, list[str], str]:
+        """
+        Downloads the PDF over the shared connection pool and extracts it in the extraction pool.
+
+        Falls back to the blocking `scrape` for local files or when no http client was provided.
+        """
+        if self.http_client is None or not self.is_url():
+            return await asyncio.to_thread(self.scrape)
+
+        try:
+            async with self.http_client.get_session().get(
+                self.link, timeout=self.http_client.page_timeout
+            ) as response:
+                response.raise_for_status()
+                if self.max_bytes and (response.content_length or 0) > self.max_bytes:
+                    raise ValueError(f"PDF is larger than {self.max_bytes} bytes")
+                data = bytearray()
+                async for chunk in response.content.iter_chunked(65536):
+                    data.extend(chunk)
+                    if self.max_bytes and len(data) > self.max_bytes:
+                        raise ValueError(f"PDF is larger than {self.max_bytes} bytes")
+
+            content, title = await self.extractor.run(
+                extract_pdf_text, bytes(data), self.max_pages, self.max_chars
+            )
+            return content, [], title
+
+        except asyncio.TimeoutError:
+            print(f"Download timed out. Please check the link : {self.link}")
+            return "", [], ""
+        except Exception as e:
+            print(f"Error loading PDF : {self.link} {e}")
+            return "", [], ""
@@ -9,6 +9,8 @@ import logging
 
 from gpt_researcher.utils.workers import WorkerPool
 
+from .extraction import get_html_extractor
+
 from . import (
     ArxivScraper,
     BeautifulSoupScraper,
@@ -18,6 +20,7 @@ from . import (
     NoDriverScraper,
     TavilyExtract,
     FireCrawl,
+    TieredScraper,
 )
 
 
@@ -26,13 +29,16 @@ class Scraper:
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool):
+    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool, resources: dict | None = None):
         """
         Initialize the Scraper class.
         Args:
             urls:
+            resources: Session-wide resources (e.g. the shared http client), passed to the
+                scraper classes that list them in `shared_resources`
         """
         self.urls = urls
+        self.resources = resources or {}
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
         self.scraper = scraper
@@ -54,6 +60,27 @@ class Scraper:
         res = [content for content in contents if content["raw_content"] is not None]
         return res
 
+    async def iter_run(self):
+        """
+        Extracts the content from the links, yielding each page as soon as it is scraped.
+
+        Pages are yielded in completion order. Closing the generator early cancels the
+        scrapes that are still in flight.
+        """
+        tasks = [
+            asyncio.create_task(self.extract_data_from_url(url, self.session))
+            for url in self.urls
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                content = await next_done
+                if content["raw_content"] is not None:
+                    yield content
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def _check_pkg(self, scrapper_name: str) -> None:
         """
         Checks and ensures required Python packages are available for scrapers that need
@@ -92,9 +119,15 @@ class Scraper:
         Extracts the data from the link with logging
         """
         async with self.worker_pool.throttle():
+            page_cache = self.resources.get("page_cache")
             try:
+                if page_cache is not None:
+                    cached = await self._get_cached_page(page_cache, link)
+                    if cached is not None:
+                        return cached
+
                 Scraper = self.get_scraper(link)
-                scraper = Scraper(link, session)
+                scraper = Scraper(link, session, **self._get_shared_resources(Scraper))
 
                 # Get scraper name
                 scraper_name = scraper.__class__.__name__
@@ -139,6 +172,11 @@ class Scraper:
                         "title": title,
                     }
 
+                if page_cache is not None:
+                    # Pages of scrapers that don't report response headers are re-scraped once stale
+                    validators = getattr(scraper, "validators", None)
+                    await page_cache.put(link, content, image_urls, title, validators)
+
                 return {
                     "url": link,
                     "raw_content": content,
@@ -150,6 +188,52 @@ class Scraper:
                 self.logger.error(f"Error processing {link}: {str(e)}")
                 return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
 
+    async def _get_cached_page(self, page_cache, link):
+        """Return the cached page if it is fresh or the origin confirms it is unchanged"""
+        entry = await page_cache.get(link)
+        if entry is None:
+            return None
+        if not page_cache.is_fresh(entry):
+            extractor = self.resources.get("extractor") or get_html_extractor()
+            revalidated = await page_cache.revalidate(
+                link, entry, self.resources.get("http_client"), extractor.max_bytes
+            )
+            if revalidated is None:
+                return None
+            if not revalidated["unchanged"]:
+                return await self._extract_revalidated_page(page_cache, link, revalidated, extractor)
+
+        self.logger.info(f"Using cached content for {link}")
+        return {
+            "url": link,
+            "raw_content": entry["content"],
+            "image_urls": entry["image_urls"],
+            "title": entry["title"],
+        }
+
+    async def _extract_revalidated_page(self, page_cache, link, revalidated, extractor):
+        """Extract a changed page from the body of the revalidation request instead of fetching it again"""
+        content, image_urls, title = await extractor.extract(
+            revalidated["body"], link, revalidated["encoding"]
+        )
+        if len(content) < 100:
+            return None
+        self.logger.info(f"Cached content of {link} changed, using the revalidated page")
+        await page_cache.put(link, content, image_urls, title, revalidated["validators"])
+        return {
+            "url": link,
+            "raw_content": content,
+            "image_urls": image_urls,
+            "title": title,
+        }
+
+    def _get_shared_resources(self, scraper_class) -> dict:
+        return {
+            name: self.resources[name]
+            for name in getattr(scraper_class, "shared_resources", ())
+            if self.resources.get(name) is not None
+        }
+
     def get_scraper(self, link):
         """
         The function `get_scraper` determines the appropriate scraper class based on the provided link
@@ -176,6 +260,7 @@ class Scraper:
             "nodriver": NoDriverScraper,
             "tavily_extract": TavilyExtract,
             "firecrawl": FireCrawl,
+            "tiered": TieredScraper,
         }
 
         scraper_key = None
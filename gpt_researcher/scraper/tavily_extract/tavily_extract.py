@@ -1,6 +1,5 @@
-from bs4 import BeautifulSoup
 import os
-from ..utils import get_relevant_images, extract_title
+import re
 
 class TavilyExtract:
 
@@ -25,8 +24,9 @@ class TavilyExtract:
 
     def scrape(self) -> tuple:
         """
-        This function extracts content from a specified link using the Tavily Python SDK, the title and
-        images from the link are extracted using the functions from `gpt_researcher/scraper/utils.py`.
+        This function extracts content from a specified link using the Tavily Python SDK. The images
+        come from the same extract call and the title from the extracted content, so the link is never
+        fetched a second time.
 
         Returns:
           The `scrape` method returns a tuple containing the extracted content, a list of image URLs, and
@@ -36,27 +36,27 @@ class TavilyExtract:
         """
 
         try:
-            response = self.tavily_client.extract(urls=self.link)
+            response = self.tavily_client.extract(urls=self.link, include_images=True)
             if response['failed_results']:
                 return "", [], ""
 
-            # Parse the HTML content of the response to create a BeautifulSoup object for the utility functions
-            response_bs = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response_bs.content, "lxml", from_encoding=response_bs.encoding
-            )
-
             # Since only a single link is provided to tavily_client, the results will contain only one entry.
-            content = response['results'][0]['raw_content']
+            result = response['results'][0]
+            content = result['raw_content']
 
-            # Get relevant images using the utility function
-            image_urls = get_relevant_images(soup, self.link)
+            # Tavily returns image URLs without size hints, so they keep their extraction order
+            image_urls = [{'url': url, 'score': 0} for url in (result.get('images') or [])[:10]]
 
-            # Extract the title using the utility function
-            title = extract_title(soup)
+            title = result.get('title') or self.extract_title(content)
 
             return content, image_urls, title
 
         except Exception as e:
             print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+            return "", [], ""
+
+    @staticmethod
+    def extract_title(content: str) -> str:
+        """Use the first markdown heading of the extracted content as the title"""
+        match = re.search(r"^#{1,2}\s+(.+)$", content or "", re.MULTILINE)
+        return match.group(1).strip() if match else ""
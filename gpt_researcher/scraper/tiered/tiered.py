@@ -0,0 +1,157 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from ..beautiful_soup.beautiful_soup import BeautifulSoupScraper
+from ..browser.nodriver_scraper import NoDriverScraper
+
+logger = logging.getLogger(__name__)
+
+# Below this many characters a page is treated as not scraped, as in Scraper
+MIN_CONTENT_LENGTH = 100
+
+JS_GATE_MARKERS = (
+    "enable javascript",
+    "javascript is required",
+    "javascript is disabled",
+    "turn on javascript",
+    "requires javascript",
+    "you need to enable javascript",
+    "checking your browser",
+    "just a moment...",
+    "please wait while we verify",
+)
+
+
+def looks_js_gated(content: str) -> bool:
+    """Whether static HTML is a placeholder that only renders with JavaScript"""
+    if len(content) < MIN_CONTENT_LENGTH:
+        return True
+    # Real articles that mention JavaScript are long; gate pages are short
+    if len(content) > 2000:
+        return False
+    lowered = content.lower()
+    return any(marker in lowered for marker in JS_GATE_MARKERS)
+
+
+class DomainTierMemory:
+    """
+    Remembers which domains needed a headless browser, so later pages from them skip
+    the HTTP attempt. Persisted as JSON when a cache directory is configured; entries
+    expire after `ttl` seconds so domains get re-tried with plain HTTP.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = 7 * 86400):
+        self.ttl = ttl
+        self.path = os.path.join(cache_dir, "domain_tiers.json") if cache_dir else None
+        self._lock = threading.Lock()
+        self._tiers: Dict[str, dict] = {}
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._tiers = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read domain tiers from {self.path}: {e}")
+
+    @staticmethod
+    def domain(url: str) -> str:
+        domain = urlparse(url).netloc.lower()
+        return domain[4:] if domain.startswith("www.") else domain
+
+    def needs_browser(self, url: str) -> bool:
+        entry = self._tiers.get(self.domain(url))
+        return bool(entry) and entry["tier"] == "browser" and time.time() - entry["updated"] < self.ttl
+
+    def remember(self, url: str, tier: str) -> None:
+        domain = self.domain(url)
+        with self._lock:
+            if tier == "http" and domain not in self._tiers:
+                return
+            self._tiers[domain] = {"tier": tier, "updated": time.time()}
+            if self.path:
+                try:
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                    tmp_path = f"{self.path}.tmp"
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        json.dump(self._tiers, f)
+                    os.replace(tmp_path, self.path)
+                except OSError as e:
+                    logger.warning(f"Could not save domain tiers to {self.path}: {e}")
+
+
+_memories: Dict[Optional[str], DomainTierMemory] = {}
+_memories_lock = threading.Lock()
+
+
+def get_domain_tier_memory(cache_dir: Optional[str] = None) -> DomainTierMemory:
+    """Get the process-wide domain tier memory for a cache directory"""
+    key = os.path.abspath(cache_dir) if cache_dir else None
+    with _memories_lock:
+        if key not in _memories:
+            _memories[key] = DomainTierMemory(cache_dir)
+        return _memories[key]
+
+
+class TieredScraper:
+    """
+    Scrapes with the cheap async HTTP + BeautifulSoup path first and escalates to the
+    NoDriver headless browser only when the static page is empty or JavaScript-gated.
+    """
+
+    # Session-wide resources the Scraper passes in as keyword arguments
+    shared_resources = (
+        "http_client", "extractor", "browser_performance_mode", "domain_tiers", "browser_timings"
+    )
+
+    def __init__(
+        self,
+        link,
+        session=None,
+        http_client=None,
+        extractor=None,
+        browser_performance_mode: bool = False,
+        domain_tiers: Optional[DomainTierMemory] = None,
+        browser_timings: Optional[Dict[str, List[float]]] = None,
+    ):
+        self.link = link
+        self.session = session
+        self.http_client = http_client
+        self.extractor = extractor
+        self.browser_performance_mode = browser_performance_mode
+        self.domain_tiers = domain_tiers or get_domain_tier_memory()
+        self.browser_timings = browser_timings
+        # ETag / Last-Modified of the HTTP response, used by the page cache
+        self.validators = {}
+
+    async def scrape_async(self):
+        http_result = ("", [], "")
+        if not self.domain_tiers.needs_browser(self.link):
+            http_scraper = BeautifulSoupScraper(
+                self.link, self.session, http_client=self.http_client, extractor=self.extractor
+            )
+            http_result = await http_scraper.scrape_async()
+            self.validators = http_scraper.validators
+            if not looks_js_gated(http_result[0]):
+                self.domain_tiers.remember(self.link, "http")
+                return http_result
+            logger.info(f"Static content of {self.link} looks JavaScript-gated, escalating to a browser")
+
+        browser_scraper = NoDriverScraper(
+            self.link,
+            self.session,
+            extractor=self.extractor,
+            browser_performance_mode=self.browser_performance_mode,
+            browser_timings=self.browser_timings,
+        )
+        browser_result = await browser_scraper.scrape_async()
+        # The browser returns error messages as content, so only trust it when it found more
+        if len(browser_result[0]) < MIN_CONTENT_LENGTH or len(browser_result[0]) <= len(http_result[0]):
+            return http_result
+        self.domain_tiers.remember(self.link, "browser")
+        # The validators describe the static page, which a revalidation would extract instead
+        self.validators = {}
+        return browser_result
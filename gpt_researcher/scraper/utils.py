@@ -121,4 +121,23 @@ def get_text_from_soup(soup: BeautifulSoup) -> str:
     text = soup.get_text(strip=True, separator="\n")
     # Remove excess whitespace
     text = re.sub(r"\s{2,}", " ", text)
-    return text
\ No newline at end of file
+    return text
+
+def extract_html(html: bytes | str, url: str, encoding: str | None = None) -> tuple[str, list, str]:
+    """
+    Extract (content, image_urls, title) from a raw HTML document.
+
+    Pure function of its arguments returning plain built-in types, so it can run in a
+    worker process as well as in a thread.
+    """
+    soup = BeautifulSoup(html, "lxml", from_encoding=encoding if isinstance(html, bytes) else None)
+
+    soup = clean_soup(soup)
+
+    content = get_text_from_soup(soup)
+
+    image_urls = get_relevant_images(soup, url)
+
+    title = extract_title(soup)
+
+    return content, image_urls, str(title) if title else ""
@@ -11,28 +11,25 @@ class WebBaseLoaderScraper:
 
     def scrape(self) -> tuple:
         """
-        This Python function scrapes content from a webpage using a WebBaseLoader object and returns the
-        concatenated page content.
-        
+        This Python function scrapes content from a webpage the way langchain's WebBaseLoader does,
+        fetching the page once and returning its text, images and title.
+
         Returns:
           The `scrape` method is returning a string variable named `content` which contains the
-        concatenated page content from the documents loaded by the `WebBaseLoader`. If an exception
+        text of the page, along with the relevant images and the title. If an exception
         occurs during the process, an error message is printed and an empty string is returned.
         """
         try:
-            from langchain_community.document_loaders import WebBaseLoader
-            loader = WebBaseLoader(self.link)
-            loader.requests_kwargs = {"verify": False}
-            docs = loader.load()
-            content = ""
+            # One request serves the text as well as the images and title; the text matches
+            # what langchain's WebBaseLoader extracts from the same response. As with the
+            # loader, certificates are not verified; unlike it, a stalled server times out.
+            response = self.session.get(self.link, verify=False, timeout=10)
+            soup = BeautifulSoup(response.content, 'html.parser')
 
-            for doc in docs:
-                content += doc.page_content
+            content = soup.get_text()
 
-            response = self.session.get(self.link)
-            soup = BeautifulSoup(response.content, 'html.parser')
             image_urls = get_relevant_images(soup, self.link)
-            
+
             # Extract the title using the utility function
             title = extract_title(soup)
 
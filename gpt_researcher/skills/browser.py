@@ -1,8 +1,17 @@
+import asyncio
+from contextlib import aclosing
+from typing import AsyncIterator, Iterable
+
 from gpt_researcher.utils.workers import WorkerPool
 
 from ..actions.utils import stream_output
-from ..actions.web_scraping import scrape_urls
+from ..actions.web_scraping import scrape_urls, iter_scrape_urls
+from ..scraper import BrowserScraper, NoDriverScraper
+from ..scraper.cache import get_page_cache
+from ..scraper.extraction import get_html_extractor
+from ..scraper.tiered.tiered import get_domain_tier_memory
 from ..scraper.utils import get_image_hash
+from ..utils.urls import canonicalize_url
 
 
 class BrowserManager:
@@ -11,6 +20,39 @@ class BrowserManager:
     def __init__(self, researcher):
         self.researcher = researcher
         self.worker_pool = WorkerPool(researcher.cfg.max_scraper_workers)
+        self.extractor = get_html_extractor(
+            researcher.cfg.scraper_extraction_mode,
+            researcher.cfg.scraper_extraction_workers,
+            researcher.cfg.scraper_max_html_bytes,
+        )
+        self.page_cache = get_page_cache(
+            researcher.cfg.scraper_cache_dir,
+            ttl=researcher.cfg.scraper_cache_ttl,
+            max_bytes=researcher.cfg.scraper_cache_max_bytes,
+        )
+        self.domain_tiers = get_domain_tier_memory(researcher.cfg.scraper_cache_dir)
+        # Scrapes started by any sub-query of this research, keyed by canonical URL. Each
+        # future resolves to the scraped page, or None when the scrape failed.
+        self._scrapes: dict[str, asyncio.Future] = {}
+        # Seconds per phase of every headless-browser scrape of this research
+        self.browser_timings: dict[str, list[float]] = {}
+
+    @property
+    def resources(self) -> dict:
+        """Session-wide resources shared by every scrape of this research"""
+        return {
+            "http_client": self.researcher.http_client,
+            "extractor": self.extractor,
+            "page_cache": self.page_cache,
+            "browser_performance_mode": self.researcher.cfg.browser_performance_mode,
+            "domain_tiers": self.domain_tiers,
+            "browser_timings": self.browser_timings,
+            "pdf_limits": {
+                "max_pages": self.researcher.cfg.pdf_max_pages,
+                "max_chars": self.researcher.cfg.pdf_max_chars,
+                "max_bytes": self.researcher.cfg.pdf_max_bytes,
+            },
+        }
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
@@ -22,6 +64,106 @@ class BrowserManager:
         Returns:
             list[dict]: list of scraped content results.
         """
+        await self._log_scraping_start(urls)
+        scraped_content, images = await scrape_urls(
+            urls, self.researcher.cfg, self.worker_pool, self.resources
+        )
+        await self._add_scraped_content(scraped_content, images)
+        return scraped_content
+
+    async def browse_urls_iter(
+        self, urls: list[str], pages: list[dict] | None = None
+    ) -> AsyncIterator[dict]:
+        """
+        Scrape content from a list of URLs, yielding each page as soon as it is scraped.
+
+        Research sources and images are recorded once the generator is exhausted or closed,
+        so closing it early keeps the pages that were already yielded. A URL another
+        sub-query is already scraping is not fetched again; its page is awaited and yielded
+        here too, but recorded as a source only once.
+
+        Args:
+            urls (list[str]): list of URLs to scrape.
+            pages (list[dict], optional): pages whose content is already known, such as
+                full-text search results. They are yielded and recorded without scraping.
+
+        Yields:
+            dict: scraped content of one page, in completion order.
+        """
+        await self._log_scraping_start(urls)
+        loop = asyncio.get_running_loop()
+        owned: dict[str, asyncio.Future] = {}
+        owned_urls, known_pages, shared = [], [], {}
+        for page in pages or []:
+            key = canonicalize_url(page["url"])
+            if key in self._scrapes:
+                shared.setdefault(key, self._scrapes[key])
+            elif key not in owned:
+                owned[key] = self._scrapes[key] = loop.create_future()
+                owned[key].set_result(page)
+                known_pages.append(page)
+        for url in urls:
+            key = canonicalize_url(url)
+            if key in owned or key in shared:
+                continue
+            if key in self._scrapes:
+                shared[key] = self._scrapes[key]
+            else:
+                owned[key] = self._scrapes[key] = loop.create_future()
+                owned_urls.append(url)
+
+        scraped_content, images = [], []
+        try:
+            for page in known_pages:
+                if self.page_cache is not None:
+                    # Later scrapes of the URL, e.g. for a retriever without page text, reuse it
+                    await self.page_cache.put(
+                        page["url"], page["raw_content"], page["image_urls"], page["title"]
+                    )
+                scraped_content.append(page)
+                images.extend(page.get("image_urls", []))
+                yield page
+
+            # Pages another sub-query has already scraped
+            waiting = []
+            for future in shared.values():
+                if not future.done():
+                    waiting.append(future)
+                elif future.result():
+                    yield future.result()
+
+            async with aclosing(
+                iter_scrape_urls(owned_urls, self.researcher.cfg, self.worker_pool, self.resources)
+            ) as scraped_pages:
+                async for page in scraped_pages:
+                    future = owned.get(canonicalize_url(page["url"]))
+                    if future is not None and not future.done():
+                        future.set_result(page)
+                    scraped_content.append(page)
+                    images.extend(page.get("image_urls", []))
+                    yield page
+
+            # Pages another sub-query is still scraping
+            for next_page in asyncio.as_completed(waiting):
+                page = await next_page
+                if page:
+                    yield page
+        finally:
+            for future in owned.values():
+                if not future.done():
+                    future.set_result(None)
+            await self._add_scraped_content(scraped_content, images)
+
+    def claimed_urls(self, urls: Iterable[str]) -> list[str]:
+        """Return the urls another sub-query of this research is still scraping"""
+        claimed = {}
+        for url in urls:
+            key = canonicalize_url(url)
+            if key in self._scrapes and not self._scrapes[key].done() and key not in claimed:
+                claimed[key] = url
+        return list(claimed.values())
+
+    async def _log_scraping_start(self, urls: list[str]) -> None:
         if self.researcher.verbose:
             await stream_output(
                 "logs",
@@ -30,9 +172,7 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
-        scraped_content, images = await scrape_urls(
-            urls, self.researcher.cfg, self.worker_pool
-        )
+    async def _add_scraped_content(self, scraped_content: list[dict], images: list[dict]) -> None:
         self.researcher.add_research_sources(scraped_content)
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
         self.researcher.add_research_images(new_images)
@@ -59,7 +199,18 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
-        return scraped_content
+    def open(self) -> None:
+        """Register this research session with the browser and extraction pools shared across researchers"""
+        BrowserScraper.open_session(self.researcher.cfg.browser_max_drivers)
+        self.extractor.open_session()
+
+    async def close(self) -> None:
+        """Release the browsers, extraction workers and connections held for this research session"""
+        await asyncio.to_thread(BrowserScraper.close_session)
+        self.extractor.close_session()
+        if self.researcher.cfg.browser_performance_mode:
+            await NoDriverScraper.stop_idle_browsers()
+        await self.researcher.http_client.close()
 
     def select_top_images(self, images: list[dict], k: int = 2) -> list[str]:
         """
@@ -1,8 +1,16 @@
 import asyncio
-from typing import List, Dict, Optional, Set
+import logging
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, List, Dict, Optional, Set
 
 from ..context.compression import ContextCompressor, WrittenContentCompressor, VectorstoreCompressor
+from ..context.chunk_index import ChunkIndex
+from ..context.dedupe import PageDeduplicator
 from ..actions.utils import stream_output
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
+
+logger = logging.getLogger(__name__)
 
 
 class ContextManager:
@@ -10,6 +18,63 @@ class ContextManager:
 
     def __init__(self, researcher):
         self.researcher = researcher
+        # Shared by every sub-query so each page is split and embedded only once
+        self.chunk_index = ChunkIndex(researcher.memory.get_embeddings())
+        threshold = researcher.cfg.dedupe_similarity_threshold
+        # Near-duplicate pages are merged before they are chunked and embedded
+        self.deduplicator = PageDeduplicator(threshold) if threshold is not None else None
+
+    async def index_pages_as_scraped(
+        self,
+        pages: AsyncIterator[dict],
+        deadline: Optional[float] = None,
+        cost_callback: Optional[Callable[[float], None]] = None,
+    ) -> List[dict]:
+        """
+        Collect pages as they are scraped, chunking and embedding each one into the shared
+        chunk index while the remaining pages are still downloading.
+
+        Args:
+            pages: Async iterator of scraped pages, in completion order.
+            deadline: Seconds to wait for pages before abandoning the stragglers. Waits for
+                every page when None.
+            cost_callback: Charged with the embedding cost of the chunks each page adds to
+                the index. Later searches of the index only charge for chunks not yet in it.
+
+        Returns:
+            List[dict]: The pages that were scraped before the deadline, with
+            near-duplicates replaced by the page they were merged into.
+        """
+        collected: List[dict] = []
+        indexing: List[asyncio.Task] = []
+
+        async def index(page):
+            new_chunks = await self.chunk_index.add_pages([page])
+            if cost_callback and new_chunks:
+                cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=new_chunks))
+
+        async def consume():
+            async with aclosing(pages) as stream:
+                async for page in stream:
+                    if self.deduplicator is not None:
+                        page = await asyncio.to_thread(self.deduplicator.add, page)
+                        if any(page is kept for kept in collected):
+                            continue
+                    collected.append(page)
+                    indexing.append(asyncio.create_task(index(page)))
+
+        try:
+            await asyncio.wait_for(consume(), timeout=deadline)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Scrape deadline of {deadline}s reached, continuing with {len(collected)} pages"
+            )
+
+        # Pages that failed to index are retried when the sub-query searches the index
+        for result in await asyncio.gather(*indexing, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error indexing scraped page: {result}")
+        return collected
 
     async def get_similar_content_by_query(self, query, pages):
         if self.researcher.verbose:
@@ -20,10 +85,14 @@ class ContextManager:
                 self.researcher.websocket,
             )
 
+        if self.deduplicator is not None:
+            pages = await asyncio.to_thread(self.deduplicator.deduplicate, pages)
+
         context_compressor = ContextCompressor(
             documents=pages,
             embeddings=self.researcher.memory.get_embeddings(),
             prompt_family=self.researcher.prompt_family,
+            chunk_index=self.chunk_index,
             **self.researcher.kwargs
         )
         return await context_compressor.async_get_context(
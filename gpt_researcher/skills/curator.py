@@ -48,6 +48,7 @@ class SourceCurator:
                 temperature=0.2,
                 max_tokens=8000,
                 llm_provider=self.researcher.cfg.smart_llm_provider,
+                cfg=self.researcher.cfg,
                 llm_kwargs=self.researcher.cfg.llm_kwargs,
                 cost_callback=self.researcher.add_costs,
             )
@@ -71,6 +71,7 @@ class DeepResearchSkill:
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            cfg=self.researcher.cfg,
             model=self.researcher.cfg.strategic_llm_model,
             reasoning_effort=self.researcher.cfg.reasoning_effort,
             temperature=0.4
@@ -97,7 +98,7 @@ class DeepResearchSkill:
     async def generate_research_plan(self, query: str, num_questions: int = 3) -> List[str]:
         """Generate follow-up questions to clarify research direction"""
         # Get initial search results to inform query generation
-        search_results = await get_search_results(query, self.researcher.retrievers[0])
+        search_results = await get_search_results(query, self.researcher.retrievers[0], researcher=self.researcher)
         logger.info(f"Initial web knowledge obtained: {len(search_results)} results")
 
         # Get current time for context
@@ -121,6 +122,7 @@ Format each question on a new line starting with 'Question: '"""}
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            cfg=self.researcher.cfg,
             model=self.researcher.cfg.strategic_llm_model,
             reasoning_effort=ReasoningEfforts.High.value,
             temperature=0.4
@@ -142,6 +144,7 @@ Format each question on a new line starting with 'Question: '"""}
         response = await create_chat_completion(
             messages=messages,
             llm_provider=self.researcher.cfg.strategic_llm_provider,
+            cfg=self.researcher.cfg,
             model=self.researcher.cfg.strategic_llm_model,
             temperature=0.4,
             reasoning_effort=ReasoningEfforts.High.value,
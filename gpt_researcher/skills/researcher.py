@@ -1,12 +1,20 @@
 import asyncio
-import random
 import logging
 import os
+from functools import partial
 from ..actions.utils import stream_output
+from ..actions.retriever import get_retriever_name
 from ..actions.query_processing import plan_research_outline, get_search_results
 from ..document import DocumentLoader, OnlineDocumentLoader, LangChainDocumentLoader
 from ..utils.enum import ReportSource, ReportType
 from ..utils.logging_config import get_json_handler
+from ..utils.rate_limiter import get_config_rate_limiter
+from ..utils.urls import canonicalize_url
+from ..retrievers.cache import retriever_settings
+from ..scraper import NoDriverScraper
+from ..retrievers.utils import (
+    normalize_search_result, reciprocal_rank_fusion, run_search, search_options, search_result_to_page
+)
 from ..actions.agent_creator import choose_agent
 
 
@@ -184,6 +192,25 @@ class ResearchConductor:
                 self.json_handler.update_content("costs", self.researcher.get_costs())
                 self.json_handler.update_content("context", self.researcher.context)
 
+        cache_stats = self.researcher.memory.get_cache_stats()
+        self.logger.info(
+            f"Embedding cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate']:.0%} hit rate)"
+        )
+        if self.researcher.search_cache is not None:
+            search_stats = self.researcher.search_cache.stats()
+            self.logger.info(
+                f"Search cache: {search_stats['hits']} hits, {search_stats['misses']} misses "
+                f"({search_stats['hit_rate']:.0%} hit rate)"
+            )
+        browser_timings = NoDriverScraper.average_timings(self.researcher.scraper_manager.browser_timings)
+        if browser_timings:
+            self.logger.info(
+                f"Average browser scrape phases: {NoDriverScraper.format_timings(browser_timings)}"
+            )
+        deduplicator = self.researcher.context_manager.deduplicator
+        if deduplicator is not None and deduplicator.merged:
+            self.logger.info(f"Merged {deduplicator.merged} near-duplicate pages before embedding")
         self.logger.info(f"Research completed. Context size: {len(str(self.researcher.context))}")
         return self.researcher.context
 
@@ -708,9 +735,14 @@ class ResearchConductor:
         Returns: list[str]: The new urls from the given url set
         """
 
+        # Compare canonical forms so http/https, www., trailing slash, fragment and
+        # tracking-parameter variants of a visited page are not scraped again
+        visited = {canonicalize_url(url) for url in self.researcher.visited_urls}
         new_urls = []
         for url in url_set_input:
-            if url not in self.researcher.visited_urls:
+            canonical_url = canonicalize_url(url)
+            if canonical_url not in visited:
+                visited.add(canonical_url)
                 self.researcher.visited_urls.add(url)
                 new_urls.append(url)
                 if self.researcher.verbose:
@@ -725,38 +757,111 @@ class ResearchConductor:
 
         return new_urls
 
-    async def _search_relevant_source_urls(self, query, query_domains: list | None = None):
-        new_search_urls = []
+    async def _search_with_retriever(self, retriever_class, query, query_domains: list) -> list:
+        """
+        Run one retriever for the query, giving up after the configured timeout.
+
+        Returns normalized results with an `href`. Retrievers that declare
+        `returns_full_content` are asked for the page text, which is kept in `raw_content`.
+        """
+        full_content = getattr(retriever_class, "returns_full_content", False)
+        try:
+            # Instantiate the retriever with the sub-query
+            retriever = retriever_class(query, query_domains=query_domains)
+
+            # Perform the search using the current retriever
+            search_kwargs = search_options(retriever_class)
+            max_results = self.researcher.cfg.max_search_results_per_query
+            retriever_name = get_retriever_name(retriever_class)
+            # Cache hits skip the rate limit, and the timeout only counts once the search may run
+            search = partial(
+                run_search,
+                retriever,
+                http_client=self.researcher.http_client,
+                rate_limiter=get_config_rate_limiter(retriever_name, self.researcher.cfg),
+                timeout=self.researcher.cfg.retriever_timeout,
+            )
+            search_cache = self.researcher.search_cache
+            if search_cache is not None:
+                search = partial(
+                    search_cache.asearch,
+                    retriever_name,
+                    search,
+                    query,
+                    query_domains,
+                    max_results,
+                    retriever_settings(retriever),
+                    **search_kwargs,
+                )
+            else:
+                search = partial(search, max_results=max_results, **search_kwargs)
+            search_results = await search()
+            results = (normalize_search_result(result, full_content) for result in search_results or [])
+            return [result for result in results if result]
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                f"{retriever_class.__name__} timed out after {self.researcher.cfg.retriever_timeout}s"
+            )
+        except Exception as e:
+            self.logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+        return []
+
+    async def _search_relevant_sources(self, query, query_domains: list | None = None) -> list[dict]:
+        """
+        Search every retriever for the query and return the results worth reading.
+
+        The ranked lists of all retrievers are merged with reciprocal-rank fusion and only
+        the best `MAX_FUSED_RESULTS_PER_QUERY` results are kept, so the number of pages to
+        scrape does not grow with the number of retrievers. Each result has an `href`, plus
+        `raw_content` when the retriever already returned the page text. URLs visited
+        earlier are dropped, except those another sub-query of this session is still
+        scraping, which are kept on top of the best results.
+        """
         if query_domains is None:
             query_domains = []
 
-        # Iterate through the currently set retrievers
-        # This allows the method to work when retrievers are temporarily modified
-        for retriever_class in self.researcher.retrievers:
-            # Skip MCP retrievers as they don't provide URLs for scraping
-            if "mcpretriever" in retriever_class.__name__.lower():
-                continue
-                
-            try:
-                # Instantiate the retriever with the sub-query
-                retriever = retriever_class(query, query_domains=query_domains)
+        # Use the currently set retrievers, so the method works when they are temporarily modified.
+        # Skip MCP retrievers as they don't provide URLs for scraping
+        retriever_classes = [
+            retriever_class for retriever_class in self.researcher.retrievers
+            if "mcpretriever" not in retriever_class.__name__.lower()
+        ]
 
-                # Perform the search using the current retriever
-                search_results = await asyncio.to_thread(
-                    retriever.search, max_results=self.researcher.cfg.max_search_results_per_query
-                )
+        # Query every retriever concurrently; gather keeps the configured retriever order
+        results = await asyncio.gather(
+            *(self._search_with_retriever(retriever_class, query, query_domains)
+              for retriever_class in retriever_classes)
+        )
+        fused_results = reciprocal_rank_fusion(results)
 
-                # Collect new URLs from search results
-                search_urls = [url.get("href") for url in search_results if url.get("href")]
-                new_search_urls.extend(search_urls)
-            except Exception as e:
-                self.logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+        # URLs another sub-query of this session is still scraping are awaited, not fetched again
+        visited = {canonicalize_url(url) for url in self.researcher.visited_urls}
+        claimed = {
+            canonicalize_url(url)
+            for url in self.researcher.scraper_manager.claimed_urls(
+                result["href"] for result in fused_results
+            )
+        }
+        top_k = (
+            self.researcher.cfg.max_fused_results_per_query
+            or self.researcher.cfg.max_search_results_per_query
+        )
+        selected_results, new_results = [], 0
+        for result in fused_results:
+            canonical_url = canonicalize_url(result["href"])
+            if canonical_url in claimed:
+                # Awaited rather than fetched, so they do not take the place of new pages
+                selected_results.append(result)
+            elif canonical_url not in visited:
+                selected_results.append(result)
+                new_results += 1
+                if new_results >= top_k:
+                    break
 
-        # Get unique URLs
-        new_search_urls = await self._get_new_urls(new_search_urls)
-        random.shuffle(new_search_urls)
+        # Mark the new URLs as visited
+        await self._get_new_urls([result["href"] for result in selected_results])
 
-        return new_search_urls
+        return selected_results
 
     async def _scrape_data_by_urls(self, sub_query, query_domains: list | None = None):
         """
@@ -771,7 +876,13 @@ class ResearchConductor:
         if query_domains is None:
             query_domains = []
 
-        new_search_urls = await self._search_relevant_source_urls(sub_query, query_domains)
+        search_results = await self._search_relevant_sources(sub_query, query_domains)
+
+        # Results that already carry the page text skip scraping
+        retrieved_pages = [
+            search_result_to_page(result) for result in search_results if "raw_content" in result
+        ]
+        new_search_urls = [result["href"] for result in search_results if "raw_content" not in result]
 
         # Log the research process if verbose mode is on
         if self.researcher.verbose:
@@ -782,8 +893,12 @@ class ResearchConductor:
                 self.researcher.websocket,
             )
 
-        # Scrape the new URLs
-        scraped_content = await self.researcher.scraper_manager.browse_urls(new_search_urls)
+        # Scrape the new URLs, embedding each page as soon as it arrives
+        scraped_content = await self.researcher.context_manager.index_pages_as_scraped(
+            self.researcher.scraper_manager.browse_urls_iter(new_search_urls, pages=retrieved_pages),
+            deadline=self.researcher.cfg.scrape_deadline,
+            cost_callback=self.researcher.add_costs,
+        )
 
         if self.researcher.vector_store:
             self.researcher.vector_store.load(scraped_content)
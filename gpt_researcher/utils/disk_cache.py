@@ -0,0 +1,89 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+
+class DiskCache:
+    """
+    Small persistent key-value cache backed by a single SQLite file.
+
+    Values are stored as JSON together with the time they were stored, so callers can
+    apply their own freshness rules. When the total stored size exceeds `max_bytes`,
+    the least recently used entries are evicted. The access time of an entry is only
+    rewritten once it is `access_resolution` seconds old, so most reads do not write.
+    """
+
+    access_resolution = 60.0
+
+    def __init__(self, path: str, max_bytes: Optional[int] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)")
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, stored_at) for the key, or None when it is not cached"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, stored_at, accessed_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[2] >= self.access_resolution:
+                self._db.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self._db.commit()
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any) -> None:
+        blob = json.dumps(value)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._evict()
+            self._db.commit()
+
+    def touch(self, key: str) -> None:
+        """Mark the entry as freshly stored without rewriting its value"""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE cache SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key)
+            )
+            self._db.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._db.commit()
+
+    def _evict(self) -> None:
+        if not self.max_bytes:
+            return
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._db.execute(
+            "SELECT key, size FROM cache ORDER BY accessed_at"
+        ).fetchall():
+            if total - evicted <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+            evicted += size
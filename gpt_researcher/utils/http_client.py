@@ -0,0 +1,67 @@
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+
+class AsyncHTTPClient:
+    """
+    Connection-pooled aiohttp session shared by everything that fetches over HTTP
+    during a research session.
+
+    Requests use the session timeouts, sized for search APIs. Page fetches pass
+    `page_timeout` instead, so a dead or slow site gives up quickly.
+
+    The session is created lazily on first use, so the client can be built outside of
+    an event loop, and is re-created if it was closed or belongs to another loop.
+    """
+
+    def __init__(
+        self,
+        user_agent: Optional[str] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 8,
+        total_timeout: float = 20.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 10.0,
+        page_timeout: float = 4.0,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+    ):
+        self.headers = {"User-Agent": user_agent} if user_agent else {}
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout, sock_read=read_timeout
+        )
+        # Like the timeout of requests: seconds to connect and between bytes of the response
+        self.page_timeout = aiohttp.ClientTimeout(
+            total=None, connect=page_timeout, sock_read=page_timeout
+        )
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self.timeout, headers=self.headers
+            )
+            self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
@@ -1,8 +1,15 @@
 # libraries
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any
+import re
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any
 
 from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import PromptTemplate
@@ -11,13 +18,75 @@ from gpt_researcher.llm_provider.generic.base import NO_SUPPORT_TEMPERATURE_MODE
 
 from ..prompts import PromptFamily
 from .costs import estimate_llm_cost
+from .llm_cache import LLMResponseCache, get_llm_cache
+from .rate_limiter import get_config_rate_limiter, is_transient_error
+from .retry import get_fallback_models, get_latency_tracker, get_retry_policy
+from .single_flight import SingleFlight
 from .validators import Subtopics
 import os
 
+if TYPE_CHECKING:
+    from ..config import Config
+
+
+_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = weakref.WeakKeyDictionary()
+_loopless_llm_clients: dict[str, Any] = {}
+_llm_clients_lock = threading.Lock()
+_llm_requests = SingleFlight()
+# Provider credentials and endpoints are read from the environment, which the server may update
+_LLM_ENV_PATTERN = re.compile(r"(KEY|TOKEN|URL|BASE|ENDPOINT|VERSION|REGION|PROJECT)$")
+
+
+def _llm_client_key(llm_provider, kwargs: dict[str, Any]) -> str:
+    environment = sorted((name, value) for name, value in os.environ.items() if _LLM_ENV_PATTERN.search(name))
+    raw = json.dumps([llm_provider, kwargs, environment], sort_keys=True, default=repr)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
 
 def get_llm(llm_provider, **kwargs):
+    """
+    Get a long-lived provider for the model and settings, so its chat model and HTTP
+    connection pool are reused across completions.
+
+    Async HTTP clients are bound to the event loop they were first used on, so
+    providers are cached per running loop and dropped along with it.
+    """
     from gpt_researcher.llm_provider import GenericLLMProvider
-    return GenericLLMProvider.from_provider(llm_provider, **kwargs)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    key = _llm_client_key(llm_provider, kwargs)
+    with _llm_clients_lock:
+        clients = _llm_clients.setdefault(loop, {}) if loop is not None else _loopless_llm_clients
+        provider = clients.get(key)
+    if provider is None:
+        provider = GenericLLMProvider.from_provider(llm_provider, **kwargs)
+        with _llm_clients_lock:
+            provider = clients.setdefault(key, provider)
+    return provider
+
+
+class _StreamedOutput:
+    """Websocket wrapper recording whether any part of a streamed response was sent"""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.sent = False
+
+    async def send_json(self, data):
+        self.sent = True
+        await self.websocket.send_json(data)
+
+    def __getattr__(self, name):
+        return getattr(self.websocket, name)
+
+
+def estimate_request_tokens(messages: list[dict[str, str]], max_tokens: int | None = None) -> int:
+    """Rough token count of a chat request, as counted against a tokens-per-minute quota"""
+    # About four characters per token is close enough for budgeting and avoids tokenizing
+    return len(str(messages)) // 4 + (max_tokens or 0)
 
 
 async def create_chat_completion(
@@ -31,6 +100,8 @@ async def create_chat_completion(
         llm_kwargs: dict[str, Any] | None = None,
         cost_callback: callable = None,
         reasoning_effort: str | None = ReasoningEfforts.Medium.value,
+        cfg: Config | None = None,
+        fallback: bool = False,
         **kwargs
 ) -> str:
     """Create a chat completion using the OpenAI API
@@ -45,6 +116,10 @@ async def create_chat_completion(
         llm_kwargs (dict[str, Any], optional): Additional LLM keyword arguments. Defaults to None.
         cost_callback: Callback function for updating cost.
         reasoning_effort (str, optional): Reasoning effort for OpenAI's reasoning models. Defaults to 'low'.
+        cfg (Config, optional): Configuration of the researcher making the call, whose rate limits,
+            response cache, retry policy and fallback chain apply.
+        fallback (bool): Whether a model that keeps failing with transient errors falls back to the
+            next model of the config's fallback chain. Defaults to False.
         **kwargs: Additional keyword arguments.
     Returns:
         str: The response from the chat completion.
@@ -56,6 +131,105 @@ async def create_chat_completion(
         raise ValueError(
             f"Max tokens cannot be more than 16,000, but got {max_tokens}")
 
+    provider_kwargs = _provider_kwargs(llm_provider, model, temperature, max_tokens, llm_kwargs, reasoning_effort)
+    provider = get_llm(llm_provider, **provider_kwargs)
+    request_key = LLMResponseCache.key(llm_provider, provider_kwargs, messages, **kwargs)
+
+    # Identical requests are answered from the opt-in response cache
+    llm_cache = get_llm_cache(cfg.llm_cache_dir, cfg.llm_cache_ttl, cfg.llm_cache_max_bytes) if cfg else None
+    if llm_cache is not None:
+        cached_response = await llm_cache.get(request_key)
+        if cached_response is not None:
+            if stream:
+                await provider.replay_response(cached_response, websocket)
+            return cached_response
+
+    retry_policy = get_retry_policy(cfg)
+    deadline_at = retry_policy.deadline_at()
+    tokens = estimate_request_tokens(messages, max_tokens)
+    # Once part of a streamed response reached the client, another attempt would repeat it
+    streamed = _StreamedOutput(websocket) if stream and websocket is not None else None
+
+    def nothing_streamed() -> bool:
+        return streamed is None or not streamed.sent
+
+    async def ask(chat_provider, provider_name: str | None, model_name: str) -> str:
+        # Researchers with the same limits share the provider's request and token budget
+        rate_limiter = get_config_rate_limiter(provider_name, cfg)
+        latencies = get_latency_tracker(provider_name, model_name)
+
+        async def attempt() -> str:
+            async with rate_limiter.limit(tokens):
+                started = time.monotonic()
+                response = await chat_provider.get_chat_response(
+                    messages, stream, streamed or websocket, **kwargs
+                )
+                latencies.record(time.monotonic() - started)
+                return response
+
+        # A streamed response cannot be raced, as both requests would write to the websocket
+        hedge_after = None if stream else retry_policy.hedge_delay(latencies)
+        return await retry_policy.call(attempt, deadline_at, hedge_after, can_retry=nothing_streamed)
+
+    async def complete() -> str:
+        # Transient errors are retried on each model before falling back to the next one
+        candidates = [(llm_provider, model, max_tokens)]
+        if fallback:
+            candidates += get_fallback_models(llm_provider, model, cfg)
+        for index, (candidate_provider, candidate_model, token_limit) in enumerate(candidates):
+            try:
+                if index == 0:
+                    chat_provider = provider
+                else:
+                    chat_provider = get_llm(candidate_provider, **_provider_kwargs(
+                        candidate_provider,
+                        candidate_model,
+                        temperature,
+                        max_tokens if max_tokens is not None else token_limit,
+                        llm_kwargs,
+                        reasoning_effort,
+                    ))
+                response = await ask(chat_provider, candidate_provider, candidate_model)
+                break
+            except Exception as e:
+                out_of_time = deadline_at is not None and time.monotonic() >= deadline_at
+                # Another model would reject a bad request or credentials just the same
+                last_model = index == len(candidates) - 1 or not is_transient_error(e)
+                if last_model or out_of_time or not nothing_streamed():
+                    logging.error(f"Failed to get response from {candidate_provider} API: {e}")
+                    raise
+                next_provider, next_model, _ = candidates[index + 1]
+                logging.warning(
+                    f"Error with {candidate_provider}:{candidate_model}: {e}. "
+                    f"Falling back to {next_provider}:{next_model}."
+                )
+
+        if llm_cache is not None and response:
+            await llm_cache.put(request_key, response)
+
+        return response
+
+    # Concurrent researchers often send the same prompt; they share one call
+    response, shared = await _llm_requests.do(request_key, complete)
+    if shared and stream:
+        await provider.replay_response(response, websocket)
+
+    # Each researcher is charged for the response it got, so its report costs are the same either way
+    if cost_callback:
+        llm_costs = estimate_llm_cost(str(messages), response)
+        cost_callback(llm_costs)
+
+    return response
+
+
+def _provider_kwargs(
+    llm_provider: str | None,
+    model: str,
+    temperature: float | None,
+    max_tokens: int | None,
+    llm_kwargs: dict[str, Any] | None,
+    reasoning_effort: str | None,
+) -> dict[str, Any]:
     # Get the provider from supported providers
     provider_kwargs = {'model': model}
 
@@ -77,22 +251,7 @@ async def create_chat_completion(
         if base_url:
             provider_kwargs['openai_api_base'] = base_url
 
-    provider = get_llm(llm_provider, **provider_kwargs)
-    response = ""
-    # create response
-    for _ in range(10):  # maximum of 10 attempts
-        response = await provider.get_chat_response(
-            messages, stream, websocket, **kwargs
-        )
-
-        if cost_callback:
-            llm_costs = estimate_llm_cost(str(messages), response)
-            cost_callback(llm_costs)
-
-        return response
-
-    logging.error(f"Failed to get response from {llm_provider} API")
-    raise RuntimeError(f"Failed to get response from {llm_provider} API")
+    return provider_kwargs
 
 
 async def construct_subtopics(
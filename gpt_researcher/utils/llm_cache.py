@@ -0,0 +1,61 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .disk_cache import DiskCache
+
+
+class LLMResponseCache:
+    """
+    Persistent cache of chat completions keyed by the exact request.
+
+    The key covers the provider, the model settings (model, temperature, max_tokens,
+    reasoning_effort and any extra LLM kwargs) and the messages, so only an identical
+    request is answered from the cache. Entries older than `ttl` seconds are ignored,
+    and the least recently used entries are evicted once the cache exceeds `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str, ttl: Optional[float] = None, max_bytes: Optional[int] = None):
+        self.ttl = ttl
+        self.store = DiskCache(os.path.join(cache_dir, "llm.sqlite3"), max_bytes=max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(llm_provider: Optional[str], provider_kwargs: Dict[str, Any], messages: List[dict], **kwargs: Any) -> str:
+        raw = json.dumps([llm_provider, provider_kwargs, messages, kwargs], sort_keys=True, default=repr)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        cached = await asyncio.to_thread(self.store.get, key)
+        if cached is not None:
+            response, stored_at = cached
+            if not self.ttl or time.time() - stored_at < self.ttl:
+                self.hits += 1
+                return response
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, response: str) -> None:
+        await asyncio.to_thread(self.store.set, key, response)
+
+
+_llm_caches: Dict[tuple, LLMResponseCache] = {}
+_llm_caches_lock = threading.Lock()
+
+
+def get_llm_cache(
+    cache_dir: Optional[str] = None, ttl: Optional[float] = None, max_bytes: Optional[int] = None
+) -> Optional[LLMResponseCache]:
+    """Get the process-wide LLM response cache for a location, or None without a cache directory"""
+    if not cache_dir:
+        return None
+    key = (os.path.abspath(cache_dir), ttl, max_bytes)
+    with _llm_caches_lock:
+        if key not in _llm_caches:
+            _llm_caches[key] = LLMResponseCache(cache_dir, ttl, max_bytes)
+        return _llm_caches[key]
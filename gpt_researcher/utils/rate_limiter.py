@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit breaker is open"""
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `per_minute` tokens a minute, holding at most one minute
+    of tokens.
+
+    Reservations may take the bucket below zero. Each caller then waits until the
+    debt ahead of it has been refilled, so concurrent callers are served in order.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take `amount` tokens and return the seconds to wait before using them"""
+        # A request larger than the bucket could never be served, so it takes a full bucket
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= amount
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class CircuitBreaker:
+    """
+    Stops calls to an endpoint after `failure_threshold` consecutive failures.
+
+    The circuit stays open for `cooldown` seconds. Calls are then let through again,
+    and the first failure re-opens it while the first success closes it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def check(self, name: str) -> None:
+        remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"{name} failed {self.failures} times in a row, not calling it for another {remaining:.1f}s"
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._open_until = 0.0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failure_threshold and self.failures >= self.failure_threshold:
+                self._open_until = time.monotonic() + self.cooldown
+
+
+def error_status(exc: BaseException) -> Optional[int]:
+    """HTTP status code carried by an exception of requests, aiohttp, httpx, duckduckgo_search or an LLM SDK"""
+    if type(exc).__name__ in ("RateLimitError", "RatelimitException"):
+        return 429
+    for attr in ("status_code", "status"):
+        status = getattr(exc, attr, None)
+        if isinstance(status, int):
+            return status
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    return error_status(exc) == 429
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether a failed call may succeed when retried: rate limits, 5xx, timeouts and dropped connections"""
+    status = error_status(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    # requests, httpx, aiohttp and the LLM SDKs have their own timeout and connection errors
+    return any(
+        "Timeout" in cls.__name__ or "Connection" in cls.__name__ for cls in type(exc).__mro__
+    )
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait in the Retry-After header of the error, if any"""
+    headers = getattr(exc, "headers", None) or getattr(getattr(exc, "response", None), "headers", None)
+    value = headers.get("retry-after") if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Request and token budget of one provider, shared by every researcher in the process.
+
+    Calls wait for their share of the requests-per-minute (`rpm`) and tokens-per-minute
+    (`tpm`) budgets instead of failing with 429s, and a circuit breaker stops calling
+    the provider for a cool-down window once it keeps failing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        backoff: float = 10.0,
+    ):
+        self.name = name
+        self.backoff = backoff
+        self.breaker = CircuitBreaker(failure_threshold, cooldown)
+        self._paused_until = 0.0
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = TokenBucket(rpm) if rpm else None
+        self._tokens = TokenBucket(tpm) if tpm else None
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until the provider may be called with a request of about `tokens` tokens"""
+        self.breaker.check(self.name)
+        delay = max(0.0, self._paused_until - time.monotonic())
+        if self._requests is not None:
+            delay = max(delay, self._requests.reserve())
+        if self._tokens is not None and tokens:
+            delay = max(delay, self._tokens.reserve(tokens))
+        if delay > 0:
+            logger.debug(f"Waiting {delay:.2f}s for the {self.name} rate limit")
+            await asyncio.sleep(delay)
+
+    def throttle(self, seconds: Optional[float] = None) -> float:
+        """Hold back every caller of the provider after it answered with a 429"""
+        seconds = self.backoff if seconds is None else seconds
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        return seconds
+
+    def record(self, exc: Optional[BaseException] = None) -> None:
+        """Feed the outcome of a call to the circuit breaker"""
+        if exc is None:
+            self.breaker.record_success()
+        elif is_rate_limit_error(exc):
+            # The provider is up but busy, which is the rate limiter's job, not the breaker's
+            self.throttle(retry_after(exc))
+        elif is_transient_error(exc):
+            self.breaker.record_failure()
+
+    @asynccontextmanager
+    async def limit(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Wait for the rate limit, then record whether the wrapped call succeeded"""
+        await self.acquire(tokens)
+        try:
+            yield
+        except Exception as e:
+            self.record(e)
+            raise
+        self.record()
+
+
+_limiters: Dict[tuple, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str,
+    rate_limits: Optional[Dict[str, dict]] = None,
+    failure_threshold: int = 5,
+    cooldown: float = 30.0,
+) -> RateLimiter:
+    """
+    Get the process-wide rate limiter of a provider or retriever, e.g. "openai" or "tavily",
+    for the limits of a configuration, e.g. {"openai": {"rpm": 500, "tpm": 200000}}.
+
+    Researchers configured with the same limits share one limiter and so one quota;
+    researchers with other limits get their own.
+    """
+    name = (name or "default").lower()
+    limits = {provider.lower(): value for provider, value in (rate_limits or {}).items()}.get(name) or {}
+    key = (name, limits.get("rpm"), limits.get("tpm"), failure_threshold, cooldown)
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = RateLimiter(
+                name, limits.get("rpm"), limits.get("tpm"), failure_threshold, cooldown
+            )
+        return _limiters[key]
+
+
+def get_config_rate_limiter(name: str, cfg=None) -> RateLimiter:
+    """The rate limiter of a provider or retriever for a researcher's Config, or an unlimited one without it"""
+    if cfg is None:
+        return get_rate_limiter(name)
+    return get_rate_limiter(name, cfg.rate_limits, cfg.circuit_breaker_threshold, cfg.circuit_breaker_cooldown)
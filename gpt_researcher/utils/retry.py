@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .rate_limiter import is_transient_error, retry_after
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Recent latencies of one model, used to decide when a slow request is hedged"""
+
+    def __init__(self, size: int = 100):
+        self._samples: "deque[float]" = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float, min_samples: int = 20) -> Optional[float]:
+        """The latency below which `percentile` percent of recent requests finished, once there are enough of them"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(percentile / 100 * len(samples)) - 1))
+        return samples[index]
+
+
+class RetryPolicy:
+    """
+    Retries transient failures of a call with exponential backoff.
+
+    Rate limits, server errors, timeouts and dropped connections are retried up to
+    `max_retries` times. Each retry waits for the server's Retry-After or for
+    `base_delay * 2 ** retry` seconds (capped at `max_delay`), half of it jittered so
+    parallel callers do not retry in lockstep. No attempt runs past the deadline of
+    the call. With `hedge_percentile`, a second request is raced against an attempt
+    that is slower than that percentile of recent requests.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        deadline: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.hedge_percentile = hedge_percentile
+
+    def deadline_at(self) -> Optional[float]:
+        """Monotonic time by which a call started now has to finish"""
+        return time.monotonic() + self.deadline if self.deadline else None
+
+    def backoff(self, retry: int, exc: Optional[BaseException] = None) -> float:
+        server_delay = retry_after(exc) if exc is not None else None
+        if server_delay is not None:
+            return server_delay
+        delay = min(self.max_delay, self.base_delay * 2 ** retry)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def hedge_delay(self, latencies: LatencyTracker) -> Optional[float]:
+        return latencies.percentile(self.hedge_percentile) if self.hedge_percentile else None
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        deadline_at: Optional[float] = None,
+        hedge_after: Optional[float] = None,
+        can_retry: Optional[Callable[[], bool]] = None,
+    ) -> T:
+        """
+        Await `fn()`, retrying it while its failures are transient.
+
+        Args:
+            fn: Makes one attempt of the call.
+            deadline_at: Monotonic time after which no attempt may still be running.
+            hedge_after: Seconds after which a slow attempt is raced by a second one.
+            can_retry: Checked after a failure; the call is not retried when it returns False.
+        """
+        retry = 0
+        while True:
+            try:
+                return await self._attempt(fn, deadline_at, hedge_after)
+            except Exception as e:
+                if retry >= self.max_retries or not is_transient_error(e):
+                    raise
+                if can_retry is not None and not can_retry():
+                    raise
+                delay = self.backoff(retry, e)
+                if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+                    raise
+                logger.warning(f"Transient error, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                retry += 1
+
+    async def _attempt(
+        self, fn: Callable[[], Awaitable[T]], deadline_at: Optional[float], hedge_after: Optional[float]
+    ) -> T:
+        timeout = None
+        if deadline_at is not None:
+            timeout = deadline_at - time.monotonic()
+            if timeout <= 0:
+                raise TimeoutError("Deadline exceeded before the call could be made")
+        call = fn() if hedge_after is None else self._hedged(fn, hedge_after)
+        return await asyncio.wait_for(call, timeout=timeout)
+
+    @staticmethod
+    async def _hedged(fn: Callable[[], Awaitable[T]], hedge_after: float) -> T:
+        """Return the first successful of the original request and, if it is slow, a hedge"""
+        tasks = [asyncio.ensure_future(fn())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                logger.debug(f"Request slower than {hedge_after:.1f}s, sending a hedged request")
+                tasks.append(asyncio.ensure_future(fn()))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                if not pending:
+                    # Both requests failed; report the original request's error
+                    return tasks[0].result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+
+_latencies: Dict[Tuple[str, str], LatencyTracker] = {}
+_latencies_lock = threading.Lock()
+
+
+def get_retry_policy(cfg=None) -> RetryPolicy:
+    """The retry policy of LLM calls for a researcher's Config, or the default policy without it"""
+    if cfg is None:
+        return RetryPolicy()
+    return RetryPolicy(cfg.llm_max_retries, deadline=cfg.llm_deadline, hedge_percentile=cfg.llm_hedge_percentile)
+
+
+def get_fallback_chain(cfg=None) -> List[Tuple[str, str, Optional[int]]]:
+    """The (provider, model, token limit) of the LLM tiers in `LLM_FALLBACK_CHAIN`, most capable first"""
+    if cfg is None:
+        return []
+    tiers = {
+        "strategic": (cfg.strategic_llm_provider, cfg.strategic_llm_model, cfg.strategic_token_limit),
+        "smart": (cfg.smart_llm_provider, cfg.smart_llm_model, cfg.smart_token_limit),
+        "fast": (cfg.fast_llm_provider, cfg.fast_llm_model, cfg.fast_token_limit),
+    }
+    return [tiers[tier] for tier in cfg.llm_fallback_chain or [] if tier in tiers]
+
+
+def get_fallback_models(
+    llm_provider: Optional[str], model: Optional[str], cfg=None
+) -> List[Tuple[str, str, Optional[int]]]:
+    """The models after `model` in the config's fallback chain, or none if it is not part of the chain"""
+    chain = get_fallback_chain(cfg)
+    for index, (chain_provider, chain_model, _) in enumerate(chain):
+        if (chain_provider, chain_model) == (llm_provider, model):
+            # Tiers often share a model, which is only worth trying once
+            seen = {(llm_provider, model)}
+            fallbacks = []
+            for fallback in chain[index + 1:]:
+                if (fallback[0], fallback[1]) not in seen:
+                    seen.add((fallback[0], fallback[1]))
+                    fallbacks.append(fallback)
+            return fallbacks
+    return []
+
+
+def get_latency_tracker(llm_provider: Optional[str], model: Optional[str]) -> LatencyTracker:
+    key = (llm_provider or "", model or "")
+    with _latencies_lock:
+        if key not in _latencies:
+            _latencies[key] = LatencyTracker()
+        return _latencies[key]
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    The first caller of `do` for a key starts the call; callers arriving while it is
+    still running wait for the same result or exception instead of repeating it. The
+    call runs as its own task, so a caller that is cancelled does not cancel it for the
+    others; it is only cancelled once every caller has given up. Nothing is cached once
+    the call has finished.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Tuple[int, Hashable], _Flight] = {}
+        self._lock = threading.Lock()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run `fn()` unless an identical call is already in flight on this event loop.
+
+        Returns:
+            tuple: The result, and whether it was shared from another caller's call.
+        """
+        loop = asyncio.get_running_loop()
+        # Tasks cannot be awaited from another loop, so calls only coalesce within one
+        flight_key = (id(loop), key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            shared = flight is not None and flight.task.get_loop() is loop and not flight.task.done()
+            if not shared:
+                flight = _Flight(loop.create_task(fn()))
+                self._flights[flight_key] = flight
+                flight.task.add_done_callback(lambda _: self._forget(flight_key, flight))
+            flight.waiters += 1
+
+        try:
+            return await asyncio.shield(flight.task), shared
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+                abandoned = flight.waiters == 0 and not flight.task.done()
+            if abandoned:
+                flight.task.cancel()
+
+    def _forget(self, flight_key: Tuple[int, Hashable], flight: _Flight) -> None:
+        with self._lock:
+            if self._flights.get(flight_key) is flight:
+                del self._flights[flight_key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
@@ -0,0 +1,44 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a visitor came from
+TRACKING_PARAMS = {
+    "gclid", "dclid", "fbclid", "msclkid", "yclid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "igshid", "ref_src", "spm",
+}
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so variants of the same page compare equal.
+
+    The scheme is folded to https and the host is lowercased without a leading "www."
+    or the scheme's default port. Fragments, trailing slashes and tracking parameters (utm_*, gclid,
+    fbclid, ...) are removed, and the remaining query parameters are sorted. The result
+    identifies a page; it is not meant to be fetched.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return url
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS[parts.scheme.lower()]:
+        host = f"{host}:{port}"
+
+    path = parts.path.rstrip("/")
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit(("https", host, path, query, ""))
@@ -22,6 +22,7 @@ async def call_model(
             messages=lc_messages,
             temperature=0,
             llm_provider=cfg.smart_llm_provider,
+            cfg=cfg,
             llm_kwargs=cfg.llm_kwargs,
             # cost_callback=cost_callback,
         )
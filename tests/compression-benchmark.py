@@ -0,0 +1,79 @@
+"""
+Microbenchmark for the CPU side of context compression.
+
+Compares the vectorized SimilarityEngine against a per-document Python loop (the
+way langchain's EmbeddingsFilter scores chunks) on random embeddings.
+
+Usage:
+    python tests/compression-benchmark.py [--dimensions 1536] [--queries 8]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from gpt_researcher.context.compression import SimilarityEngine
+
+CHUNK_COUNTS = [1_000, 10_000, 100_000]
+SIMILARITY_THRESHOLD = 0.42
+TOP_K = 10
+
+
+def per_document_filter(chunk_vectors: list, query_vector: list) -> list:
+    """Reference implementation: score one chunk at a time"""
+    query = np.asarray(query_vector)
+    query_norm = np.linalg.norm(query)
+    scored = []
+    for i, vector in enumerate(chunk_vectors):
+        vector = np.asarray(vector)
+        score = float(vector @ query / (np.linalg.norm(vector) * query_norm))
+        if score > SIMILARITY_THRESHOLD:
+            scored.append((i, score))
+    return sorted(scored, key=lambda item: item[1], reverse=True)[:TOP_K]
+
+
+def bench(chunk_count: int, dimensions: int, query_count: int) -> None:
+    rng = np.random.default_rng(0)
+    chunks = rng.standard_normal((chunk_count, dimensions), dtype=np.float32)
+    queries = rng.standard_normal((query_count, dimensions), dtype=np.float32)
+    # Make a few chunks clear matches so the threshold keeps something
+    chunks[:query_count] = queries + 0.1 * rng.standard_normal((query_count, dimensions), dtype=np.float32)
+
+    start = time.perf_counter()
+    engine = SimilarityEngine()
+    engine.add(chunks)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = engine.search(queries, k=TOP_K, similarity_threshold=SIMILARITY_THRESHOLD)
+    search_time = time.perf_counter() - start
+
+    chunk_lists = chunks.tolist()
+    start = time.perf_counter()
+    reference = [per_document_filter(chunk_lists, query) for query in queries.tolist()]
+    loop_time = time.perf_counter() - start
+
+    assert [[row for row, _ in matches] for matches in vectorized] == \
+        [[row for row, _ in matches] for matches in reference]
+
+    print(
+        f"{chunk_count:>8} chunks | build {build_time * 1000:8.1f} ms | "
+        f"search {search_time * 1000:8.1f} ms ({query_count} queries) | "
+        f"per-document loop {loop_time * 1000:9.1f} ms | "
+        f"speedup {loop_time / search_time:6.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dimensions", type=int, default=1536, help="Embedding dimensions")
+    parser.add_argument("--queries", type=int, default=8, help="Queries scored per batch")
+    args = parser.parse_args()
+
+    print(f"Embedding dimensions: {args.dimensions}, top-k: {TOP_K}, threshold: {SIMILARITY_THRESHOLD}")
+    for chunk_count in CHUNK_COUNTS:
+        bench(chunk_count, args.dimensions, args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark for HTML extraction of scraped pages in thread vs process mode.
+
+Parses a corpus of HTML documents concurrently, the way a batch of pages landing at
+once is parsed during research. By default a synthetic corpus of article-like pages is
+generated; pass --corpus to use a directory of saved .html files instead.
+
+Usage:
+    python tests/extraction-benchmark.py [--pages 60] [--workers 8] [--corpus path/to/html]
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from pathlib import Path
+
+from gpt_researcher.scraper.extraction import HTMLExtractor
+
+
+def synthetic_page(index: int, rng: random.Random) -> bytes:
+    words = ["research", "latency", "embedding", "scraper", "context", "report", "query", "source"]
+    paragraphs = "\n".join(
+        f"<p class='body'>{' '.join(rng.choice(words) for _ in range(120))}</p>"
+        for _ in range(400)
+    )
+    images = "\n".join(
+        f"<img src='/img/{index}-{i}.jpg' width='{rng.randint(200, 2400)}' height='{rng.randint(200, 1400)}'>"
+        for i in range(30)
+    )
+    return (
+        f"<html><head><title>Page {index}</title><style>p {{ margin: 0 }}</style></head><body>"
+        f"<nav><a href='/'>Home</a></nav><header>Header</header><div class='menu'>menu</div>"
+        f"<article>{paragraphs}{images}</article><footer>Footer</footer>"
+        f"<script>var x = 1;</script></body></html>"
+    ).encode("utf-8")
+
+
+def load_corpus(args) -> list[bytes]:
+    if args.corpus:
+        return [path.read_bytes() for path in sorted(Path(args.corpus).glob("*.html"))]
+    rng = random.Random(0)
+    return [synthetic_page(i, rng) for i in range(args.pages)]
+
+
+async def bench(mode: str, corpus: list[bytes], workers: int) -> float:
+    extractor = HTMLExtractor(mode=mode, max_workers=workers, max_bytes=0)
+    # Warm the pool so process start-up is not measured
+    await extractor.extract(corpus[0], "https://example.com/warmup")
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(extractor.extract(html, f"https://example.com/{i}") for i, html in enumerate(corpus))
+    )
+    elapsed = time.perf_counter() - start
+    extractor.shutdown()
+
+    assert all(content for content, _, _ in results)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=60, help="Number of synthetic pages")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Extraction workers")
+    parser.add_argument("--corpus", help="Directory of .html files to use instead of synthetic pages")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args)
+    total_mb = sum(len(html) for html in corpus) / 1_000_000
+    print(f"{len(corpus)} pages, {total_mb:.1f} MB of HTML, {args.workers} workers")
+
+    timings = {mode: asyncio.run(bench(mode, corpus, args.workers)) for mode in HTMLExtractor.MODES}
+    for mode, elapsed in timings.items():
+        print(f"{mode:>8} | {elapsed:7.2f} s | {len(corpus) / elapsed:7.1f} pages/s")
+    print(f"process speedup over thread: {timings['thread'] / timings['process']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
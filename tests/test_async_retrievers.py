@@ -0,0 +1,94 @@
+import asyncio
+import json
+
+import pytest
+import requests
+
+from gpt_researcher.retrievers.bing.bing import BingSearch
+from gpt_researcher.retrievers.custom.custom import CustomRetriever
+from gpt_researcher.retrievers.searx.searx import SearxSearch
+from gpt_researcher.retrievers.serper.serper import SerperSearch
+from gpt_researcher.retrievers.tavily.tavily_search import TavilySearch
+
+PAGES = [("https://a.com", "First page"), ("https://b.com", "Second page")]
+
+# Retriever, environment it needs and the JSON its API answers with
+CASES = [
+    (SerperSearch, {"SERPER_API_KEY": "key"},
+     {"organic": [{"title": body, "link": url, "snippet": body} for url, body in PAGES]}),
+    (BingSearch, {"BING_API_KEY": "key"},
+     {"webPages": {"value": [{"name": body, "url": url, "snippet": body} for url, body in PAGES]}}),
+    (SearxSearch, {"SEARX_URL": "https://searx.example.com"},
+     {"results": [{"url": url, "content": body} for url, body in PAGES]}),
+    (TavilySearch, {"TAVILY_API_KEY": "key"},
+     {"results": [{"url": url, "content": body, "title": body} for url, body in PAGES]}),
+    (CustomRetriever, {"RETRIEVER_ENDPOINT": "https://search.example.com"},
+     [{"url": url, "raw_content": body} for url, body in PAGES]),
+]
+
+
+class FakeResponse:
+    status = status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.text = json.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+    def json(self, **kwargs):
+        return self.payload
+
+
+class FakeAsyncResponse:
+    status = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def text(self):
+        return json.dumps(self.payload)
+
+    async def json(self, **kwargs):
+        return self.payload
+
+
+class FakeHTTPClient:
+    """Stands in for AsyncHTTPClient, answering every request with the same payload"""
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def get_session(self):
+        return self
+
+    def get(self, url, **kwargs):
+        return FakeAsyncResponse(self.payload)
+
+    post = get
+
+
+@pytest.mark.parametrize("retriever_class, env, payload", CASES, ids=[case[0].__name__ for case in CASES])
+def test_asearch_returns_the_same_results_as_search(monkeypatch, retriever_class, env, payload):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    for method in ("get", "post", "request"):
+        monkeypatch.setattr(requests, method, lambda *args, **kwargs: FakeResponse(payload))
+
+    sync_results = retriever_class("transit plan").search(max_results=5)
+    async_results = asyncio.run(
+        retriever_class("transit plan").asearch(max_results=5, http_client=FakeHTTPClient(payload))
+    )
+
+    assert sync_results
+    assert async_results == sync_results
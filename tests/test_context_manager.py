@@ -0,0 +1,50 @@
+import asyncio
+from types import SimpleNamespace
+
+from gpt_researcher.context import compression
+from gpt_researcher.context.compression import ContextCompressor
+from gpt_researcher.skills import context_manager
+from gpt_researcher.skills.context_manager import ContextManager
+
+
+class FakeEmbeddings:
+    async def aembed_query(self, text):
+        return [1.0, 0.0]
+
+    async def aembed_documents(self, texts):
+        return [[1.0, 0.0] for _ in texts]
+
+
+def make_context_manager():
+    researcher = SimpleNamespace(
+        memory=SimpleNamespace(get_embeddings=FakeEmbeddings),
+        cfg=SimpleNamespace(dedupe_similarity_threshold=None),
+    )
+    return ContextManager(researcher)
+
+
+def test_streamed_pages_are_charged_once(monkeypatch):
+    # One cost unit per embedded chunk
+    for module in (context_manager, compression):
+        monkeypatch.setattr(module, "estimate_embedding_cost", lambda model, docs: len(docs))
+    manager = make_context_manager()
+    pages = [
+        {"url": f"https://example.com/{i}", "raw_content": f"Page {i} about transit.", "image_urls": [], "title": ""}
+        for i in range(3)
+    ]
+    costs = []
+
+    async def scraped():
+        for page in pages:
+            yield page
+
+    async def run():
+        collected = await manager.index_pages_as_scraped(scraped(), cost_callback=costs.append)
+        compressor = ContextCompressor(collected, FakeEmbeddings(), chunk_index=manager.chunk_index)
+        await compressor.async_get_context("transit", cost_callback=costs.append)
+        return collected
+
+    collected = asyncio.run(run())
+
+    assert collected == pages
+    assert sum(costs) == len(manager.chunk_index) == 3
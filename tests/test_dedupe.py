@@ -0,0 +1,86 @@
+import asyncio
+
+from gpt_researcher.context.chunk_index import ChunkIndex
+from gpt_researcher.context.compression import ContextCompressor
+from gpt_researcher.context.dedupe import MinHasher, PageDeduplicator, lsh_bands
+
+ARTICLE = (
+    "The city council approved the new transit plan on Tuesday after months of debate. "
+    "The plan adds three bus rapid transit lines, extends light rail service to the airport "
+    "and funds protected bike lanes on the main avenues. Officials expect construction to "
+    "begin next spring and finish within four years, paid for by a mix of federal grants "
+    "and a voter-approved sales tax increase."
+)
+
+
+def page(url, content):
+    return {"url": url, "raw_content": content, "image_urls": [], "title": ""}
+
+
+def test_similarity_estimates_jaccard():
+    hasher = MinHasher()
+    same = hasher.similarity(hasher.signature(ARTICLE), hasher.signature(ARTICLE))
+    different = hasher.similarity(
+        hasher.signature(ARTICLE), hasher.signature("A recipe for sourdough bread with a long cold ferment.")
+    )
+
+    assert same == 1.0
+    assert different < 0.1
+
+
+def test_lsh_bands_cover_the_signature():
+    bands, rows = lsh_bands(128, 0.8)
+
+    assert bands * rows == 128
+    assert abs((1 / bands) ** (1 / rows) - 0.8) < 0.1
+
+
+def test_syndicated_copy_is_merged_into_the_first_page():
+    deduplicator = PageDeduplicator(threshold=0.8)
+    original = page("https://news.example.com/transit", ARTICLE)
+    copy = page("https://mirror.example.org/story", ARTICLE + " Reprinted with permission.")
+    unrelated = page("https://food.example.com/bread", "A recipe for sourdough bread with a long cold ferment.")
+
+    kept = deduplicator.deduplicate([original, copy, unrelated])
+
+    assert kept == [original, unrelated]
+    assert original["duplicate_urls"] == ["https://mirror.example.org/story"]
+    assert deduplicator.merged == 1
+
+
+def test_same_page_is_not_merged_with_itself():
+    deduplicator = PageDeduplicator()
+    original = page("https://news.example.com/transit", ARTICLE)
+
+    assert deduplicator.add(original) is original
+    assert deduplicator.add(page("http://www.news.example.com/transit/", ARTICLE)) is original
+    assert "duplicate_urls" not in original
+
+
+class FakeEmbeddings:
+    async def aembed_query(self, text):
+        return [1.0, 0.0]
+
+    async def aembed_documents(self, texts):
+        return [[1.0, 0.0] for _ in texts]
+
+
+def test_merged_urls_reach_the_research_context():
+    deduplicator = PageDeduplicator()
+    chunk_index = ChunkIndex(FakeEmbeddings())
+    original = page("https://news.example.com/transit", ARTICLE)
+    copy = page("https://mirror.example.org/story", ARTICLE + " Reprinted with permission.")
+
+    async def context_for(pages):
+        compressor = ContextCompressor(deduplicator.deduplicate(pages), FakeEmbeddings(), chunk_index=chunk_index)
+        return await compressor.async_get_context("transit plan")
+
+    async def run():
+        # The original is indexed by one sub-query before another one finds the copy
+        await context_for([original])
+        return await context_for([copy, original])
+
+    context = asyncio.run(run())
+
+    assert "Source: https://news.example.com/transit" in context
+    assert "Also published at: https://mirror.example.org/story" in context
@@ -0,0 +1,19 @@
+import time
+
+from gpt_researcher.utils.disk_cache import DiskCache
+
+
+def test_reads_only_write_once_the_access_time_is_stale(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("key", {"answer": 42})
+    writes = cache._db.total_changes
+
+    for _ in range(3):
+        assert cache.get("key")[0] == {"answer": 42}
+    assert cache._db.total_changes == writes
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + cache.access_resolution)
+    cache.get("key")
+    assert cache._db.total_changes == writes + 1
+    assert cache._db.execute("SELECT accessed_at FROM cache").fetchone()[0] == now + cache.access_resolution
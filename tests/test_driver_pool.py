@@ -0,0 +1,80 @@
+from gpt_researcher.scraper.browser.browser import BrowserScraper
+from gpt_researcher.scraper.browser.driver_pool import WebDriverPool
+
+
+class FakeDriver:
+    window_handles = ["main"]
+
+    def __init__(self):
+        self.quit_called = False
+        self.switch_to = self
+
+    def window(self, handle):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_outlives_sessions_until_the_last_one_ends(monkeypatch):
+    driver = FakeDriver()
+    pool = WebDriverPool(lambda: driver, max_drivers=1)
+    pool.release(pool.acquire())
+    monkeypatch.setattr(BrowserScraper, "_pools", {("chrome", False, "agent"): pool})
+    monkeypatch.setattr(BrowserScraper, "_sessions", 0)
+
+    BrowserScraper.open_session()
+    BrowserScraper.open_session()
+    BrowserScraper.close_session()
+    assert BrowserScraper._pools == {("chrome", False, "agent"): pool}
+    assert not driver.quit_called
+
+    BrowserScraper.close_session()
+    assert BrowserScraper._pools == {}
+    assert driver.quit_called
+
+
+def test_session_sets_the_pool_size(monkeypatch):
+    drivers = [FakeDriver(), FakeDriver()]
+    pool = WebDriverPool(iter(drivers).__next__, max_drivers=2)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    monkeypatch.setattr(BrowserScraper, "_pools", {("chrome", False, "agent"): pool})
+    monkeypatch.setattr(BrowserScraper, "_sessions", 0)
+    monkeypatch.setattr(BrowserScraper, "max_drivers", 3)
+
+    BrowserScraper.open_session(max_drivers=1)
+    # The idle driver over the new limit is quit; the busy one fits within it
+    assert drivers[0].quit_called and not drivers[1].quit_called
+    pool.release(second)
+    assert not drivers[1].quit_called
+
+    assert BrowserScraper.max_drivers == pool.max_drivers == 1
+
+
+def test_scrapers_with_other_driver_options_get_their_own_pool(monkeypatch):
+    created = []
+    monkeypatch.setattr(BrowserScraper, "_import_selenium", lambda self: None)
+    monkeypatch.setattr(BrowserScraper, "_pools", {})
+    monkeypatch.setattr(
+        BrowserScraper, "_create_driver", staticmethod(lambda *options: created.append(options) or FakeDriver())
+    )
+    visible, headless = BrowserScraper("https://a.com"), BrowserScraper("https://b.com")
+    headless.headless = True
+
+    for scraper in (visible, headless, BrowserScraper("https://c.com")):
+        pool = scraper._get_pool()
+        pool.release(pool.acquire())
+
+    assert len(BrowserScraper._pools) == 2
+    # Each pool builds its drivers with its own options, not those of the first scraper
+    assert [options[1] for options in created] == [False, True]
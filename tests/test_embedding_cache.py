@@ -0,0 +1,38 @@
+import asyncio
+
+from gpt_researcher.memory.cache import CachedEmbeddings, EmbeddingStore
+
+
+class FakeEmbeddings:
+    def __init__(self, dimensions):
+        self.dimensions = dimensions
+        self.calls = 0
+
+    async def aembed_query(self, text):
+        self.calls += 1
+        return [1.0] * self.dimensions
+
+    async def aembed_documents(self, texts):
+        self.calls += 1
+        return [[1.0] * self.dimensions for _ in texts]
+
+
+def test_embedding_kwargs_are_part_of_the_key():
+    store = EmbeddingStore()
+    small = CachedEmbeddings(FakeEmbeddings(2), "openai", "text-embedding-3-small", store, {"dimensions": 2})
+    large = CachedEmbeddings(FakeEmbeddings(4), "openai", "text-embedding-3-small", store, {"dimensions": 4})
+
+    async def run():
+        return (
+            await small.aembed_query("solar panels"),
+            await large.aembed_query("solar panels"),
+            await small.aembed_documents(["solar panels", "wind"]),
+        )
+
+    small_query, large_query, documents = asyncio.run(run())
+
+    assert len(small_query) == 2
+    assert len(large_query) == 4
+    assert documents == [[1.0, 1.0], [1.0, 1.0]]
+    assert small.stats()["hits"] == 0
+    assert small.embeddings.calls == 2
@@ -0,0 +1,40 @@
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+
+from gpt_researcher.scraper import extraction
+from gpt_researcher.scraper.extraction import HTMLExtractor
+
+HTML = "<html><head><title>Transit plan</title></head><body><p>The council approved the plan.</p></body></html>"
+
+
+def test_pages_are_extracted_in_worker_processes():
+    extractor = HTMLExtractor("process", max_workers=1)
+    try:
+        content, _, title = asyncio.run(extractor.extract(HTML, "https://example.com/plan"))
+    finally:
+        extractor.shutdown()
+
+    assert "The council approved the plan." in content
+    assert title == "Transit plan"
+    assert extractor.mode == "process"
+
+
+def test_broken_process_pool_falls_back_to_threads(monkeypatch):
+    class BrokenPool:
+        def __init__(self, max_workers=None):
+            pass
+
+        def submit(self, fn, *args):
+            raise BrokenProcessPool("worker processes cannot be started")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            pass
+
+    monkeypatch.setattr(extraction, "ProcessPoolExecutor", BrokenPool)
+    extractor = HTMLExtractor("process", max_workers=1)
+
+    content, _, title = asyncio.run(extractor.extract(HTML, "https://example.com/plan"))
+    extractor.shutdown()
+
+    assert "The council approved the plan." in content
+    assert extractor.mode == "thread"
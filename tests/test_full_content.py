@@ -0,0 +1,93 @@
+import asyncio
+from types import SimpleNamespace
+
+from gpt_researcher.config import Config
+from gpt_researcher.retrievers.tavily.tavily_search import TavilySearch
+from gpt_researcher.retrievers.utils import (
+    RETRIEVER_IMAGE_SCORE, normalize_search_result, search_options, search_result_to_page
+)
+from gpt_researcher.skills import browser
+from gpt_researcher.skills.browser import BrowserManager
+from gpt_researcher.skills.researcher import ResearchConductor
+
+ARTICLE = "The council approved the transit plan after months of debate. " * 5
+
+
+def test_tavily_images_reach_the_page():
+    response = {
+        "results": [
+            {"url": "https://a.com", "content": "snippet", "title": "A", "raw_content": ARTICLE,
+             "images": ["https://a.com/chart.png"]},
+            {"url": "https://b.com", "content": "snippet", "title": "B", "raw_content": ARTICLE},
+        ],
+        "images": [{"url": "https://img.com/plan.jpg", "description": "plan"}, "not-a-url"],
+    }
+
+    results = TavilySearch._parse_results(response, include_raw_content=True, include_images=True)
+    pages = [search_result_to_page(normalize_search_result(result, full_content=True)) for result in results]
+
+    assert search_options(TavilySearch) == {"include_raw_content": True, "include_images": True}
+    assert pages[0] == {
+        "url": "https://a.com",
+        "raw_content": ARTICLE,
+        "image_urls": [
+            {"url": "https://a.com/chart.png", "score": RETRIEVER_IMAGE_SCORE},
+            {"url": "https://img.com/plan.jpg", "score": RETRIEVER_IMAGE_SCORE},
+        ],
+        "title": "A",
+    }
+    assert pages[1]["image_urls"] == []
+
+
+class FakeContextManager:
+    async def index_pages_as_scraped(self, pages, deadline=None, cost_callback=None):
+        return [page async for page in pages]
+
+
+def test_full_content_results_skip_scraping(monkeypatch, tmp_path):
+    cfg = Config()
+    cfg.scraper_cache_dir = str(tmp_path)
+    research_images = []
+    researcher = SimpleNamespace(
+        cfg=cfg,
+        http_client=None,
+        verbose=False,
+        websocket=None,
+        vector_store=None,
+        context_manager=FakeContextManager(),
+        add_costs=lambda cost: None,
+        add_research_sources=lambda sources: None,
+        add_research_images=research_images.extend,
+        get_research_images=lambda: research_images,
+    )
+    researcher.scraper_manager = BrowserManager(researcher)
+    conductor = ResearchConductor(researcher)
+    search_results = [
+        {"href": "https://a.com/article", "raw_content": ARTICLE, "title": "A",
+         "images": ["https://a.com/chart.png"]},
+        {"href": "https://b.com/article"},
+    ]
+    scraped_urls = []
+
+    async def search_relevant_sources(query, query_domains=None):
+        return search_results
+
+    async def iter_scrape_urls(urls, cfg, worker_pool, resources=None):
+        scraped_urls.extend(urls)
+        for url in urls:
+            yield {"url": url, "raw_content": ARTICLE, "image_urls": [], "title": "B"}
+
+    monkeypatch.setattr(conductor, "_search_relevant_sources", search_relevant_sources)
+    monkeypatch.setattr(browser, "iter_scrape_urls", iter_scrape_urls)
+
+    async def run():
+        pages = await conductor._scrape_data_by_urls("transit plan")
+        cached = await researcher.scraper_manager.page_cache.get("https://a.com/article")
+        return pages, cached
+
+    pages, cached = asyncio.run(run())
+
+    assert scraped_urls == ["https://b.com/article"]
+    assert [page["url"] for page in pages] == ["https://a.com/article", "https://b.com/article"]
+    assert research_images == ["https://a.com/chart.png"]
+    assert cached["content"] == ARTICLE
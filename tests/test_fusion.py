@@ -0,0 +1,31 @@
+from gpt_researcher.retrievers.utils import reciprocal_rank_fusion
+
+
+def hrefs(results):
+    return [result["href"] for result in results]
+
+
+def test_pages_ranked_by_several_retrievers_come_first():
+    tavily = [{"href": "https://a.com"}, {"href": "https://b.com"}, {"href": "https://c.com"}]
+    bing = [{"href": "https://d.com"}, {"href": "https://c.com"}, {"href": "https://b.com"}]
+
+    fused = reciprocal_rank_fusion([tavily, bing])
+
+    assert hrefs(fused)[:2] == ["https://b.com", "https://c.com"]
+    assert set(hrefs(fused)) == {"https://a.com", "https://b.com", "https://c.com", "https://d.com"}
+
+
+def test_results_are_matched_by_canonical_url():
+    first = [{"href": "https://www.example.com/page/"}, {"href": "https://other.com"}]
+    second = [{"href": "http://example.com/page?utm_source=feed", "raw_content": "full text"}]
+
+    fused = reciprocal_rank_fusion([first, second])
+
+    assert len(fused) == 2
+    assert fused[0]["raw_content"] == "full text"
+
+
+def test_single_retriever_keeps_its_ranking():
+    ranked = [{"href": f"https://example.com/{i}"} for i in range(5)]
+
+    assert reciprocal_rank_fusion([ranked]) == ranked
@@ -0,0 +1,54 @@
+import asyncio
+
+from gpt_researcher.config import Config
+from gpt_researcher.llm_provider import GenericLLMProvider
+from gpt_researcher.utils import llm
+from gpt_researcher.utils.llm_cache import get_llm_cache
+
+
+class CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        self.calls += 1
+        return type("Output", (), {"content": "First paragraph.\nSecond paragraph."})()
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data):
+        self.sent.append(data["output"])
+
+
+def test_identical_requests_are_replayed_from_the_cache(tmp_path, monkeypatch):
+    chat_model = CountingLLM()
+    monkeypatch.setattr(llm, "get_llm", lambda *args, **kwargs: GenericLLMProvider(chat_model))
+    cfg = Config()
+    cfg.llm_cache_dir = str(tmp_path)
+    cache = get_llm_cache(cfg.llm_cache_dir, cfg.llm_cache_ttl, cfg.llm_cache_max_bytes)
+    messages = [{"role": "user", "content": "Which agent fits this task?"}]
+
+    async def complete(**kwargs):
+        return await llm.create_chat_completion(
+            messages, model="gpt-4o-mini", llm_provider="openai", cfg=cfg, **kwargs
+        )
+
+    async def run():
+        first = await complete()
+        websocket = RecordingWebSocket()
+        replayed = await complete(stream=True, websocket=websocket)
+        await complete(temperature=0.9)
+        # Researchers without a cache directory are not served from another researcher's cache
+        await llm.create_chat_completion(messages, model="gpt-4o-mini", llm_provider="openai", cfg=Config())
+        return first, replayed, websocket.sent
+
+    first, replayed, sent = asyncio.run(run())
+
+    assert first == replayed
+    assert sent == ["First paragraph.\n", "Second paragraph."]
+    # A different temperature is a different request
+    assert chat_model.calls == 3
+    assert (cache.hits, cache.misses) == (1, 2)
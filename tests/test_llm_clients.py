@@ -0,0 +1,41 @@
+import asyncio
+
+from gpt_researcher.llm_provider import GenericLLMProvider
+from gpt_researcher.utils import llm
+
+
+def test_providers_are_reused_per_settings_and_event_loop(monkeypatch):
+    built = []
+
+    def from_provider(provider, **kwargs):
+        built.append((provider, kwargs))
+        return GenericLLMProvider(llm=object())
+
+    monkeypatch.setattr(GenericLLMProvider, "from_provider", from_provider)
+
+    async def get_providers():
+        first = llm.get_llm("openai", model="gpt-4o-mini", temperature=0.4)
+        same = llm.get_llm("openai", temperature=0.4, model="gpt-4o-mini")
+        other = llm.get_llm("openai", model="gpt-4o-mini", temperature=0.7)
+        assert first is same
+        assert first is not other
+        return first
+
+    first_loop = asyncio.run(get_providers())
+    second_loop = asyncio.run(get_providers())
+
+    # A new event loop gets its own clients, since async HTTP pools cannot move between loops
+    assert first_loop is not second_loop
+    assert len(built) == 4
+
+
+def test_changed_credentials_build_a_new_provider(monkeypatch):
+    monkeypatch.setattr(
+        GenericLLMProvider, "from_provider", lambda provider, **kwargs: GenericLLMProvider(llm=object())
+    )
+
+    monkeypatch.setenv("OPENAI_API_KEY", "first")
+    first = llm.get_llm("openai", model="gpt-4o-mini")
+    monkeypatch.setenv("OPENAI_API_KEY", "second")
+
+    assert llm.get_llm("openai", model="gpt-4o-mini") is not first
@@ -0,0 +1,97 @@
+import sys
+import types
+
+import pytest
+
+from gpt_researcher.scraper.browser.nodriver_scraper import NoDriverScraper
+
+
+class FakeTab:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, command):
+        self.sent.append(command)
+
+    async def get(self, url):
+        return self
+
+    async def sleep(self, seconds):
+        pass
+
+    async def wait(self):
+        pass
+
+    async def wait_for_ready_state(self, until, timeout):
+        pass
+
+    async def evaluate(self, script):
+        return 5000
+
+    async def get_content(self):
+        return "<html><body>page</body></html>"
+
+
+class FakeDriver:
+    def __init__(self, tab):
+        self.tab = tab
+
+    async def get(self, url, new_tab=False, new_window=False):
+        return self.tab
+
+
+class FakeExtractor:
+    async def extract(self, html, url):
+        return "text " * 100, [], "Title"
+
+
+@pytest.fixture
+def fake_zendriver(monkeypatch):
+    network = types.SimpleNamespace(
+        enable=lambda: ("Network.enable", None),
+        set_blocked_ur_ls=lambda urls: ("Network.setBlockedURLs", urls),
+    )
+    module = types.ModuleType("zendriver")
+    module.cdp = types.SimpleNamespace(network=network)
+    monkeypatch.setitem(sys.modules, "zendriver", module)
+
+
+@pytest.mark.asyncio
+async def test_pooled_tabs_block_resources(fake_zendriver):
+    tab = FakeTab()
+    browser = NoDriverScraper.Browser(FakeDriver(tab))
+
+    assert await browser.acquire_tab() is tab
+    assert tab.sent == [
+        ("Network.enable", None),
+        ("Network.setBlockedURLs", NoDriverScraper.blocked_url_patterns),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scrape_timings_are_added_to_the_session(fake_zendriver, monkeypatch):
+    browser = NoDriverScraper.Browser(FakeDriver(FakeTab()))
+
+    async def get_browser(headless=False):
+        return browser
+
+    async def release_browser(released):
+        pass
+
+    monkeypatch.setattr(NoDriverScraper, "get_browser", get_browser)
+    monkeypatch.setattr(NoDriverScraper, "release_browser", release_browser)
+    browser_timings = {}
+
+    for _ in range(2):
+        scraper = NoDriverScraper(
+            "https://example.com",
+            extractor=FakeExtractor(),
+            browser_performance_mode=True,
+            browser_timings=browser_timings,
+        )
+        text, _, title = await scraper.scrape_async()
+        assert title == "Title"
+
+    assert set(browser_timings) == {"navigate", "load", "scroll", "content", "extract"}
+    assert all(len(seconds) == 2 for seconds in browser_timings.values())
+    assert set(NoDriverScraper.average_timings(browser_timings)) == set(browser_timings)
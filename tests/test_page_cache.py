@@ -0,0 +1,55 @@
+import asyncio
+
+from aiohttp import web
+
+from gpt_researcher.scraper.cache import PageCache
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils.http_client import AsyncHTTPClient
+from gpt_researcher.utils.workers import WorkerPool
+
+PARAGRAPH = "Solar panels convert sunlight into electricity using photovoltaic cells. " * 5
+
+
+def test_changed_page_is_extracted_from_the_revalidation_response(tmp_path):
+    requests = []
+
+    async def page(request):
+        requests.append(dict(request.headers))
+        return web.Response(
+            text=f"<html><head><title>Solar v2</title></head><body><p>{PARAGRAPH}</p></body></html>",
+            content_type="text/html",
+            headers={"ETag": '"v2"'},
+        )
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/solar", page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        url = f"http://127.0.0.1:{port}/solar"
+
+        page_cache = PageCache(str(tmp_path), ttl=0)
+        await page_cache.put(url, "old content", [], "Solar v1", {"etag": '"v1"'})
+        http_client = AsyncHTTPClient()
+        scraper = Scraper(
+            [url], "test-agent", "bs", WorkerPool(2),
+            resources={"page_cache": page_cache, "http_client": http_client},
+        )
+        try:
+            pages = await scraper.run()
+        finally:
+            await http_client.close()
+            await runner.cleanup()
+        return pages, await page_cache.get(url)
+
+    pages, entry = asyncio.run(run())
+
+    assert pages[0]["title"] == "Solar v2"
+    assert "photovoltaic" in pages[0]["raw_content"]
+    assert entry["etag"] == '"v2"'
+    # The conditional GET was the only request made for the page
+    assert len(requests) == 1
+    assert requests[0]["If-None-Match"] == '"v1"'
@@ -0,0 +1,67 @@
+import pymupdf
+
+from gpt_researcher.scraper.pymupdf.pymupdf import PyMuPDFScraper, extract_pdf_text
+
+
+def make_pdf(pages=3):
+    doc = pymupdf.open()
+    for number in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {number} of the annual transit report.")
+    doc.set_metadata({"title": "Transit report"})
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_page_budget_stops_extraction():
+    content, title = extract_pdf_text(make_pdf(), max_pages=2)
+
+    assert "Page 0" in content and "Page 1" in content
+    assert "Page 2" not in content
+    assert title == "Transit report"
+
+
+def test_character_budget_truncates_the_text():
+    content, _ = extract_pdf_text(make_pdf(), max_pages=None, max_chars=10)
+
+    assert content == "Page 0 of "
+
+
+def test_scraper_applies_the_configured_budgets(tmp_path):
+    path = tmp_path / "report.pdf"
+    path.write_bytes(make_pdf())
+
+    content, images, title = PyMuPDFScraper(str(path), pdf_limits={"max_pages": 1}).scrape()
+
+    assert "Page 0" in content and "Page 1" not in content
+    assert images == []
+    assert title == "Transit report"
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.data), chunk_size):
+            yield self.data[start:start + chunk_size]
+
+
+class FakeSession:
+    def __init__(self, data):
+        self.data = data
+
+    def get(self, url, timeout=None, stream=False):
+        return FakeResponse(self.data)
+
+
+def test_downloads_over_the_byte_budget_are_dropped():
+    data = make_pdf()
+    scraper = PyMuPDFScraper(
+        "https://example.com/report.pdf", FakeSession(data), pdf_limits={"max_bytes": len(data) // 2}
+    )
+
+    assert scraper.scrape() == ("", [], "")
@@ -0,0 +1,70 @@
+import xml.etree.ElementTree as ET
+
+import requests
+
+from gpt_researcher.retrievers.pubmed_central.pubmed_central import PubMedCentralSearch
+
+
+def article(pmc_id, title, body=True):
+    body_xml = f"<body><p>{title} body text.</p></body>" if body else ""
+    return (
+        f"<article><front><article-meta>"
+        f'<article-id pub-id-type="pmc">PMC{pmc_id}</article-id>'
+        f"<title-group><article-title>{title}</article-title></title-group>"
+        f"<abstract><p>{title} abstract.</p></abstract>"
+        f"</article-meta></front>{body_xml}</article>"
+    )
+
+
+EFETCH_XML = (
+    "<pmc-articleset>"
+    + article("1", "Second ranked")
+    + article("2", "First ranked")
+    + article("3", "No body", body=False)
+    + "</pmc-articleset>"
+).encode("utf-8")
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, json_data=None, content=b""):
+        self.json_data = json_data
+        self.content = content
+
+    def json(self):
+        return self.json_data
+
+
+def test_articles_come_from_one_batched_efetch(monkeypatch):
+    monkeypatch.setenv("NCBI_API_KEY", "key")
+    requests_made = []
+    parsed = []
+    iterparse = ET.iterparse
+
+    def get(url, params=None, **kwargs):
+        requests_made.append((url, params))
+        if url == PubMedCentralSearch.ESEARCH_URL:
+            return FakeResponse({"esearchresult": {"idlist": ["2", "1", "3"]}})
+        return FakeResponse(content=EFETCH_XML)
+
+    def spy_iterparse(source, events=None):
+        parsed.append(source)
+        return iterparse(source, events=events)
+
+    monkeypatch.setattr(requests, "get", get)
+    monkeypatch.setattr(ET, "iterparse", spy_iterparse)
+
+    results = PubMedCentralSearch("transit").search(max_results=3)
+
+    assert [url for url, _ in requests_made] == [
+        PubMedCentralSearch.ESEARCH_URL, PubMedCentralSearch.EFETCH_URL,
+    ]
+    assert requests_made[1][1]["id"] == "2,1,3"
+    assert len(parsed) == 1
+    # ESearch relevance order, without the article that has no body
+    assert [result["href"] for result in results] == [
+        "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC2/",
+        "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC1/",
+    ]
+    assert results[0]["body"].startswith("First ranked\n\nFirst ranked abstract.")
@@ -0,0 +1,118 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from gpt_researcher.retrievers.tavily.tavily_search import TavilySearch
+from gpt_researcher.retrievers.utils import run_search
+from gpt_researcher.utils.rate_limiter import (
+    CircuitOpenError,
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    is_transient_error,
+    retry_after,
+)
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_token_bucket_queues_reservations_beyond_the_budget():
+    bucket = TokenBucket(per_minute=60)
+
+    assert bucket.reserve(60) == 0.0
+    first = bucket.reserve()
+    second = bucket.reserve()
+
+    assert first == pytest.approx(1.0, abs=0.05)
+    assert second == pytest.approx(2.0, abs=0.05)
+
+
+def test_transient_errors_and_retry_after():
+    assert is_transient_error(HTTPError(429))
+    assert is_transient_error(HTTPError(503))
+    assert is_transient_error(asyncio.TimeoutError())
+    assert not is_transient_error(HTTPError(401))
+    assert not is_transient_error(ValueError("bad request"))
+    assert retry_after(HTTPError(429, {"retry-after": "7"})) == 7.0
+    assert retry_after(HTTPError(429)) is None
+
+
+def test_circuit_opens_after_consecutive_failures_and_recovers():
+    limiter = RateLimiter("flaky", failure_threshold=2, cooldown=60)
+
+    async def call(exc=None):
+        async with limiter.limit():
+            if exc is not None:
+                raise exc
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                await call(HTTPError(500))
+        with pytest.raises(CircuitOpenError):
+            await call()
+
+        # Once the cool-down is over the next success closes the circuit
+        limiter.breaker._open_until = 0.0
+        await call()
+        assert limiter.breaker.failures == 0
+
+    asyncio.run(run())
+
+
+def test_rate_limit_errors_throttle_instead_of_opening_the_circuit():
+    limiter = RateLimiter("busy", failure_threshold=1)
+
+    limiter.record(HTTPError(429, {"retry-after": "5"}))
+
+    assert not limiter.breaker.is_open
+    assert limiter._paused_until > 0
+
+
+def test_limiters_are_shared_per_configuration():
+    limiter = get_rate_limiter("example", {"Example": {"rpm": 120}})
+
+    assert get_rate_limiter("EXAMPLE", {"example": {"rpm": 120}}) is limiter
+    assert limiter.rpm == 120
+
+    # A researcher with other limits does not change the first researcher's limiter
+    other = get_rate_limiter("example", {"example": {"rpm": 60, "tpm": 1000}}, failure_threshold=3)
+    assert other is not limiter
+    assert (limiter.rpm, limiter.tpm, limiter.breaker.failure_threshold) == (120, None, 5)
+    assert (other.rpm, other.tpm, other.breaker.failure_threshold) == (60, 1000, 3)
+
+
+def test_retriever_rate_limit_reaches_the_limiter():
+    async def search(request):
+        return web.json_response({"detail": "rate limited"}, status=429, headers={"Retry-After": "30"})
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/search", search)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        retriever = TavilySearch("solar panels", headers={"tavily_api_key": "test-key"})
+        retriever.base_url = f"http://127.0.0.1:{port}/search"
+        limiter = RateLimiter("tavily")
+        try:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await run_search(retriever, max_results=5, rate_limiter=limiter)
+        finally:
+            await runner.cleanup()
+        return limiter
+
+    limiter = asyncio.run(run())
+
+    assert limiter._paused_until > 0
+    assert not limiter.breaker.failures
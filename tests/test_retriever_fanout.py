@@ -0,0 +1,75 @@
+import asyncio
+from types import SimpleNamespace
+
+from gpt_researcher.config import Config
+from gpt_researcher.skills.browser import BrowserManager
+from gpt_researcher.skills.researcher import ResearchConductor
+
+
+def fake_retriever(name, delay=0.0, pages=2):
+    class Retriever:
+        def __init__(self, query, query_domains=None):
+            self.query = query
+
+        async def asearch(self, max_results=10, http_client=None):
+            await asyncio.sleep(delay)
+            return [{"href": f"https://{name}.com/{i}", "body": "snippet"} for i in range(pages)]
+
+    Retriever.__name__ = name
+    return Retriever
+
+
+def test_timed_out_retriever_does_not_hold_back_the_others():
+    cfg = Config()
+    cfg.retriever_timeout = 0.05
+    researcher = SimpleNamespace(
+        cfg=cfg,
+        http_client=None,
+        search_cache=None,
+        verbose=False,
+        visited_urls=set(),
+        retrievers=[fake_retriever("slow", delay=5), fake_retriever("first"), fake_retriever("second")],
+        scraper_manager=SimpleNamespace(claimed_urls=lambda urls: []),
+    )
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await ResearchConductor(researcher)._search_relevant_sources("transit plan")
+        return results, loop.time() - start
+
+    results, elapsed = asyncio.run(run())
+
+    assert elapsed < 1
+    # Equal fused scores keep the configured retriever order
+    assert [result["href"] for result in results] == [
+        "https://first.com/0", "https://second.com/0", "https://first.com/1", "https://second.com/1",
+    ]
+
+
+def test_only_pages_still_being_scraped_are_selected_again():
+    async def run():
+        loop = asyncio.get_running_loop()
+        scraping, scraped = loop.create_future(), loop.create_future()
+        scraped.set_result({"url": "https://first.com/1"})
+        scraper_manager = BrowserManager.__new__(BrowserManager)
+        scraper_manager._scrapes = {"https://first.com/0": scraping, "https://first.com/1": scraped}
+        cfg = Config()
+        cfg.max_fused_results_per_query = 2
+        researcher = SimpleNamespace(
+            cfg=cfg,
+            http_client=None,
+            search_cache=None,
+            verbose=False,
+            visited_urls={"https://first.com/0", "https://first.com/1"},
+            retrievers=[fake_retriever("first", pages=4)],
+            scraper_manager=scraper_manager,
+        )
+        return await ResearchConductor(researcher)._search_relevant_sources("transit plan")
+
+    results = asyncio.run(run())
+
+    # The page in flight is awaited on top of two new pages; the scraped one is not selected again
+    assert [result["href"] for result in results] == [
+        "https://first.com/0", "https://first.com/2", "https://first.com/3",
+    ]
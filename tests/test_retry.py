@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+
+from gpt_researcher.actions.query_processing import generate_sub_queries
+from gpt_researcher.config import Config
+from gpt_researcher.llm_provider import GenericLLMProvider
+from gpt_researcher.utils import llm
+from gpt_researcher.utils.retry import LatencyTracker, RetryPolicy
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FlakyCall:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_transient_errors_are_retried_and_others_are_not():
+    policy = RetryPolicy(max_retries=3, base_delay=0.001)
+
+    flaky = FlakyCall(HTTPError(503), HTTPError(429), "ok")
+    assert asyncio.run(policy.call(flaky)) == "ok"
+    assert flaky.calls == 3
+
+    unauthorized = FlakyCall(HTTPError(401), "ok")
+    with pytest.raises(HTTPError):
+        asyncio.run(policy.call(unauthorized))
+    assert unauthorized.calls == 1
+
+
+def test_deadline_stops_retries():
+    policy = RetryPolicy(max_retries=10, base_delay=0.05)
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(asyncio.TimeoutError):
+            await policy.call(hang, deadline_at=loop.time() + 0.1)
+        return loop.time() - started
+
+    assert asyncio.run(run()) < 0.5
+
+
+def test_slow_request_is_hedged():
+    policy = RetryPolicy(hedge_percentile=50)
+    latencies = LatencyTracker()
+    for _ in range(20):
+        latencies.record(0.01)
+    delays = [1.0, 0.0]
+
+    async def request():
+        await asyncio.sleep(delays.pop(0))
+        return "fast enough"
+
+    async def run():
+        return await asyncio.wait_for(policy.call(request, hedge_after=policy.hedge_delay(latencies)), 0.5)
+
+    assert policy.hedge_delay(latencies) == 0.01
+    assert asyncio.run(run()) == "fast enough"
+
+
+def fallback_config():
+    cfg = Config()
+    cfg.llm_fallback_chain = ["strategic", "smart", "fast"]
+    cfg.strategic_llm_provider, cfg.strategic_llm_model = "openai", "o4-mini"
+    cfg.smart_llm_provider, cfg.smart_llm_model = "openai", "gpt-4.1"
+    cfg.fast_llm_provider, cfg.fast_llm_model = "openai", "gpt-4o-mini"
+    return cfg
+
+
+class Model:
+    def __init__(self, name, requested, error=None, answer=None):
+        self.name = name
+        self.requested = requested
+        self.error = error
+        self.answer = answer or f"answer from {name}"
+
+    async def ainvoke(self, messages, **kwargs):
+        self.requested.append(self.name)
+        if self.error:
+            raise self.error
+        return type("Output", (), {"content": self.answer})()
+
+
+def use_models(monkeypatch, models, settings=None):
+    def get_llm(provider, **kwargs):
+        if settings is not None:
+            settings.append((kwargs["model"], kwargs["max_tokens"], kwargs["temperature"]))
+        return GenericLLMProvider(models[kwargs["model"]], verbose=False)
+
+    monkeypatch.setattr(llm, "get_llm", get_llm)
+
+
+def ask(cfg, **kwargs):
+    return asyncio.run(llm.create_chat_completion(
+        [{"role": "user", "content": "Plan sub-queries"}], model="o4-mini", llm_provider="openai", cfg=cfg, **kwargs
+    ))
+
+
+def test_failing_model_falls_back_along_the_chain(monkeypatch):
+    requested = []
+    use_models(monkeypatch, {
+        "o4-mini": Model("o4-mini", requested, HTTPError(503)), "gpt-4.1": Model("gpt-4.1", requested),
+    })
+    cfg = fallback_config()
+    cfg.llm_max_retries = 0
+
+    assert ask(cfg, fallback=True) == "answer from gpt-4.1"
+    assert requested == ["o4-mini", "gpt-4.1"]
+
+
+@pytest.mark.parametrize("error, fallback", [(HTTPError(503), False), (HTTPError(401), True), (ValueError(), True)])
+def test_only_opted_in_calls_fall_back_and_only_on_transient_errors(monkeypatch, error, fallback):
+    requested = []
+    use_models(monkeypatch, {"o4-mini": Model("o4-mini", requested, error), "gpt-4.1": Model("gpt-4.1", requested)})
+    cfg = fallback_config()
+    cfg.llm_max_retries = 0
+
+    with pytest.raises(type(error)):
+        ask(cfg, fallback=fallback)
+    assert requested == ["o4-mini"]
+
+
+def test_sub_queries_retry_with_the_token_limit_then_use_the_smart_model(monkeypatch):
+    requested, settings = [], []
+    use_models(monkeypatch, {
+        "gpt-4o": Model("gpt-4o", requested, ValueError("max_tokens is required")),
+        "gpt-4.1": Model("gpt-4.1", requested, answer='["transit funding", "transit ridership"]'),
+    }, settings)
+    cfg = fallback_config()
+    cfg.strategic_llm_model = "gpt-4o"
+
+    sub_queries = asyncio.run(generate_sub_queries("transit", "", "research_report", [], cfg))
+
+    assert sub_queries == ["transit funding", "transit ridership"]
+    # See https://github.com/assafelovic/gpt-researcher/issues/1022
+    assert settings == [
+        ("gpt-4o", None, 0.4),
+        ("gpt-4o", cfg.strategic_token_limit, 0.4),
+        ("gpt-4.1", cfg.smart_token_limit, cfg.temperature),
+    ]
+
+
+def test_partly_streamed_response_is_not_retried_or_replaced(monkeypatch):
+    requested = []
+
+    class Model:
+        def __init__(self, name):
+            self.name = name
+
+        async def astream(self, messages, **kwargs):
+            requested.append(self.name)
+            yield type("Chunk", (), {"content": "First paragraph.\n"})()
+            raise HTTPError(503)
+
+    class WebSocket:
+        sent = []
+
+        async def send_json(self, data):
+            self.sent.append(data["output"])
+
+    monkeypatch.setattr(
+        llm, "get_llm", lambda provider, **kwargs: GenericLLMProvider(Model(kwargs["model"]), verbose=False)
+    )
+    websocket = WebSocket()
+    with pytest.raises(HTTPError):
+        asyncio.run(llm.create_chat_completion(
+            [{"role": "user", "content": "Write the report"}], model="o4-mini", llm_provider="openai",
+            stream=True, websocket=websocket, cfg=fallback_config(),
+        ))
+
+    # The 503 is transient, but the client already got the first paragraph
+    assert requested == ["o4-mini"]
+    assert websocket.sent == ["First paragraph.\n"]
@@ -0,0 +1,133 @@
+import asyncio
+from types import SimpleNamespace
+
+from gpt_researcher.actions.query_processing import get_search_results
+from gpt_researcher.config import Config
+from gpt_researcher.retrievers.cache import SearchCache, retriever_settings
+from gpt_researcher.retrievers.tavily.tavily_search import TavilySearch
+from gpt_researcher.skills.researcher import ResearchConductor
+
+
+class CountingSearch:
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+
+    def __call__(self, max_results=10, **options):
+        self.calls += 1
+        return self.results[:max_results]
+
+
+def test_repeated_search_is_served_from_cache():
+    cache = SearchCache()
+    search = CountingSearch([{"href": "https://example.com", "body": "snippet"}])
+
+    first = cache.search("tavily", search, "Solar  Panels", ["b.com", "a.com"], 5)
+    second = cache.search("tavily", search, "solar panels", ["a.com", "b.com"], 5)
+
+    assert first == second
+    assert search.calls == 1
+    assert cache.stats()["retrievers"]["tavily"] == {"hits": 1, "misses": 1}
+
+
+def test_options_and_retrievers_are_cached_separately():
+    cache = SearchCache()
+    search = CountingSearch([{"href": "https://example.com"}])
+
+    cache.search("tavily", search, "query", None, 5)
+    cache.search("tavily", search, "query", None, 10)
+    cache.search("bing", search, "query", None, 5)
+    cache.search("tavily", search, "query", None, 5, include_raw_content=True)
+
+    assert search.calls == 4
+
+
+def test_smaller_searches_are_served_from_larger_ones():
+    cache = SearchCache()
+    search = CountingSearch([{"href": f"https://example.com/{i}"} for i in range(20)])
+
+    default = cache.search("tavily", search, "query")
+    first_five = cache.search("tavily", search, "query", None, 5)
+    fifteen = cache.search("tavily", search, "query", None, 15)
+
+    assert first_five == default[:5]
+    assert len(fifteen) == 15
+    # The retriever's default of 10 results does not answer a search for 15
+    assert search.calls == 2
+
+
+def test_retriever_credentials_and_topic_are_part_of_the_key():
+    cache = SearchCache()
+    search = CountingSearch([{"href": "https://example.com"}])
+    retrievers = [
+        TavilySearch("query", headers={"tavily_api_key": "key-a"}),
+        TavilySearch("query", headers={"tavily_api_key": "key-b"}),
+        TavilySearch("query", headers={"tavily_api_key": "key-a"}, topic="news"),
+        TavilySearch("query", headers={"tavily_api_key": "key-a"}),
+    ]
+
+    for retriever in retrievers:
+        cache.search("tavily", search, "query", None, 5, retriever_settings(retriever))
+
+    assert search.calls == 3
+    assert cache.stats()["hits"] == 1
+
+
+def test_per_retriever_ttl_and_empty_results():
+    cache = SearchCache(ttl=3600, ttls={"news": 0})
+    news = CountingSearch([{"href": "https://example.com"}])
+    empty = CountingSearch([])
+
+    cache.search("news", news, "query")
+    cache.search("news", news, "query")
+    cache.search("tavily", empty, "query")
+    cache.search("tavily", empty, "query")
+
+    assert news.calls == 2
+    assert empty.calls == 2
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    search = CountingSearch([{"href": "https://example.com"}])
+    SearchCache(cache_dir=str(tmp_path)).search("tavily", search, "query", None, 5)
+
+    results = SearchCache(cache_dir=str(tmp_path)).search("tavily", search, "query", None, 5)
+
+    assert results == [{"href": "https://example.com"}]
+    assert search.calls == 1
+
+
+class FullContentRetriever:
+    returns_full_content = True
+    calls = 0
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    async def asearch(self, max_results=10, include_raw_content=False, http_client=None):
+        FullContentRetriever.calls += 1
+        return [
+            {"href": f"https://example.com/{i}", "body": "snippet", "raw_content": "Full text. " * 20}
+            for i in range(max_results)
+        ]
+
+
+def test_planning_and_sub_query_searches_share_a_cache_entry(monkeypatch):
+    monkeypatch.setattr(FullContentRetriever, "calls", 0)
+    researcher = SimpleNamespace(cfg=Config(), http_client=None, search_cache=SearchCache())
+    conductor = ResearchConductor(researcher)
+
+    async def run():
+        planning = await get_search_results("solar panels", FullContentRetriever, researcher=researcher)
+        sub_query = await conductor._search_with_retriever(FullContentRetriever, "Solar panels", [])
+        return planning, sub_query
+
+    planning, sub_query = asyncio.run(run())
+
+    assert FullContentRetriever.calls == 1
+    assert researcher.search_cache.stats()["retrievers"]["fullcontentretriever"] == {"hits": 1, "misses": 1}
+    # Planning gets the retriever's default number of results and only their snippets
+    assert len(planning) == 10
+    assert len(sub_query) == researcher.cfg.max_search_results_per_query
+    assert all("raw_content" not in result for result in planning)
+    assert all("raw_content" in result for result in sub_query)
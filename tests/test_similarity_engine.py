@@ -0,0 +1,36 @@
+import numpy as np
+
+from gpt_researcher.context.compression import SimilarityEngine
+
+
+def test_search_returns_best_matches_first():
+    engine = SimilarityEngine()
+    engine.add([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+
+    matches = engine.search([1.0, 0.0])[0]
+
+    assert [row for row, _ in matches] == [0, 2, 1]
+    assert np.isclose(matches[0][1], 1.0)
+
+
+def test_search_applies_top_k_and_threshold_per_query():
+    engine = SimilarityEngine(capacity=1)
+    engine.add(np.eye(3))
+    engine.add([[1.0, 1.0, 0.0]])
+
+    results = engine.search([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]], k=1, similarity_threshold=0.5)
+
+    assert [[row for row, _ in matches] for matches in results] == [[0], [2]]
+
+
+def test_search_restricted_to_rows():
+    engine = SimilarityEngine()
+    engine.add([[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]])
+
+    matches = engine.search([1.0, 0.0], rows=np.array([1, 2]))[0]
+
+    assert [row for row, _ in matches] == [1, 2]
+
+
+def test_empty_engine_returns_no_matches():
+    assert SimilarityEngine().search([[1.0, 0.0], [0.0, 1.0]]) == [[], []]
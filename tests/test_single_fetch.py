@@ -0,0 +1,59 @@
+import sys
+import types
+
+from gpt_researcher.scraper.tavily_extract.tavily_extract import TavilyExtract
+from gpt_researcher.scraper.web_base_loader.web_base_loader import WebBaseLoaderScraper
+
+HTML = b"""<html><head><title>Transit plan</title></head><body>
+<p>The council approved the transit plan.</p>
+<img src="/hero.jpg" class="hero">
+</body></html>"""
+
+
+class CountingSession:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return types.SimpleNamespace(content=HTML, status_code=200)
+
+
+def test_web_base_loader_fetches_the_page_once():
+    session = CountingSession()
+
+    content, image_urls, title = WebBaseLoaderScraper("https://example.com/plan", session).scrape()
+
+    assert session.urls == ["https://example.com/plan"]
+    assert "The council approved the transit plan." in content
+    assert image_urls == [{"url": "https://example.com/hero.jpg", "score": 4}]
+    assert title == "Transit plan"
+
+
+def test_tavily_extract_makes_one_extract_call(monkeypatch):
+    calls = []
+
+    class TavilyClient:
+        def __init__(self, api_key):
+            pass
+
+        def extract(self, urls, include_images=False):
+            calls.append((urls, include_images))
+            return {
+                "failed_results": [],
+                "results": [{
+                    "raw_content": "# Transit plan\n\nThe council approved the plan.",
+                    "images": ["https://example.com/hero.jpg"],
+                }],
+            }
+
+    monkeypatch.setitem(sys.modules, "tavily", types.SimpleNamespace(TavilyClient=TavilyClient))
+    monkeypatch.setenv("TAVILY_API_KEY", "key")
+    session = CountingSession()
+
+    content, image_urls, title = TavilyExtract("https://example.com/plan", session).scrape()
+
+    assert calls == [("https://example.com/plan", True)]
+    assert session.urls == []
+    assert image_urls == [{"url": "https://example.com/hero.jpg", "score": 0}]
+    assert title == "Transit plan"
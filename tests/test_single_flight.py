@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from gpt_researcher.llm_provider import GenericLLMProvider
+from gpt_researcher.utils import llm
+from gpt_researcher.utils.single_flight import SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def run():
+        return await asyncio.gather(
+            flight.do("a", lambda: fetch("a")),
+            flight.do("a", lambda: fetch("a")),
+            flight.do("b", lambda: fetch("b")),
+        )
+
+    results = asyncio.run(run())
+
+    assert results == [("A", False), ("A", True), ("B", False)]
+    assert calls == ["a", "b"]
+    assert len(flight) == 0
+
+
+def test_errors_are_shared_and_a_cancelled_caller_does_not_cancel_the_call():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("provider down")
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def run():
+        errors = await asyncio.gather(flight.do("x", fail), flight.do("x", fail), return_exceptions=True)
+        assert all(isinstance(error, ValueError) for error in errors)
+
+        impatient = asyncio.create_task(flight.do("y", slow))
+        patient = asyncio.create_task(flight.do("y", slow))
+        await asyncio.sleep(0)
+        impatient.cancel()
+        assert await patient == ("done", True)
+        with pytest.raises(asyncio.CancelledError):
+            await impatient
+
+    asyncio.run(run())
+
+
+def test_identical_completions_share_one_llm_call(monkeypatch):
+    class SlowLLM:
+        calls = 0
+
+        async def ainvoke(self, messages, **kwargs):
+            SlowLLM.calls += 1
+            await asyncio.sleep(0.01)
+            return type("Output", (), {"content": "researcher agent"})()
+
+    monkeypatch.setattr(llm, "get_llm", lambda *args, **kwargs: GenericLLMProvider(SlowLLM(), verbose=False))
+    monkeypatch.setattr(llm, "estimate_llm_cost", lambda prompt, response: 0.01)
+    messages = [{"role": "user", "content": "Pick an agent for: solar panels"}]
+
+    costs = [[], [], []]
+
+    async def run():
+        return await asyncio.gather(*[
+            llm.create_chat_completion(
+                messages, model="gpt-4o-mini", llm_provider="openai", cost_callback=researcher_costs.append
+            )
+            for researcher_costs in costs
+        ])
+
+    assert asyncio.run(run()) == ["researcher agent"] * 3
+    assert SlowLLM.calls == 1
+    # Every researcher is charged for its answer, not only the one whose call was shared
+    assert costs == [[0.01]] * 3
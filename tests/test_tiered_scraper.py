@@ -0,0 +1,55 @@
+import asyncio
+
+from gpt_researcher.scraper.tiered import tiered
+from gpt_researcher.scraper.tiered.tiered import DomainTierMemory, TieredScraper
+
+ARTICLE = "The council approved the transit plan after months of debate. " * 10
+
+
+def fake_scraper(name, content, calls):
+    class Scraper:
+        def __init__(self, link, session=None, **kwargs):
+            self.link = link
+            self.validators = {}
+
+        async def scrape_async(self):
+            calls.append((name, self.link))
+            return content, [], name
+
+    return Scraper
+
+
+def scrape(url, memory):
+    return asyncio.run(TieredScraper(url, domain_tiers=memory).scrape_async())
+
+
+def test_js_gated_page_escalates_and_the_domain_is_remembered(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(
+        tiered, "BeautifulSoupScraper", fake_scraper("http", "Please enable JavaScript to continue.", calls)
+    )
+    monkeypatch.setattr(tiered, "NoDriverScraper", fake_scraper("browser", ARTICLE, calls))
+    memory = DomainTierMemory(str(tmp_path))
+
+    first = scrape("https://www.app.example.com/a", memory)
+    second = scrape("https://app.example.com/b", memory)
+
+    assert first == second == (ARTICLE, [], "browser")
+    # The second page of the domain goes straight to the browser
+    assert calls == [
+        ("http", "https://www.app.example.com/a"),
+        ("browser", "https://www.app.example.com/a"),
+        ("browser", "https://app.example.com/b"),
+    ]
+    assert DomainTierMemory(str(tmp_path)).needs_browser("https://app.example.com/c")
+
+
+def test_static_page_does_not_start_a_browser(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tiered, "BeautifulSoupScraper", fake_scraper("http", ARTICLE, calls))
+    monkeypatch.setattr(tiered, "NoDriverScraper", fake_scraper("browser", ARTICLE, calls))
+    memory = DomainTierMemory()
+
+    assert scrape("https://news.example.com/a", memory) == (ARTICLE, [], "http")
+    assert calls == [("http", "https://news.example.com/a")]
+    assert not memory.needs_browser("https://news.example.com/b")
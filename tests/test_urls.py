@@ -0,0 +1,40 @@
+from gpt_researcher.utils.urls import canonicalize_url
+
+
+def test_variants_of_a_page_share_a_canonical_url():
+    variants = [
+        "https://example.com/article",
+        "http://example.com/article",
+        "https://www.example.com/article/",
+        "https://EXAMPLE.com:443/article#section-2",
+        "https://example.com/article?utm_source=news&utm_medium=email",
+        "https://example.com/article?fbclid=abc123",
+    ]
+
+    assert {canonicalize_url(url) for url in variants} == {"https://example.com/article"}
+
+
+def test_query_parameters_are_sorted_and_kept():
+    assert (
+        canonicalize_url("https://example.com/search?q=llm&page=2&utm_campaign=x")
+        == canonicalize_url("https://example.com/search?page=2&q=llm")
+        == "https://example.com/search?page=2&q=llm"
+    )
+
+
+def test_distinct_pages_stay_distinct():
+    assert canonicalize_url("https://example.com/a?id=1") != canonicalize_url("https://example.com/a?id=2")
+    assert canonicalize_url("https://example.com/Article") != canonicalize_url("https://example.com/article")
+    assert canonicalize_url("https://example.com:8080/a") != canonicalize_url("https://example.com/a")
+
+
+def test_only_the_default_port_of_the_scheme_is_dropped():
+    assert canonicalize_url("http://example.com:80/a") == "https://example.com/a"
+    assert canonicalize_url("https://example.com:443/a") == "https://example.com/a"
+    assert canonicalize_url("http://example.com:443/a") == "https://example.com:443/a"
+    assert canonicalize_url("https://example.com:80/a") == "https://example.com:80/a"
+
+
+def test_non_web_urls_are_returned_unchanged():
+    assert canonicalize_url("./docs/report.pdf") == "./docs/report.pdf"
+    assert canonicalize_url("mailto:someone@example.com") == "mailto:someone@example.com"